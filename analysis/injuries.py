@@ -4,7 +4,11 @@
 # Description: Detects injuries from match reports, including implied injuries,
 # links them to players, and returns structured injury data.
 
-import nltk
+import json
+from bisect import bisect_right
+
+from nlp.document import as_report
+from utils.aho_corasick import AhoCorasick
 
 # Lexicon of injury triggers, medical terms, and substitution phrases
 INJURY_TRIGGERS = [
@@ -24,37 +28,110 @@ SUBSTITUTION_PHRASES = [
 ]
 
 
-def detect_injuries(text):
+# Score each lexicon adds to a sentence (counted once per sentence)
+CATEGORY_SCORES = {"triggers": 2, "medical": 1, "substitution": 1}
+
+
+class InjuryMatcher:
+    """
+    Compiled injury lexicon: one automaton over every trigger, medical term
+    and substitution phrase, scoring all sentences of a report in one pass.
+    """
+
+    def __init__(self, triggers=INJURY_TRIGGERS, medical=MEDICAL_TERMS,
+                 substitution=SUBSTITUTION_PHRASES):
+        self.lexicons = {
+            "triggers": list(triggers),
+            "medical": list(medical),
+            "substitution": list(substitution),
+        }
+        self.automaton = AhoCorasick()
+        for category, phrases in self.lexicons.items():
+            for phrase in phrases:
+                self.automaton.add(phrase.lower(), category)
+        self.automaton.build()
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Builds the default lexicons extended with the phrases in a JSON file:
+        {"triggers": [...], "medical": [...], "substitution": [...]}
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            extra = json.load(f)
+
+        unknown = set(extra) - set(CATEGORY_SCORES)
+        if unknown:
+            raise ValueError(f"Unknown injury lexicon categories: {sorted(unknown)}")
+
+        return cls(
+            INJURY_TRIGGERS + extra.get("triggers", []),
+            MEDICAL_TERMS + extra.get("medical", []),
+            SUBSTITUTION_PHRASES + extra.get("substitution", []),
+        )
+
+    def score_sentences(self, report):
+        """
+        Returns the injury score of every sentence of a ParsedReport.
+        """
+        spans = report.sentence_spans
+        lowered = report.text.lower()
+
+        # Lowercasing a few characters changes their length; offsets then differ
+        if len(lowered) != len(report.text):
+            return [self._score(self._categories(sent.lower())) for sent in report.sentences]
+
+        starts = [start for start, _ in spans]
+        found = [set() for _ in spans]
+
+        for start, end, category in self.automaton.iter_matches(lowered):
+            i = bisect_right(starts, start) - 1
+            if i >= 0 and end <= spans[i][1]:
+                found[i].add(category)
+
+        return [self._score(categories) for categories in found]
+
+    def _categories(self, text):
+        return {category for _, _, category in self.automaton.iter_matches(text)}
+
+    def _score(self, categories):
+        return sum(CATEGORY_SCORES[c] for c in categories)
+
+
+_default_matcher = None
+
+
+def get_injury_matcher():
+    """Returns the process-wide injury matcher, compiling it on first use."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = InjuryMatcher()
+    return _default_matcher
+
+
+def load_injury_lexicon(path):
+    """
+    Extends the process-wide injury lexicons with the phrases in a JSON file.
+    """
+    global _default_matcher
+    _default_matcher = InjuryMatcher.from_file(path)
+    return _default_matcher
+
+
+def detect_injuries(text, matcher=None):
     """
     Detects implied injury events from match reports.
+    text: raw report text or a ParsedReport
     Returns a list of injury-related sentences.
     """
     if not text:
         return []
 
-    injury_events = []
-    sentences = nltk.sent_tokenize(text)
-
-    for sent in sentences:
-        sent_lower = sent.lower()
-        score = 0
-
-        # Strong signals
-        if any(trigger in sent_lower for trigger in INJURY_TRIGGERS):
-            score += 2
-
-        # Medium signals
-        if any(term in sent_lower for term in MEDICAL_TERMS):
-            score += 1
+    report = as_report(text)
+    scores = (matcher or get_injury_matcher()).score_sentences(report)
 
-        if any(sub in sent_lower for sub in SUBSTITUTION_PHRASES):
-            score += 1
-
-        # Threshold to consider as injury
-        if score >= 2:
-            injury_events.append(sent)
-
-    return injury_events
+    # Threshold to consider as injury: a trigger, or two medium signals
+    return [sent for sent, score in zip(report.sentences, scores) if score >= 2]
 
 
 def attach_players_to_injuries(injury_sentences, entities):
@@ -63,10 +140,18 @@ def attach_players_to_injuries(injury_sentences, entities):
     entities: list of (name, type) tuples
     """
     players = [e[0] for e in entities if e[1] == "PERSON"]
+
+    # Positions of each distinct name, so matches keep the entity order
+    positions = {}
+    for i, p in enumerate(players):
+        positions.setdefault(p, []).append(i)
+    names = AhoCorasick((p, p) for p in positions)
+
     player_injuries = []
 
     for sent in injury_sentences:
-        involved = [p for p in players if p in sent]
+        found = {name for _, _, name in names.iter_matches(sent)}
+        involved = [players[i] for i in sorted(i for name in found for i in positions[name])]
         player_injuries.append({
             "sentence": sent,
             "players": involved if involved else ["Unknown"]
@@ -5,7 +5,7 @@
 # dominant win, narrow win, draw, based on scores and stats.
 
 
-from .stats import get_stat, parse_float
+from analysis.record import MatchRecord
 
 
 def classify_match(entry):
@@ -15,23 +15,21 @@ def classify_match(entry):
     - Narrow win
     - Convincing win
     - Dominant win
+    entry: MatchRecord or scraped match dict; the result is cached on the record.
     """
-    home = entry["home_team"]
-    away = entry["away_team"]
-    score = entry["final_score"]
+    return MatchRecord.of(entry).narrative
 
-    home_goals = int(score["home"])
-    away_goals = int(score["away"])
 
-    xg_home, xg_away = get_stat(entry.get("stats"), "XG")
-    xg_home = parse_float(xg_home)
-    xg_away = parse_float(xg_away)
+def classify_record(record):
+    home_goals = record.home_goals
+    away_goals = record.away_goals
+    xg_home, xg_away = record.xg
 
     # Draw
     if home_goals == away_goals:
         return "Draw"
 
-    winner = home if home_goals > away_goals else away
+    winner = record.home_team if home_goals > away_goals else record.away_team
     margin = abs(home_goals - away_goals)
 
     # Dominance
@@ -4,16 +4,25 @@
 # Description: Detects key players in a match based on goals, assists,
 # and other metrics to highlight player impact.
 
+from analysis.record import MatchRecord
+
 
 def detect_key_players(entry):
     """
     Returns list of key players in a match based on goal contribution.
+    entry: MatchRecord or scraped match dict; the result is cached on the record.
+    """
+    return MatchRecord.of(entry).key_players
+
+
+def rank_key_players(scorers):
+    """
+    Key players from a record's normalized scorer entries.
     """
     scorer_counts = {}
 
-    for goal in entry.get("scorers", []):
-        player = goal["player"]
-        scorer_counts[player] = scorer_counts.get(player, 0) + 1
+    for goal in scorers:
+        scorer_counts[goal.player] = scorer_counts.get(goal.player, 0) + goal.count
 
     key_players = []
 
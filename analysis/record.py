@@ -0,0 +1,146 @@
+# CSCI4152/6509 Fall 2025
+# Program: Match Record
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Compact typed representation of a scraped match, parsed once
+# at load time, with lazily cached derived facts (key players, narrative, xG)
+# shared by the analysis modules and the template builder.
+
+from analysis.stats import parse_float
+
+
+class Goal:
+    """
+    One scorer entry, with the player name exactly as scraped. Each entry
+    counts as one goal, as in detect_key_players.
+    """
+
+    __slots__ = ("team", "player", "minutes")
+
+    def __init__(self, team, player, minutes):
+        self.team = team
+        self.player = player
+        self.minutes = minutes
+
+    @classmethod
+    def from_dict(cls, goal):
+        minutes = (goal["minute"],) if goal.get("minute") else ()
+        return cls(goal.get("team"), goal["player"], minutes)
+
+    @property
+    def count(self):
+        return 1
+
+
+class MatchRecord:
+    """
+    A match parsed once from its scraped dict:
+    - numeric final and half-time scores
+    - normalized scorer entries (Goal)
+    - stats indexed by lowercased name, as (home_raw, away_raw, home, away)
+      with the values parsed by parse_float
+    - key_players, narrative and xg computed on first use and cached
+    """
+
+    __slots__ = (
+        "home_team", "away_team", "home_goals", "away_goals",
+        "ht_home", "ht_away", "scorers", "cards", "stats", "report",
+        "_key_players", "_narrative", "_xg",
+    )
+
+    def __init__(self, home_team, away_team, home_goals, away_goals, ht_home=None, ht_away=None,
+                 scorers=(), cards=(), stats=None, report=None):
+        self.home_team = home_team
+        self.away_team = away_team
+        self.home_goals = home_goals
+        self.away_goals = away_goals
+        self.ht_home = ht_home
+        self.ht_away = ht_away
+        self.scorers = tuple(scorers)
+        self.cards = tuple(cards)
+        self.stats = stats or {}
+        self.report = report
+        self._key_players = None
+        self._narrative = None
+        self._xg = None
+
+    @classmethod
+    def from_dict(cls, entry):
+        score = entry["final_score"]
+        half_time = entry.get("half_time_score") or {}
+
+        stats = {}
+        for section in (entry.get("stats") or {}).values():
+            for row in section:
+                name = row["stat"].lower()
+                # First occurrence wins, as in get_stat
+                if name not in stats:
+                    home, away = row["home"], row["away"]
+                    stats[name] = (home, away, parse_float(home), parse_float(away))
+
+        return cls(
+            entry["home_team"],
+            entry["away_team"],
+            int(score["home"]),
+            int(score["away"]),
+            _int_or_none(half_time.get("home")),
+            _int_or_none(half_time.get("away")),
+            scorers=[Goal.from_dict(g) for g in entry.get("scorers", [])],
+            cards=[(c.get("team"), c.get("event")) for c in entry.get("cards", [])],
+            stats=stats,
+            report=entry.get("report", ""),
+        )
+
+    @classmethod
+    def of(cls, entry):
+        """Accepts a MatchRecord or a scraped match dict."""
+        if isinstance(entry, cls):
+            return entry
+        return cls.from_dict(entry)
+
+    @property
+    def match(self):
+        return f"{self.home_team} vs {self.away_team}"
+
+    def stat(self, name):
+        """Raw (home, away) strings of a stat, or (None, None)."""
+        row = self.stats.get(name.lower())
+        return (row[0], row[1]) if row else (None, None)
+
+    def stat_value(self, name):
+        """Parsed (home, away) floats of a stat, or (None, None)."""
+        row = self.stats.get(name.lower())
+        return (row[2], row[3]) if row else (None, None)
+
+    @property
+    def xg(self):
+        if self._xg is None:
+            self._xg = self.stat_value("XG")
+        return self._xg
+
+    @property
+    def key_players(self):
+        if self._key_players is None:
+            from analysis.players import rank_key_players
+            self._key_players = rank_key_players(self.scorers)
+        return self._key_players
+
+    @property
+    def narrative(self):
+        if self._narrative is None:
+            from analysis.narrative import classify_record
+            self._narrative = classify_record(self)
+        return self._narrative
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+
+def _int_or_none(val):
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return None
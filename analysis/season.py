@@ -0,0 +1,145 @@
+# CSCI4152/6509 Fall 2025
+# Program: Season Stats Store
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Columnar NumPy store of one or more seasons of scraped matches.
+# Every stat becomes a pair of home/away float arrays and team and player
+# names are interned to integer IDs, so season-wide questions (e.g. every
+# dominant win) run as array operations instead of per-entry Python loops.
+
+import argparse
+import json
+from collections import Counter
+
+import numpy as np
+
+from analysis.record import MatchRecord
+
+# Narrative codes of classify_codes, in the order of classify_match's checks
+DRAW, DOMINANT, NARROW, CONVINCING = range(4)
+NARRATIVE_TYPES = ("Draw", "Dominant win", "Narrow win", "Convincing win")
+NARRATIVE_PREFIXES = ("Draw",) + tuple(f"{t} for " for t in NARRATIVE_TYPES[1:])
+
+
+class Interner:
+    """Maps names to dense integer IDs and back."""
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+
+    def id(self, name):
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def __len__(self):
+        return len(self.names)
+
+
+class SeasonStore:
+    """
+    Column arrays, one row per match:
+    - home_team / away_team: team IDs (teams.names[id] is the name)
+    - home_goals / away_goals: final score
+    - stats: {lowercased stat name: (home, away)} float arrays, NaN when the
+      stat is missing or not numeric
+    Goals are a separate table with one row per scorer entry:
+    goal_match (row index), goal_team, goal_player (player IDs), goal_count.
+    """
+
+    def __init__(self, records):
+        records = [MatchRecord.of(r) for r in records]
+        n = len(records)
+        self.teams = Interner()
+        self.players = Interner()
+
+        self.home_team = np.fromiter((self.teams.id(r.home_team) for r in records), np.int32, n)
+        self.away_team = np.fromiter((self.teams.id(r.away_team) for r in records), np.int32, n)
+        self.home_goals = np.fromiter((r.home_goals for r in records), np.int32, n)
+        self.away_goals = np.fromiter((r.away_goals for r in records), np.int32, n)
+
+        names = {name for r in records for name in r.stats}
+        self.stats = {name: (np.full(n, np.nan), np.full(n, np.nan)) for name in sorted(names)}
+        for i, r in enumerate(records):
+            for name, (_, _, home, away) in r.stats.items():
+                home_col, away_col = self.stats[name]
+                if home is not None:
+                    home_col[i] = home
+                if away is not None:
+                    away_col[i] = away
+
+        goals = [(i, self.teams.id(g.team), self.players.id(g.player), g.count)
+                 for i, r in enumerate(records) for g in r.scorers]
+        goal_table = np.array(goals, dtype=np.int32).reshape(-1, 4)
+        self.goal_match, self.goal_team, self.goal_player, self.goal_count = goal_table.T
+
+    @classmethod
+    def from_json(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return len(self.home_goals)
+
+    def stat(self, name):
+        """(home, away) float arrays of a stat; all-NaN when never scraped."""
+        cols = self.stats.get(name.lower())
+        if cols is None:
+            missing = np.full(len(self), np.nan)
+            return missing, missing
+        return cols
+
+    def classify_codes(self):
+        """
+        Narrative code per match (DRAW, DOMINANT, NARROW, CONVINCING) and the
+        winning team ID (-1 for draws), with classify_match's exact rules.
+        """
+        margin = self.home_goals - self.away_goals
+        xg_home, xg_away = self.stat("XG")
+
+        # classify_match skips the xG check when either value is missing or 0
+        has_xg = (np.nan_to_num(xg_home) != 0) & (np.nan_to_num(xg_away) != 0)
+        dominant = has_xg & (np.abs(xg_home - xg_away) >= 1.5)
+
+        codes = np.select(
+            [margin == 0, dominant, np.abs(margin) == 1],
+            [DRAW, DOMINANT, NARROW],
+            CONVINCING,
+        )
+        winner = np.where(margin > 0, self.home_team, self.away_team)
+        winner[margin == 0] = -1
+        return codes, winner
+
+    def classify(self):
+        """
+        classify_match labels for every match, as an object array of strings.
+        """
+        codes, winner = self.classify_codes()
+        prefixes = np.array(NARRATIVE_PREFIXES, dtype=object)[codes]
+        # Index -1 picks the trailing "" for draws
+        team_names = np.array(self.teams.names + [""], dtype=object)[winner]
+        return prefixes + team_names
+
+    def player_goals(self):
+        """Goals per player ID across the store."""
+        return np.bincount(self.goal_player, weights=self.goal_count,
+                           minlength=len(self.players)).astype(np.int64)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Season-wide narrative counts")
+    parser.add_argument("input", nargs="?", default="premier_league_results.json")
+    args = parser.parse_args()
+
+    store = SeasonStore.from_json(args.input)
+    codes, _ = store.classify_codes()
+    counts = Counter(codes.tolist())
+    print(f"Matches: {len(store)}, teams: {len(store.teams)}, players: {len(store.players)}")
+    for code, name in enumerate(NARRATIVE_TYPES):
+        print(f"{name:>14}: {counts.get(code, 0)}")
+
+
+if __name__ == "__main__":
+    main()
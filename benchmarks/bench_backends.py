@@ -0,0 +1,208 @@
+# CSCI4152/6509 Fall 2025
+# Program: Summarizer Backend Comparison
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Runs the summarizer over the test split of a results file
+# with each backend (transformers fp32, int8, onnx) and reports load time,
+# per-match latency, peak memory and ROUGE against the report, with deltas
+# to the first backend. Each backend runs in its own process so memory is
+# measured separately. --tiny-random swaps in a tiny randomly initialized
+# BART so the harness runs offline; it reports speed and memory only.
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from nlp.backends import BACKENDS, get_backend
+from nlp.resources import DEFAULT_MODEL
+from nlp.rouge import RougeEngine
+from utils.metrics import percentile
+
+DEFAULT_INPUT = os.path.join(ROOT, "premier_league_results_sample.json")
+FIELDS = ("hybrid", "raw")
+
+
+def build_tiny_random(path, tokenizer_name=DEFAULT_MODEL, seed=0):
+    """
+    Saves a 1-layer, 32-wide randomly initialized BART with the tokenizer of
+    tokenizer_name (from the local cache) into path.
+    """
+    import torch
+    from transformers import AutoTokenizer, BartConfig, BartForConditionalGeneration, GenerationConfig
+
+    tokenizer = AutoTokenizer.from_pretrained(tokenizer_name, local_files_only=True)
+    config = BartConfig(
+        vocab_size=len(tokenizer), d_model=32, encoder_layers=1, decoder_layers=1,
+        encoder_attention_heads=2, decoder_attention_heads=2, encoder_ffn_dim=64,
+        decoder_ffn_dim=64, max_position_embeddings=1024,
+        pad_token_id=tokenizer.pad_token_id, bos_token_id=tokenizer.bos_token_id,
+        eos_token_id=tokenizer.eos_token_id, decoder_start_token_id=tokenizer.eos_token_id,
+        forced_bos_token_id=tokenizer.bos_token_id, forced_eos_token_id=tokenizer.eos_token_id,
+    )
+    torch.manual_seed(seed)
+    model = BartForConditionalGeneration(config)
+    # bart-large-cnn's generation length, so the pipeline honours the
+    # max_length of each call instead of its 256 new-token default
+    model.generation_config = GenerationConfig.from_model_config(config)
+    model.generation_config.max_length = 142
+    model.save_pretrained(path)
+    tokenizer.save_pretrained(path)
+    return path
+
+
+def test_split(path, test_size=0.1, random_state=42):
+    """The test matches main.main would hold out of this file."""
+    from sklearn.model_selection import train_test_split
+
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    _, test = train_test_split(entries, test_size=test_size, random_state=random_state, shuffle=True)
+    return test
+
+
+def run_backend(name, model, threads, entries, batch_size):
+    """
+    Loads one backend and summarizes every entry on its own (after one
+    warm-up match). Runs in a fresh process; returns timings, peak RSS
+    and the (hybrid, raw) summaries, or {"error": ...}.
+    """
+    from nlp.summarization import BatchSummarizer, summarize_entries
+
+    start = time.perf_counter()
+    try:
+        pipe = get_backend(name, threads).load(model)
+    except (ImportError, LookupError) as e:
+        return {"error": str(e)}
+    load_s = time.perf_counter() - start
+
+    engine = BatchSummarizer(pipe=pipe, batch_size=batch_size)
+    summarize_entries(entries[:1], engine=engine)
+
+    summaries, latencies = [], []
+    for entry in entries:
+        start = time.perf_counter()
+        summaries.extend(summarize_entries([entry], engine=engine))
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        "load_s": load_s,
+        "latencies": sorted(latencies),
+        # ru_maxrss is in KB on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "summaries": summaries,
+    }
+
+
+def rouge_scores(engine, entries, summaries):
+    """Mean ROUGE F1 per (field, rouge type) of the summaries against each report."""
+    totals = {}
+    for entry, pair in zip(entries, summaries):
+        reference = engine.reference(entry.get("report") or "")
+        for field, summary in zip(FIELDS, pair):
+            for rouge_type, score in engine.score(reference, summary or "").items():
+                key = f"{field}_{rouge_type}"
+                totals[key] = totals.get(key, 0.0) + score.fmeasure
+    return {key: total / len(entries) for key, total in totals.items()}
+
+
+def agreement(engine, base, other):
+    """
+    (share of summaries identical to the base backend's, mean ROUGE-L F1
+    against them).
+    """
+    pairs = [(b or "", o or "") for base_pair, other_pair in zip(base, other)
+             for b, o in zip(base_pair, other_pair)]
+    if not pairs:
+        return 0.0, 0.0
+    same = sum(b == o for b, o in pairs) / len(pairs)
+    return same, sum(engine.score(b, o)["rougeL"].fmeasure for b, o in pairs) / len(pairs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency, memory and ROUGE of summarizer backends")
+    parser.add_argument("--input", default=DEFAULT_INPUT, help="results file; its test split is used")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS),
+                        help="first one is the baseline for deltas")
+    parser.add_argument("--threads", type=int, default=os.cpu_count(),
+                        help="intra-op threads per backend")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--limit", type=int, help="only the first N test matches")
+    parser.add_argument("--tiny-random", action="store_true",
+                        help="use a tiny randomly initialized BART instead of --model")
+    parser.add_argument("--output", help="also write the report to a JSON file")
+    args = parser.parse_args()
+
+    entries = test_split(args.input)[:args.limit]
+    tmp = tempfile.TemporaryDirectory() if args.tiny_random else None
+    model = build_tiny_random(tmp.name) if tmp else args.model
+    print(f"{len(entries)} test matches, model {'tiny-random' if tmp else model}, "
+          f"{args.threads} threads\n")
+
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for name in args.backends:
+        with ctx.Pool(1) as pool:
+            results[name] = pool.apply(run_backend, (name, model, args.threads, entries,
+                                                     args.batch_size))
+    if tmp:
+        tmp.cleanup()
+
+    # Random weights produce arbitrary text, so quality is only reported
+    # for real models; --tiny-random measures speed and memory alone
+    quality = not tmp
+    engine = RougeEngine()
+    ok = [name for name in args.backends if "error" not in results[name]]
+    base = ok[0] if ok else None
+    base_rouge = rouge_scores(engine, entries, results[base]["summaries"]) if base and quality else {}
+
+    header = (f"{'backend':12} {'load s':>7} {'p50 ms':>9} {'p95 ms':>9} {'match/s':>8} "
+              f"{'RSS MB':>8}")
+    if quality:
+        header += f" {'raw R-L':>8} {'d R-L':>7} {'same':>6} {'agree':>6}"
+    print(header)
+    report = {}
+    for name in args.backends:
+        result = results[name]
+        if "error" in result:
+            print(f"{name:12} skipped: {result['error']}")
+            report[name] = {"error": result["error"]}
+            continue
+        latencies = result["latencies"]
+        r = report[name] = {
+            "load_s": round(result["load_s"], 3),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "matches_per_s": round(len(latencies) / sum(latencies), 3),
+            "peak_rss_mb": round(result["peak_rss_mb"], 1),
+        }
+        line = (f"{name:12} {r['load_s']:7.2f} {r['p50_ms']:9.1f} {r['p95_ms']:9.1f} "
+                f"{r['matches_per_s']:8.2f} {r['peak_rss_mb']:8.1f}")
+        if quality:
+            rouge = rouge_scores(engine, entries, result["summaries"])
+            same, agree = agreement(engine, results[base]["summaries"], result["summaries"])
+            r["rouge"] = {key: round(value, 4) for key, value in rouge.items()}
+            r["rouge_delta"] = {key: round(value - base_rouge[key], 4) for key, value in rouge.items()}
+            r["identical"] = round(same, 4)
+            r["agreement_rougeL"] = round(agree, 4)
+            line += (f" {rouge['raw_rougeL']:8.4f} {r['rouge_delta']['raw_rougeL']:+7.4f} "
+                     f"{same:6.2f} {agree:6.3f}")
+        print(line)
+    if not quality:
+        print("\nROUGE and agreement omitted: random weights give meaningless summaries")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"model": "tiny-random" if tmp else model, "matches": len(entries),
+                       "threads": args.threads, "backends": report}, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# CSCI4152/6509 Fall 2025
+# Program: Event Coverage Benchmark
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Times event coverage of one summary as the number of events
+# per match grows, comparing the n-gram indexed coverage engine with a
+# naive scan of the summary's tokens for every fact of every event, under
+# the same matching rules (results are checked to be equal).
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp.coverage import MAX_NGRAM, MINUTE_DIGITS, entry_coverage, event_facts, summary_tokens
+
+PLAYERS = ["Bukayo Saka", "Declan Rice", "Viktor Gyökeres", "Martin Dubravka", "Axel Tuanzebe",
+           "Leandro Trossard", "Gabriel Magalhaes", "Mohamed Salah", "Erling Haaland", "Cole Palmer"]
+TYPES = ["goal", "card", "substitution", "penalty", "save", "var"]
+
+
+def make_events(count, rng):
+    events = []
+    for _ in range(count):
+        players = rng.sample(PLAYERS, 2)
+        minute = rng.randint(1, 90)
+        sentence = (f"{players[0]} combined with {players[1]} in the {minute}th minute "
+                    "after a long spell of pressure down the left flank")
+        events.append({"type": rng.choice(TYPES), "minute": f"{minute}'", "offset": 0,
+                       "sentence": sentence, "players": players})
+    return events
+
+
+def _contains(tokens, key):
+    n = len(key)
+    return n > 0 and any(tuple(tokens[i:i + n]) == key for i in range(len(tokens) - n + 1))
+
+
+def scan_coverage(summary, events):
+    """entry_coverage without the index: each player and minute is searched for in the token list."""
+    tokens = summary_tokens(summary)
+    counts = {}
+    for event in events:
+        event_type, players, minute = event_facts(event)
+        hit = False
+        for player in players:
+            name = tuple(summary_tokens(player))
+            if name and (_contains(tokens, name[-MAX_NGRAM:]) or _contains(tokens, name[-1:])):
+                hit = True
+                break
+        if not hit:
+            digits = MINUTE_DIGITS.match(minute or "")
+            hit = bool(digits) and _contains(tokens, (digits.group(0),))
+        covered, total = counts.get(event_type, (0, 0))
+        counts[event_type] = (covered + hit, total + 1)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event coverage with growing event counts")
+    parser.add_argument("--events", type=int, nargs="+", default=[5, 20, 50, 100, 200])
+    parser.add_argument("--matches", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    summary = " ".join(f"{rng.choice(PLAYERS)} scored in the {rng.randint(1, 90)}th minute."
+                       for _ in range(12))
+
+    print(f"{'events':>7} {'scan (ms/match)':>16} {'indexed (ms/match)':>19} {'speedup':>8}")
+    for count in args.events:
+        matches = [make_events(count, rng) for _ in range(args.matches)]
+        start = time.perf_counter()
+        scanned = [scan_coverage(summary, events) for events in matches]
+        scan = (time.perf_counter() - start) * 1000 / args.matches
+        start = time.perf_counter()
+        indexed = [entry_coverage(summary, events) for events in matches]
+        new = (time.perf_counter() - start) * 1000 / args.matches
+        assert indexed == scanned, "the engines disagree"
+        print(f"{count:7d} {scan:16.3f} {new:19.3f} {scan / new:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
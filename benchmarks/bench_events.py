@@ -0,0 +1,64 @@
+# CSCI4152/6509 Fall 2025
+# Program: Event Extraction Scaling Benchmark
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Times event extraction on long unpunctuated reports of growing
+# size, comparing the old goal regex with the single-pass extractor.
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp.document import ParsedReport
+from nlp.events import extract_events
+
+# The previous extractor, kept here for comparison
+OLD_GOAL_PATTERN = r"(\d+'\s*)?([^\.]*goal[^\.]*)"
+
+FILLER = ("the ball was played wide and the cross came in but nobody got on the end of it "
+          "while the midfield pressed high and the full back overlapped again ").split()
+
+
+def make_report(words):
+    """
+    One goal sentence followed by a long unpunctuated stretch without the
+    word "goal": the old pattern rescans to the end from every start there.
+    """
+    body = (FILLER * (words // len(FILLER) + 1))[:words]
+    return "Salah scored a goal in the 90th minute. " + " ".join(body)
+
+
+def old_extract(text):
+    return [m.group(0) for m in re.finditer(OLD_GOAL_PATTERN, text, flags=re.I)]
+
+
+def timed(fn, text):
+    start = time.perf_counter()
+    fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event extraction on pathological reports")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 4000, 8000, 16000, 64000])
+    parser.add_argument("--skip-old-above", type=int, default=8000,
+                        help="do not run the old regex on reports longer than this")
+    args = parser.parse_args()
+
+    # Warm up the sentence tokenizer so loading it is not timed
+    extract_events(ParsedReport(make_report(10)))
+
+    print(f"{'words':>8} {'old regex (s)':>14} {'extractor (s)':>14}")
+    for words in args.sizes:
+        text = make_report(words)
+        old = f"{timed(old_extract, text):14.4f}" if words <= args.skip_old_above else f"{'skipped':>14}"
+        # Sentence splitting is part of the extractor's cost, so parse inside the timer
+        new = timed(lambda t: extract_events(ParsedReport(t), players=["Salah"]), text)
+        print(f"{words:8d} {old} {new:14.4f}")
+
+
+if __name__ == "__main__":
+    main()
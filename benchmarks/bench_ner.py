@@ -0,0 +1,101 @@
+# CSCI4152/6509 Fall 2025
+# Program: NER Mode Benchmark
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Compares the full NLTK chunker with the gazetteer-first fast
+# NER mode on throughput and recall. The gazetteer is built from all but a
+# held-out share of the matches, and recall is measured on the held-out
+# reports only: against their structured names (teams and scorers, some
+# of them unseen) and against the chunker's PERSON spans.
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp.document import ParsedReport
+from nlp.entities import EntityExtractor
+from nlp.gazetteer import Gazetteer, PERSON_LABEL
+from utils.text_helpers import clean_player_name
+
+
+def gold_names(entry):
+    """Structured team/scorer names that occur verbatim in the report."""
+    report = entry.get("report") or ""
+    names = {entry["home_team"], entry["away_team"]}
+    names |= {clean_player_name(g.get("player")) for g in entry.get("scorers", [])}
+    return {n for n in names if n and n in report}
+
+
+def chunker_people(entities):
+    """PERSON spans of the full chunker, the reference for names outside the structured data."""
+    return {name for name, label in entities if label == PERSON_LABEL}
+
+
+def found_names(entities, gold):
+    """Gold names covered by an extracted entity (exact or as one of its words)."""
+    extracted = {name for name, _ in entities}
+    words = {w for name in extracted for w in name.split()}
+    return {g for g in gold if g in extracted or g in words}
+
+
+def run(extractor, entries):
+    # Reports are parsed fresh for each mode so tokenization is timed too
+    reports = [ParsedReport(e.get("report") or "") for e in entries]
+    start = time.perf_counter()
+    results = [extractor.extract(r) for r in reports]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunker vs gazetteer-first NER")
+    parser.add_argument("--input", default="output/premier_league_results.json")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--holdout", type=float, default=0.2,
+                        help="share of matches (the last ones) left out of the gazetteer")
+    args = parser.parse_args()
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        season = json.load(f)
+    season = season[:args.limit] if args.limit else season
+    # Names seen only in held-out reports must come from the chunker
+    # fallback, so a gazetteer built from every match would score 1.0
+    split = len(season) - max(1, int(len(season) * args.holdout))
+    seen, entries = season[:split], season[split:]
+
+    gazetteer = Gazetteer.from_entries(seen)
+    modes = {
+        "chunker": EntityExtractor(),
+        "gazetteer-first": EntityExtractor(gazetteer=gazetteer),
+    }
+
+    # Load the tagger/chunker before timing
+    modes["chunker"].extract("Warm up the tagger and chunker.")
+
+    results = {name: run(extractor, entries) for name, extractor in modes.items()}
+    gold = [gold_names(e) for e in entries]
+    people = [chunker_people(r) for r in results["chunker"][0]]
+    unseen = sum(len(g - gazetteer.names.keys()) for g in gold)
+    print(f"{len(entries)} held-out reports, {len(gazetteer)} gazetteer names from {len(seen)} "
+          f"matches, {sum(len(g) for g in gold)} structured mentions ({unseen} unseen), "
+          f"{sum(len(p) for p in people)} chunker PERSON spans")
+    print(f"{'mode':16} {'reports/s':>10} {'structured':>11} {'chunker PER':>12} {'entities':>9}")
+
+    for name, (extracted, elapsed) in results.items():
+        structured = _recall(extracted, gold)
+        # The chunker is its own reference here
+        person = "-" if name == "chunker" else f"{_recall(extracted, people):.3f}"
+        count = sum(len(r) for r in extracted)
+        print(f"{name:16} {len(entries) / elapsed:10.1f} {structured:11.3f} {person:>12} {count:9d}")
+
+
+def _recall(extracted, gold):
+    total = sum(len(g) for g in gold)
+    hit = sum(len(found_names(r, g)) for r, g in zip(extracted, gold))
+    return hit / total if total else 0.0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+# CSCI4152/6509 Fall 2025
+# Program: Pipeline Stage Benchmark Suite
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Times every pipeline stage on its own over the bundled match
+# files, with BART replaced by a stub summarizer so it runs offline on CPU.
+# Results (median ops/sec of repeated trials, their noise and latency
+# percentiles) are saved as a baseline per machine, and later runs on that
+# machine fail when a stage is slower than the baseline by more than both a
+# threshold and the measured noise, after normalizing for machine speed
+# with a calibration loop.
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from analysis.injuries import detect_injuries
+from analysis.narrative import classify_match
+from analysis.players import detect_key_players
+from analysis.record import MatchRecord
+from nlp.coverage import entry_coverage
+from nlp.document import ParsedReport
+from nlp.entities import extract_entities
+from nlp.events import extract_events
+from nlp.gazetteer import Gazetteer
+from nlp.name_index import NameIndex
+from nlp.rouge import RougeEngine
+from nlp.summarization import BatchSummarizer, configure_cache, summarize_entries
+from templates.match_template import build_template_summary
+from utils.metrics import percentile
+
+DEFAULT_INPUTS = ["premier_league_results_sample.json", "output/premier_league_results.json"]
+BASELINE_DIR = os.path.join(ROOT, "benchmarks", "baselines")
+DEFAULT_THRESHOLD = 0.4
+DEFAULT_REPEAT = 7
+# A drop also has to exceed this many times the trials' relative spread
+NOISE_FACTOR = 3
+CALIBRATION_LOOP = 200_000
+
+
+class StubSummarizer:
+    """
+    Stand-in for the transformers summarization pipeline: returns the first
+    max_length words of each input, so the batching and step logic around
+    the model is measured without loading BART.
+    """
+
+    def __call__(self, texts, max_length=60, min_length=0, do_sample=False, batch_size=None):
+        if isinstance(texts, str):
+            texts = [texts]
+        return [{"summary_text": " ".join(t.split()[:max_length])} for t in texts]
+
+
+def build_stages(entries):
+    """{stage name: (function, inputs)}; each call on one input is one op."""
+    reports = [e.get("report") or "" for e in entries]
+    records = [MatchRecord.from_dict(e) for e in entries]
+    templates = [build_template_summary(r) for r in records]
+    events = [extract_events(r.report) for r in records]
+    name_index = NameIndex.from_gazetteer(Gazetteer.from_entries(entries))
+    rouge = RougeEngine()
+    summarizer = BatchSummarizer(pipe=StubSummarizer(), cache=None)
+
+    return {
+        "parse_report": (lambda text: ParsedReport(text).sentence_spans, reports),
+        "extract_entities": (extract_entities, reports),
+        "detect_injuries": (detect_injuries, reports),
+        "extract_events": (extract_events, reports),
+        "match_record": (MatchRecord.from_dict, entries),
+        "classify_match": (classify_match, entries),
+        "detect_key_players": (detect_key_players, entries),
+        "build_template_summary": (build_template_summary, entries),
+        "summarize_stub": (lambda e: summarize_entries([e], engine=summarizer), records),
+        "rouge": (lambda pair: rouge.score(*pair), list(zip(reports, templates))),
+        "hallucination": (lambda pair: name_index.find_unsupported(*pair), list(zip(templates, reports))),
+        "coverage": (lambda pair: entry_coverage(*pair), list(zip(templates, events))),
+    }
+
+
+def default_baseline():
+    """Baseline file of this machine; baselines are never compared across machines."""
+    name = f"{platform.node() or 'unknown'}-{platform.machine()}-py{platform.python_version()}"
+    return os.path.join(BASELINE_DIR, name + ".json")
+
+
+def relative_spread(values):
+    """Median absolute deviation of values relative to their median."""
+    mid = statistics.median(values)
+    return statistics.median(abs(v - mid) for v in values) / mid if mid else 0.0
+
+
+def calibrate(repeat=DEFAULT_REPEAT):
+    """
+    Median loops/sec of a fixed pure-Python loop: the speed of this machine
+    (and its current load), by which baselines are scaled before comparing.
+    """
+    rates = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        total = 0
+        for i in range(CALIBRATION_LOOP):
+            total += i * i % 7
+        rates.append(1 / (time.perf_counter() - start))
+    return round(statistics.median(rates), 4)
+
+
+def time_stage(fn, inputs, repeat=DEFAULT_REPEAT):
+    """
+    Runs fn over inputs repeat times (trials) after one untimed warm-up
+    pass. ops/sec is the median over the trials and noise their relative
+    spread; percentiles are over every call.
+    Returns {"ops", "ops_per_sec", "noise", "p50_ms", "p95_ms", "p99_ms"}.
+    """
+    for item in inputs:
+        fn(item)
+
+    samples = []
+    rates = []
+    for _ in range(repeat):
+        pass_start = len(samples)
+        for item in inputs:
+            start = time.perf_counter()
+            fn(item)
+            samples.append(time.perf_counter() - start)
+        elapsed = sum(samples[pass_start:])
+        rates.append(len(inputs) / elapsed if elapsed else 0.0)
+
+    samples.sort()
+    return {
+        "ops": len(samples),
+        "ops_per_sec": round(statistics.median(rates), 2),
+        "noise": round(relative_spread(rates), 4),
+        "p50_ms": round(percentile(samples, 50) * 1000, 4),
+        "p95_ms": round(percentile(samples, 95) * 1000, 4),
+        "p99_ms": round(percentile(samples, 99) * 1000, 4),
+    }
+
+
+def run_suite(inputs, repeat=DEFAULT_REPEAT, only=None):
+    """{"<input file>:<stage>": timings} for every input file found."""
+    results = {}
+    for path in inputs:
+        full_path = path if os.path.isabs(path) else os.path.join(ROOT, path)
+        if not os.path.exists(full_path):
+            print(f"Skipping missing input {path}")
+            continue
+        with open(full_path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+
+        name = os.path.basename(path)
+        for stage, (fn, stage_inputs) in build_stages(entries).items():
+            if only and stage not in only:
+                continue
+            results[f"{name}:{stage}"] = time_stage(fn, stage_inputs, repeat)
+            timing = results[f"{name}:{stage}"]
+            print(f"{name:38} {stage:24} {timing['ops_per_sec']:12.1f} {timing['noise']:6.1%} "
+                  f"{timing['p50_ms']:9.3f} {timing['p95_ms']:9.3f} {timing['p99_ms']:9.3f}")
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, scale=1.0):
+    """
+    Stages whose ops/sec dropped below the baseline (times scale, the
+    machine speed ratio of this run to the baseline's) by more than both
+    threshold (0.4 = 40%) and NOISE_FACTOR times the trials' combined
+    spread, as [(key, expected ops/sec, current ops/sec)].
+    """
+    regressions = []
+    for key, timing in results.items():
+        base = baseline.get(key)
+        if not base or not base["ops_per_sec"]:
+            continue
+        expected = base["ops_per_sec"] * scale
+        change = timing["ops_per_sec"] / expected - 1
+        allowed = max(threshold, NOISE_FACTOR * (timing["noise"] + base.get("noise", 0.0)))
+        flag = "REGRESSION" if change < -allowed else ""
+        print(f"{key:64} {expected:12.1f} -> {timing['ops_per_sec']:12.1f} "
+              f"({change:+7.1%}, allowed -{allowed:.0%}) {flag}")
+        if flag:
+            regressions.append((key, expected, timing["ops_per_sec"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage pipeline benchmarks with a regression gate")
+    parser.add_argument("--inputs", nargs="+", default=DEFAULT_INPUTS)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="timed trials over each input file; ops/sec is their median")
+    parser.add_argument("--stages", nargs="+", help="only run these stages")
+    parser.add_argument("--baseline", default=default_baseline(),
+                        help="baseline JSON to compare against (default: this machine's, "
+                             "under benchmarks/baselines/)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write this run's results to --baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed ops/sec drop against the baseline (0.4 = 40%%), "
+                             "raised to the measured noise where that is larger")
+    parser.add_argument("--output", help="also write this run's results to a JSON file")
+    args = parser.parse_args()
+
+    # No summary cache, so cache hits cannot hide summarizer work
+    configure_cache(None)
+
+    calibration = calibrate(args.repeat)
+    print(f"{'input':38} {'stage':24} {'ops/sec':>12} {'noise':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    results = run_suite(args.inputs, args.repeat, args.stages)
+    # Measured on both sides of the suite, so load changes during it count
+    calibration = round(statistics.median([calibration, calibrate(args.repeat)]), 4)
+    document = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+        "calibration": calibration,
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=4)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=4)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    scale = calibration / baseline["calibration"] if baseline.get("calibration") else 1.0
+    print(f"\nAgainst {args.baseline} (threshold {args.threshold:.0%}, "
+          f"machine speed x{scale:.2f} of the baseline's):")
+    regressions = compare(results, baseline["results"], args.threshold, scale)
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed")
+        sys.exit(1)
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# CSCI4152/6509 Fall 2025
+# Program: ROUGE Engine Benchmark
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Scores several summary fields per match with one RougeScorer
+# call per field and with RougeEngine, checking the scores are identical.
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rouge_score import rouge_scorer
+
+from nlp.rouge import RougeEngine
+
+ROUGE_TYPES = ["rouge1", "rouge2", "rougeL"]
+
+
+def make_candidates(report, rng, count):
+    """Extractive-style candidates: random sentence picks of the report."""
+    sentences = [s for s in report.split(". ") if s]
+    return [". ".join(rng.sample(sentences, min(len(sentences), rng.randint(1, 4))))
+            for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RougeScorer vs RougeEngine")
+    parser.add_argument("input", nargs="?", default="premier_league_results_sample.json")
+    parser.add_argument("--fields", type=int, default=3, help="candidate summaries per match")
+    args = parser.parse_args()
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        reports = [m["report"].lower() for m in json.load(f) if m.get("report")]
+    rng = random.Random(0)
+    pairs = [(r, make_candidates(r, rng, args.fields)) for r in reports]
+
+    start = time.perf_counter()
+    scorer = rouge_scorer.RougeScorer(ROUGE_TYPES, use_stemmer=True)
+    expected = [[scorer.score(r, c) for c in cands] for r, cands in pairs]
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine = RougeEngine(ROUGE_TYPES, use_stemmer=True)
+    actual = [engine.score_many(r, cands) for r, cands in pairs]
+    fast = time.perf_counter() - start
+
+    mismatches = sum(e != a for exp, act in zip(expected, actual) for e, a in zip(exp, act))
+    print(f"{len(pairs)} references x {args.fields} candidates")
+    print(f"RougeScorer: {baseline:.3f}s")
+    print(f"RougeEngine: {fast:.3f}s ({baseline / fast:.1f}x)")
+    print(f"Mismatched scores: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# CSCI4152/6509 Fall 2025
+# Program: Scraper Throughput Benchmark
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Serves saved match pages (<pages>/<match_id>.html) from a local
+# HTTP server at /match/<match_id> and measures how many matches per minute
+# the parallel scraper gets through for different worker counts, without
+# touching the live site. The match report opens with a JavaScript click a
+# static page cannot do, so the report step reads <match_id>.report.html.
+
+import argparse
+import functools
+import os
+import sys
+import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.crawl_frontier import match_id_from_url
+from utils.match_page import SNAPSHOT_REPORT, parse_html, parse_report, snapshot_ids
+
+
+class MatchPageHandler(SimpleHTTPRequestHandler):
+    """Maps /match/<id>[/...] to <id>.html in the pages directory."""
+
+    def translate_path(self, path):
+        parts = path.split("?", 1)[0].strip("/").split("/")
+        if len(parts) >= 2 and parts[0] == "match":
+            return os.path.join(self.directory, f"{parts[1]}.html")
+        return super().translate_path(path)
+
+    def log_message(self, *args):
+        pass
+
+
+def snapshot_report(pages):
+    """
+    Stand-in for epl_scraper.scrape_match_report on served snapshots:
+    reads the saved report of the current match instead of clicking the
+    report button and waiting out the 12s timeout on every match.
+    """
+    def scrape_match_report(driver):
+        path = os.path.join(pages, SNAPSHOT_REPORT.format(match_id_from_url(driver.current_url)))
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return parse_report(parse_html(f.read()))
+    return scrape_match_report
+
+
+def serve(pages, port=0):
+    """Starts the page server in a daemon thread; returns (server, base URL)."""
+    handler = functools.partial(MatchPageHandler, directory=os.path.abspath(pages))
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel scraper throughput on saved pages")
+    parser.add_argument("--pages", required=True, help="directory of saved <match_id>.html pages")
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated worker counts")
+    parser.add_argument("--rate", type=float, default=0, help="global page loads per minute (0 = none)")
+    parser.add_argument("--delay", type=float, nargs=2, default=(0, 0),
+                        help="per-worker politeness delay range in seconds")
+    parser.add_argument("--serve-only", action="store_true",
+                        help="only serve the pages and print their URLs (for epl_scraper.py --urls)")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--fast", action="store_true", help="use the scraper's fast profile")
+    args = parser.parse_args()
+
+    ids = snapshot_ids(args.pages)
+    server, base = serve(args.pages, args.port)
+    urls = [f"{base}/match/{match_id}" for match_id in ids]
+
+    if args.serve_only:
+        print("\n".join(urls))
+        print(f"Serving {len(urls)} pages at {base}, Ctrl+C to stop", file=sys.stderr)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            return
+
+    # Imported late so --serve-only works without selenium installed
+    import epl_scraper
+    from epl_scraper import scrape_parallel, PhaseTimer
+    from utils.match_store import MatchStore
+
+    epl_scraper.scrape_match_report = snapshot_report(args.pages)
+
+    print(f"{len(urls)} pages served from {base}")
+    print(f"{'workers':>7} {'scraped':>8} {'failed':>7} {'seconds':>8} {'matches/min':>12}")
+    for workers in (int(w) for w in args.workers.split(",")):
+        timer = PhaseTimer()
+        with tempfile.TemporaryDirectory() as tmp:
+            with MatchStore(os.path.join(tmp, "store.jsonl")) as store:
+                stats = scrape_parallel(urls, store, workers=workers, rate_per_minute=args.rate,
+                                        delay=tuple(args.delay), fast=args.fast, timer=timer)
+        print(f"{workers:7d} {stats['scraped']:8d} {stats['failed']:7d} "
+              f"{stats['seconds']:8.1f} {stats['per_minute']:12.1f}")
+        timer.report()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
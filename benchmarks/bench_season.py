@@ -0,0 +1,54 @@
+# CSCI4152/6509 Fall 2025
+# Program: Season Store Benchmark
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Compares per-entry classify_match with the vectorized
+# SeasonStore classification on a season replicated to many matches, and
+# checks that both produce the same labels.
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.narrative import classify_match
+from analysis.record import MatchRecord
+from analysis.season import SeasonStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-entry vs vectorized narrative classification")
+    parser.add_argument("--input", default="output/premier_league_results.json")
+    parser.add_argument("--matches", type=int, default=50000,
+                        help="replicate the input season up to this many matches")
+    args = parser.parse_args()
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        season = json.load(f)
+    entries = (season * (args.matches // len(season) + 1))[:args.matches]
+
+    start = time.perf_counter()
+    expected = [classify_match(e) for e in entries]
+    per_entry = time.perf_counter() - start
+
+    records = [MatchRecord.from_dict(e) for e in entries]
+    start = time.perf_counter()
+    store = SeasonStore(records)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    labels = store.classify()
+    vectorized = time.perf_counter() - start
+
+    mismatches = sum(a != b for a, b in zip(expected, labels))
+    print(f"{len(entries)} matches, {len(store.stats)} stats, {len(store.teams)} teams")
+    print(f"per-entry classify_match: {per_entry:.3f}s")
+    print(f"SeasonStore build:        {build:.3f}s")
+    print(f"SeasonStore.classify:     {vectorized:.4f}s")
+    print(f"mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# CSCI4152/6509 Fall 2025
+# Program: Startup Time Benchmark
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Measures the import cost of each pipeline module in a fresh
+# interpreter, and lists the slowest third-party imports it pulls in.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "main",
+    "epl_evaluation",
+    "eval_runner",
+    "nlp.resources",
+    "nlp.cache",
+    "nlp.summarization",
+    "nlp.entities",
+    "nlp.events",
+    "analysis.injuries",
+    "analysis.narrative",
+    "analysis.players",
+    "analysis.stats",
+    "templates.match_template",
+    "utils.file_helpers",
+    "utils.logging_helpers",
+]
+
+
+def time_import(module):
+    """
+    Wall time of 'import module' in a new interpreter, minus a bare start.
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], cwd=ROOT, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def imported_packages(module):
+    """
+    Parses 'python -X importtime' output into {top-level package: cumulative us}.
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True)
+    packages = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Keep top-level packages only, wherever they were first imported from
+        name = name.strip()
+        if "." not in name:
+            packages[name] = max(packages.get(name, 0), int(cumulative))
+    return packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-module import time")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=3, help="slowest imports to list per module")
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_import("sys") for _ in range(args.repeat))
+    # Packages the interpreter loads at startup (site, .pth hooks) are not the module's cost
+    startup = set(imported_packages("sys"))
+    print(f"{'module':28} {'import (ms)':>12}  slowest imports")
+
+    for module in MODULES:
+        cost = statistics.median(time_import(module) for _ in range(args.repeat)) - baseline
+        packages = imported_packages(module)
+        heavy = sorted(((us, name) for name, us in packages.items()
+                        if name not in startup and name != module.split(".")[0]), reverse=True)
+        listed = ", ".join(f"{name} {us / 1000:.0f}ms" for us, name in heavy[:args.top])
+        print(f"{module:28} {max(cost, 0.0) * 1000:12.1f}  {listed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# CSCI4152/6509 Fall 2025
+# Program: Summarization Throughput Benchmark
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Compares matches per second of the per-call summarization
+# loop against the length-bucketed batch summarizer.
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nlp.summarization as summarization
+from nlp.resources import resources
+
+
+def per_call(entries):
+    return [(summarization.hybrid_summary(e), summarization.summarize_text(e.get("report", "")))
+            for e in entries]
+
+
+def batched(entries, batch_size):
+    engine = summarization.BatchSummarizer(batch_size=batch_size)
+    return summarization.summarize_entries(entries, engine=engine), engine.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-call vs batched summarization throughput")
+    parser.add_argument("--input", default="premier_league_results_sample.json")
+    parser.add_argument("--model", default="facebook/bart-large-cnn")
+    parser.add_argument("--limit", type=int, default=8, help="number of matches")
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[4, 8, 16])
+    args = parser.parse_args()
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        entries = json.load(f)[:args.limit]
+
+    resources.use_model(args.model)
+    resources.summarizer()
+
+    start = time.perf_counter()
+    per_call(entries)
+    base = time.perf_counter() - start
+    print(f"per-call   : {len(entries) / base:7.3f} matches/s ({base:.1f}s)")
+
+    for size in args.batch_size:
+        start = time.perf_counter()
+        _, calls = batched(entries, size)
+        elapsed = time.perf_counter() - start
+        print(f"batch={size:<4}: {len(entries) / elapsed:7.3f} matches/s ({elapsed:.1f}s, "
+              f"{calls} generate calls, {base / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
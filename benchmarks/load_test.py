@@ -0,0 +1,146 @@
+# CSCI4152/6509 Fall 2025
+# Program: Summarization Service Load Test
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Sends match JSON to the summarization service from many
+# concurrent keep-alive clients and reports throughput, latency percentiles
+# and the service's micro-batch sizes. Without --url it starts the service
+# on localhost with a stub model that sleeps like a batched generate call,
+# so batching behaviour can be measured offline.
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_pipeline import StubSummarizer
+from utils.metrics import percentile
+
+DEFAULT_INPUT = os.path.join(ROOT, "premier_league_results_sample.json")
+
+
+class SleepingStubSummarizer(StubSummarizer):
+    """StubSummarizer whose calls cost call_ms plus item_ms per input, like a batched generate."""
+
+    def __init__(self, call_ms=30.0, item_ms=5.0):
+        self.call_s = call_ms / 1000
+        self.item_s = item_ms / 1000
+
+    def __call__(self, texts, **kwargs):
+        count = 1 if isinstance(texts, str) else len(texts)
+        time.sleep(self.call_s + self.item_s * count)
+        return super().__call__(texts, **kwargs)
+
+
+async def post(reader, writer, host, path, body):
+    """(status, response body) of one keep-alive POST."""
+    writer.write((f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                  f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def client(host, port, bodies, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while bodies:
+            body = bodies.pop()
+            start = time.perf_counter()
+            status, _ = await post(reader, writer, host, "/summarize", body)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def get_json(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    return json.loads(raw.split(b"\r\n\r\n", 1)[1])
+
+
+async def run_load(host, port, entries, requests, concurrency):
+    bodies = [json.dumps(entries[i % len(entries)]).encode("utf-8") for i in range(requests)]
+    latencies, statuses = [], {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, bodies, latencies, statuses)
+                           for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(latencies), statuses, await get_json(host, port, "/stats")
+
+
+async def run_local(args, entries, concurrency):
+    from nlp.resources import resources
+    from service import SummarizationService, build_batcher
+
+    resources.set_summarizer(SleepingStubSummarizer(args.stub_call_ms, args.stub_item_ms),
+                             model_name="stub")
+    batcher, _ = build_batcher(max_batch=args.max_batch, max_wait_ms=args.max_wait_ms,
+                               max_queue=args.max_queue, cache_path=None, season=args.input)
+    service = SummarizationService(batcher)
+    host, port = await service.start("127.0.0.1", 0)
+    try:
+        # Per-match progress lines from process_entry would swamp the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            return await run_load(host, port, entries, args.requests, concurrency)
+    finally:
+        await service.stop()
+        batcher.executor.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for the summarization service")
+    parser.add_argument("--url", help="running service, e.g. http://127.0.0.1:8765 "
+                                      "(default: start one with a stub model)")
+    parser.add_argument("--input", default=DEFAULT_INPUT, help="match JSON to send")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--max-batch", type=int, default=8)
+    parser.add_argument("--max-wait-ms", type=float, default=20)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--stub-call-ms", type=float, default=30.0,
+                        help="stub model cost per generate call")
+    parser.add_argument("--stub-item-ms", type=float, default=5.0,
+                        help="stub model cost per input in a call")
+    args = parser.parse_args()
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    print(f"{'clients':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'ok':>5} {'503':>5} {'other':>5} {'batch':>6}")
+    for concurrency in args.concurrency:
+        if args.url:
+            host, _, port = args.url.split("//", 1)[-1].rstrip("/").partition(":")
+            result = asyncio.run(run_load(host, int(port or 80), entries, args.requests, concurrency))
+        else:
+            result = asyncio.run(run_local(args, entries, concurrency))
+        elapsed, latencies, statuses, stats = result
+        ok, rejected = statuses.get(200, 0), statuses.get(503, 0)
+        other = sum(statuses.values()) - ok - rejected
+        print(f"{concurrency:7d} {len(latencies) / elapsed:8.1f} "
+              f"{percentile(latencies, 50) * 1000:9.1f} {percentile(latencies, 95) * 1000:9.1f} "
+              f"{percentile(latencies, 99) * 1000:9.1f} {ok:5d} {rejected:5d} {other:5d} "
+              f"{stats['mean_batch']:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
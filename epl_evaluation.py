@@ -4,9 +4,10 @@
 # Description: Evaluates the summarizations based on ROUGE,
 # coverage and hallucination rate
 
-from rouge_score import rouge_scorer
+from nlp.coverage import entry_coverage
+from nlp.name_index import NameIndex
+from nlp.rouge import RougeEngine
 from collections import Counter
-import re
 
 # --------------------------------------------------
 # Utility
@@ -20,58 +21,84 @@ def normalize(text: str) -> str:
 # ROUGE Evaluation
 # --------------------------------------------------
 
-def evaluate_rouge(entries):
-    scorer = rouge_scorer.RougeScorer(
-        ["rouge1", "rouge2", "rougeL"],
-        use_stemmer=True
-    )
+def evaluate_rouge(entries, field="summary"):
+    return evaluate_rouge_fields(entries, [field])[field]
 
-    scores = {"rouge1": [], "rouge2": [], "rougeL": []}
+
+def evaluate_rouge_fields(entries, fields, engine=None):
+    """
+    Mean ROUGE F-measures of several summary fields in one pass:
+    {field: {"rouge1", "rouge2", "rougeL"}}. Each raw_text reference is
+    tokenized and stemmed once for all fields.
+    """
+    engine = engine or RougeEngine(["rouge1", "rouge2", "rougeL"], use_stemmer=True)
+    scores = {f: {k: [] for k in engine.rouge_types} for f in fields}
 
     for entry in entries:
         reference = normalize(entry.get("raw_text"))
-        summary = normalize(entry.get("summary"))
-
-        if not reference or not summary:
+        if not reference:
             continue
 
-        result = scorer.score(reference, summary)
-        for k in scores:
-            scores[k].append(result[k].fmeasure)
+        tokens = None
+        for field in fields:
+            summary = normalize(entry.get(field))
+            if not summary:
+                continue
+            if tokens is None:
+                tokens = engine.reference(reference)
+            result = engine.score(tokens, summary)
+            for k in scores[field]:
+                scores[field][k].append(result[k].fmeasure)
 
-    return {k: round(sum(v)/len(v),4) if v else 0.0 for k,v in scores.items()}
+    return {f: {k: round(sum(v)/len(v),4) if v else 0.0 for k,v in field_scores.items()}
+            for f, field_scores in scores.items()}
 
 
 # --------------------------------------------------
 # Coverage Evaluation
 # --------------------------------------------------
 
-def evaluate_coverage(entry):
-    summary = normalize(entry.get("summary"))
-
-    coverage = {
-        "events": False
-    }
-
-    # Check if at least one event is mentioned in summary
-    events = entry.get("events", [])
-    for e in events:
-        if normalize(e) in summary:
-            coverage["events"] = True
-            break
-
-    return coverage
-
-def evaluate_dataset_coverage(entries):
-    totals = Counter()
+def evaluate_coverage(entry, field="summary"):
+    """
+    Event coverage of one summary: "events" is True when at least one event
+    is mentioned, "by_type" maps each event type (and "injury") to
+    (covered, total). An event is mentioned when one of its players or its
+    minute appears in the summary.
+    """
+    by_type = entry_coverage(entry.get(field), entry.get("events", []), entry.get("injuries", []))
+    return {"events": any(covered for covered, _ in by_type.values()), "by_type": by_type}
+
+def evaluate_dataset_coverage(entries, field="summary"):
+    return evaluate_coverage_fields(entries, [field])[field]
+
+def evaluate_coverage_fields(entries, fields):
+    """
+    Coverage of several summary fields in one pass: per field, the share of
+    entries mentioning at least one event ("events"), the share of all
+    events mentioned ("event_rate") and that share per event type ("by_type").
+    """
     n = len(entries)
+    mentioned = Counter()
+    covered = {f: Counter() for f in fields}
+    totals = {f: Counter() for f in fields}
 
     for entry in entries:
-        c = evaluate_coverage(entry)
-        for k, v in c.items():
-            totals[k] += int(v)
+        for field in fields:
+            c = evaluate_coverage(entry, field)
+            mentioned[field] += int(c["events"])
+            for event_type, (hit, total) in c["by_type"].items():
+                covered[field][event_type] += hit
+                totals[field][event_type] += total
 
-    return {k: round(totals[k]/n,4) if n else 0.0 for k in totals}
+    report = {}
+    for f in fields:
+        all_events = sum(totals[f].values())
+        report[f] = {
+            "events": round(mentioned[f]/n,4) if n else 0.0,
+            "event_rate": round(sum(covered[f].values())/all_events,4) if all_events else 0.0,
+            "by_type": {t: round(covered[f][t]/totals[f][t],4) for t in sorted(totals[f])},
+        }
+    return report
 
 
 # --------------------------------------------------
@@ -84,37 +111,84 @@ def extract_known_persons(entry):
     persons = {normalize(e[0]) for e in entities if e[1] == "PERSON"}
     return persons
 
-def evaluate_hallucination(entry):
-    summary = entry.get("summary", "")
-    known_persons = extract_known_persons(entry)
+def _entry_names(entry):
+    # Names the entry itself vouches for: its entities, key players and teams
+    names = [e[0] for e in entry.get("entities", []) if e[1] == "PERSON"]
+    names += entry.get("key_players", [])
+    names += [entry.get("home_team") or "", entry.get("away_team") or ""]
+    return names
+
+def find_hallucinated_spans(entry, fields=("summary",), index=None):
+    """
+    {field: [(start, end, text)]} of name mentions in each summary field
+    that neither the name index (default: empty, so only the entry's own
+    names count), the entry's raw_text nor its names support.
+    """
+    index = index or NameIndex()
+    source = index.source_index(entry.get("raw_text"))
+    names = _entry_names(entry)
+    return {f: index.find_unsupported(entry.get(f) or "", source, names) for f in fields}
+
+def evaluate_hallucination(entry, index=None, field="summary"):
+    spans = find_hallucinated_spans(entry, [field], index)[field]
+    return list({text for _, _, text in spans})
+
+def evaluate_dataset_hallucination(entries, fields=("summary",), index=None):
+    """
+    Per field: share of entries with at least one hallucinated name and the
+    mean number of hallucinated spans per entry.
+    """
+    flagged = Counter()
+    spans = Counter()
+    for entry in entries:
+        for f, found in find_hallucinated_spans(entry, fields, index).items():
+            flagged[f] += bool(found)
+            spans[f] += len(found)
 
-    # Simple regex to extract Capitalized Firstname Lastname in summary
-    candidate_names = re.findall(r"\b[A-Z][a-z]+ [A-Z][a-z]+\b", summary)
-    hallucinated = [name for name in candidate_names if normalize(name) not in known_persons]
-    return list(set(hallucinated))
+    n = len(entries)
+    return {f: {"rate": round(flagged[f]/n,4) if n else 0.0,
+                "spans_per_entry": round(spans[f]/n,4) if n else 0.0} for f in fields}
 
 
 # --------------------------------------------------
 # Full Evaluation Runner
 # --------------------------------------------------
 
-def run_full_evaluation(entries, verbose=True):
+def run_full_evaluation(entries, verbose=True, summary_fields=(), name_index=None):
+    """
+    summary_fields: further summary fields (e.g. hybrid_summary,
+    raw_summary) scored in the same ROUGE pass, reported under rouge_by_field
+    coverage_by_field and hallucination_by_field
+    name_index: optional season NameIndex of known teams and players
+    """
     report = {}
 
-    report["rouge"] = evaluate_rouge(entries)
-    report["coverage"] = evaluate_dataset_coverage(entries)
-
-    # Count entries with at least one hallucination
-    hallucinated_entries = sum(
-        1 for e in entries if evaluate_hallucination(e)
-    )
-
-    report["hallucination_rate"] = round(hallucinated_entries / len(entries), 4) if entries else 0.0
+    fields = ["summary"] + [f for f in summary_fields if f != "summary"]
+    rouge = evaluate_rouge_fields(entries, fields)
+    report["rouge"] = rouge["summary"]
+    if summary_fields:
+        report["rouge_by_field"] = {f: rouge[f] for f in summary_fields}
+    coverage = evaluate_coverage_fields(entries, fields)
+    report["coverage"] = coverage["summary"]
+    if summary_fields:
+        report["coverage_by_field"] = {f: coverage[f] for f in summary_fields}
+
+    # Share of entries with at least one hallucinated name
+    hallucination = evaluate_dataset_hallucination(entries, fields, name_index)
+    report["hallucination_rate"] = hallucination["summary"]["rate"]
+    if summary_fields:
+        report["hallucination_by_field"] = {f: hallucination[f] for f in summary_fields}
 
     if verbose:
         print("✔ Evaluation complete")
         print("ROUGE:", report["rouge"])
+        for field, scores in report.get("rouge_by_field", {}).items():
+            print(f"ROUGE ({field}):", scores)
         print("Coverage:", report["coverage"])
+        for field, scores in report.get("coverage_by_field", {}).items():
+            print(f"Coverage ({field}):", scores)
         print("Hallucination rate:", report["hallucination_rate"])
+        for field, scores in report.get("hallucination_by_field", {}).items():
+            print(f"Hallucination ({field}):", scores)
 
     return report
@@ -2,6 +2,10 @@
 # Program: EPL Match Scraper
 # Author: Terry Quach, B00919525, hn886911@dal.ca
 # Description: Scrapes Premier League match data including reports, stats, scorers, and cards.
+# With --workers N, several browser sessions scrape from a shared URL queue
+# under a global rate limit, with one thread writing to the match store.
+# A persistent crawl frontier makes reruns visit only new months and new or
+# previously failed matches.
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,12 +14,25 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
 
-import json
+import argparse
+import datetime
+import queue
+from contextlib import contextmanager
+import threading
 import time
 import random
 import os
 
+from utils.crawl_frontier import CrawlFrontier, DEFAULT_FRONTIER_PATH, match_id_from_url
+from utils.match_store import MatchStore, DEFAULT_STORE_PATH
+from utils.match_page import (
+    SCOREBOARD, SCOREBOARD_TEAM, TEAM_NAME, SCORE_HOME, SCORE_AWAY, HALF_TIME, GOALS, SCORER,
+    SCORER_MINUTE, YELLOW_CARDS, STATS_CONTAINER, STATS_TITLE, STATS_ROW, STAT_NAME,
+    STAT_PERCENTAGE, STAT_CELL, REPORT_BUTTON, REPORT_CONTENT, SNAPSHOT_PAGE, SNAPSHOT_REPORT,
+)
+
 # -------------------------------------------------------------------
 # HUMAN-LIKE WAITING
 # -------------------------------------------------------------------
@@ -23,33 +40,34 @@ def human_delay(min_sec=2, max_sec=5):
     time.sleep(random.uniform(min_sec, max_sec))
 
 # -------------------------------------------------------------------
-# JSON WRITING
+# MATCH STORE
 # -------------------------------------------------------------------
-def append_match_to_json(match_data, filename="premier_league_results.json"):
-    if os.path.exists(filename):
-        with open(filename, "r", encoding="utf-8") as f:
-            existing = json.load(f)
-    else:
-        existing = []
-    existing.append(match_data)
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(existing, f, indent=4, ensure_ascii=False)
-    print(f" Match written to {filename}")
+def save_match(store, url, match_data):
+    # One appended line per match instead of rewriting the results file
+    store.append_scraped(match_id_from_url(url), match_data)
+    print(f" Match written to {store.path}")
 
 # -------------------------------------------------------------------
 # CLICK PREVIOUS MONTH
 # -------------------------------------------------------------------
-def click_previous_month(driver):
+def click_previous_month(driver, fast=False):
     try:
         prev_btn = WebDriverWait(driver, 7).until(
             EC.element_to_be_clickable(
                 (By.CSS_SELECTOR, "div.match-list-header__button-container button[aria-label='Previous Month']")
             )
         )
+        old_cards = driver.find_elements(By.CSS_SELECTOR, "a[data-testid='matchCard']") if fast else []
         prev_btn.click()
-        return True
     except:
         return False
+    if old_cards:
+        # Ready once the previous month's cards have replaced the current ones
+        try:
+            WebDriverWait(driver, 15).until(EC.staleness_of(old_cards[0]))
+        except TimeoutException:
+            pass
+    return True
 
 # -------------------------------------------------------------------
 # OPEN TAB
@@ -73,36 +91,36 @@ def scrape_match_stats(driver):
     stats_data = {}
     try:
         wait.until(EC.presence_of_element_located(
-            (By.CSS_SELECTOR, "div[data-testid='matchStatsContainer']")
+            (By.CSS_SELECTOR, STATS_CONTAINER)
         ))
     except:
         return stats_data
 
-    containers = driver.find_elements(By.CSS_SELECTOR, "div[data-testid='matchStatsContainer']")
+    containers = driver.find_elements(By.CSS_SELECTOR, STATS_CONTAINER)
     for container in containers:
         try:
-            title = container.find_element(By.CSS_SELECTOR, ".match-stats__title").text.strip()
+            title = container.find_element(By.CSS_SELECTOR, STATS_TITLE).text.strip()
         except:
             continue
 
         stats_data[title] = []
-        rows = container.find_elements(By.CSS_SELECTOR, ".match-stats__table-row")
+        rows = container.find_elements(By.CSS_SELECTOR, STATS_ROW)
 
         for row in rows:
             try:
-                stat_name = row.find_element(By.CSS_SELECTOR, ".match-stats__stat-name").text.strip()
+                stat_name = row.find_element(By.CSS_SELECTOR, STAT_NAME).text.strip()
             except:
                 continue
             try:
-                home_val = row.find_element(By.CSS_SELECTOR, ".match-stats__stat-percentage--home").text.strip()
-                away_val = row.find_element(By.CSS_SELECTOR, ".match-stats__stat-percentage--away").text.strip()
+                home_val = row.find_element(By.CSS_SELECTOR, STAT_PERCENTAGE["home"]).text.strip()
+                away_val = row.find_element(By.CSS_SELECTOR, STAT_PERCENTAGE["away"]).text.strip()
             except:
                 try:
-                    home_val = row.find_element(By.CSS_SELECTOR, ".match-stats__table-cell--home").text.strip()
+                    home_val = row.find_element(By.CSS_SELECTOR, STAT_CELL["home"]).text.strip()
                 except:
                     home_val = None
                 try:
-                    away_val = row.find_element(By.CSS_SELECTOR, ".match-stats__table-cell--away").text.strip()
+                    away_val = row.find_element(By.CSS_SELECTOR, STAT_CELL["away"]).text.strip()
                 except:
                     away_val = None
             stats_data[title].append({"stat": stat_name, "home": home_val, "away": away_val})
@@ -116,11 +134,11 @@ def scrape_match_report(driver):
     report_text = ""
     try:
         report_btn = wait.until(EC.element_to_be_clickable(
-            (By.CSS_SELECTOR, "button[data-testid='matchReportInternal']")
+            (By.CSS_SELECTOR, REPORT_BUTTON)
         ))
         report_btn.click()
         full_report = wait.until(EC.presence_of_element_located(
-            (By.CSS_SELECTOR, "article[data-testid='matchReportInternalFull'] .temp-article__content")
+            (By.CSS_SELECTOR, REPORT_CONTENT)
         ))
         paragraphs = full_report.find_elements(By.TAG_NAME, "p")
         report_text = "\n".join([p.text.strip() for p in paragraphs if p.text.strip()])
@@ -132,69 +150,180 @@ def scrape_match_report(driver):
 # -------------------------------------------------------------------
 # SCRAPE SINGLE MATCH
 # -------------------------------------------------------------------
-def scrape_match(driver):
+def save_snapshot(driver, snapshot_dir, name):
+    # Rendered DOM, re-parsable offline by utils.match_page
+    with open(os.path.join(snapshot_dir, name), "w", encoding="utf-8") as f:
+        f.write(driver.page_source)
+
+
+def scrape_match(driver, snapshot_dir=None, fast=False, timer=None):
+    """
+    fast: read the scoreboard before opening the report instead of
+    reloading the page afterwards (falls back to a reload if the Stats tab
+    is then unreachable).
+    timer: optional PhaseTimer collecting the time of each page phase
+    """
+    timer = timer or PhaseTimer()
     wait = WebDriverWait(driver, 15)
-    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='scoreboardContainer']")))
-
-    match_report = scrape_match_report(driver)
-    driver.refresh()
-
-    teams = driver.find_elements(By.CSS_SELECTOR, "[data-testid='scoreboardHeaderTeam']")
-    home_team = teams[0].find_element(By.CSS_SELECTOR, ".scoreboard-header__team-name").text.strip()
-    away_team = teams[1].find_element(By.CSS_SELECTOR, ".scoreboard-header__team-name").text.strip()
-
-    home_score = driver.find_element(By.CSS_SELECTOR, ".match-status__score--home").text.strip()
-    away_score = driver.find_element(By.CSS_SELECTOR, ".match-status__score--away").text.strip()
+    with timer.phase("load"):
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, SCOREBOARD)))
+    match_id = match_id_from_url(driver.current_url) if snapshot_dir else None
+
+    if fast:
+        with timer.phase("scoreboard"):
+            scoreboard = scrape_scoreboard(driver)
+
+    with timer.phase("report"):
+        match_report = scrape_match_report(driver)
+    if snapshot_dir and match_report is not None:
+        with timer.phase("snapshot"):
+            save_snapshot(driver, snapshot_dir, SNAPSHOT_REPORT.format(match_id))
+
+    if not fast:
+        with timer.phase("refresh"):
+            driver.refresh()
+        with timer.phase("scoreboard"):
+            scoreboard = scrape_scoreboard(driver)
+
+    with timer.phase("stats"):
+        if not open_tab(driver, "Stats") and fast:
+            driver.refresh()
+            open_tab(driver, "Stats")
+        match_stats = scrape_match_stats(driver)
+    if snapshot_dir:
+        with timer.phase("snapshot"):
+            save_snapshot(driver, snapshot_dir, SNAPSHOT_PAGE.format(match_id))
+
+    return {**scoreboard, "stats": match_stats, "report": match_report}
+
+
+def scrape_scoreboard(driver):
+    teams = driver.find_elements(By.CSS_SELECTOR, SCOREBOARD_TEAM)
+    home_team = teams[0].find_element(By.CSS_SELECTOR, TEAM_NAME).text.strip()
+    away_team = teams[1].find_element(By.CSS_SELECTOR, TEAM_NAME).text.strip()
+
+    home_score = driver.find_element(By.CSS_SELECTOR, SCORE_HOME).text.strip()
+    away_score = driver.find_element(By.CSS_SELECTOR, SCORE_AWAY).text.strip()
 
     try:
-        ht_text = driver.find_element(By.CSS_SELECTOR, "[data-testid='matchStatusHalfTime']").text
+        ht_text = driver.find_element(By.CSS_SELECTOR, HALF_TIME).text
         ht_numbers = ht_text.replace("HT", "").strip().split("-")
         ht_home, ht_away = ht_numbers[0].strip(), ht_numbers[1].strip()
     except:
         ht_home, ht_away = None, None
 
     scorers = []
-    for team_label, team_name, selector in [("home", home_team, "[data-testid='homeTeamGoals'] li"),
-                                            ("away", away_team, "[data-testid='awayTeamGoals'] li")]:
-        for g in driver.find_elements(By.CSS_SELECTOR, selector):
-            scorer = g.find_element(By.CSS_SELECTOR, "[data-testid='scoreboardEventScorer']").text.strip()
-            minute = g.find_element(By.CSS_SELECTOR, "[data-testid='scoreboardEventScorer'] span").text.strip()
+    for team_label, team_name in [("home", home_team), ("away", away_team)]:
+        for g in driver.find_elements(By.CSS_SELECTOR, GOALS[team_label]):
+            scorer = g.find_element(By.CSS_SELECTOR, SCORER).text.strip()
+            minute = g.find_element(By.CSS_SELECTOR, SCORER_MINUTE).text.strip()
             scorers.append({"team": team_name, "player": scorer.replace(minute, "").strip(), "minute": minute})
 
     cards = []
-    for team_label, team_name, selector in [("home", home_team, "[data-testid='homeTeamYellowCards'] li"),
-                                            ("away", away_team, "[data-testid='awayTeamYellowCards'] li")]:
-        for c in driver.find_elements(By.CSS_SELECTOR, selector):
+    for team_label, team_name in [("home", home_team), ("away", away_team)]:
+        for c in driver.find_elements(By.CSS_SELECTOR, YELLOW_CARDS[team_label]):
             cards.append({"team": team_name, "event": c.text.strip()})
 
-    open_tab(driver, "Stats")
-    match_stats = scrape_match_stats(driver)
-
     return {"home_team": home_team, "away_team": away_team,
             "final_score": {"home": home_score, "away": away_score},
             "half_time_score": {"home": ht_home, "away": ht_away},
-            "scorers": scorers, "cards": cards, "stats": match_stats,
-            "report": match_report}
+            "scorers": scorers, "cards": cards}
+
+# -------------------------------------------------------------------
+# PERFORMANCE PROFILE
+# -------------------------------------------------------------------
+# Requests dropped in the fast profile: images, fonts, media and ad/analytics scripts
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*doubleclick.net*", "*googlesyndication.com*", "*googletagmanager.com*",
+    "*google-analytics.com*", "*facebook.net*", "*scorecardresearch.com*",
+    "*chartbeat*", "*optimizely*", "*hotjar*",
+]
+
+
+class PhaseTimer:
+    """Wall time per scraping phase, summed over matches and workers."""
+
+    def __init__(self):
+        self.totals = {}
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.totals[name] = self.totals.get(name, 0.0) + elapsed
+                self.counts[name] = self.counts.get(name, 0) + 1
+
+    def report(self):
+        total = sum(self.totals.values()) or 1.0
+        print(f" {'phase':12} {'count':>6} {'total s':>9} {'mean s':>8} {'share':>6}")
+        for name, secs in sorted(self.totals.items(), key=lambda kv: -kv[1]):
+            count = self.counts[name]
+            print(f" {name:12} {count:6d} {secs:9.1f} {secs / count:8.2f} {secs / total:6.1%}")
 
 # -------------------------------------------------------------------
 # SCRAPE ALL MATCHES
 # -------------------------------------------------------------------
-def scrape_premier_league_matches():
+LISTING_URL = "https://www.premierleague.com/en/matches?competition=8&season={season}&month={month}&team=7%2C91%2C3%2C94%2C36%2C90%2C8%2C31%2C11%2C54%2C2%2C14%2C43%2C1%2C4%2C17%2C56%2C6%2C21%2C39"
+
+
+def make_driver(fast=False):
+    """
+    fast: headless Chrome that skips images, media, fonts and ad/analytics
+    scripts, and returns from page loads at DOMContentLoaded.
+    """
     options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized")
+    if fast:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--mute-audio")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        # Waits below target the elements we read, so the full load is not needed
+        options.page_load_strategy = "eager"
+    else:
+        options.add_argument("--start-maximized")
     driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    wait = WebDriverWait(driver, 15)
+    if fast:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
 
-    MAIN_URL = "https://www.premierleague.com/en/matches?competition=8&season=2025&matchweek=15&month=12&team=7%2C91%2C3%2C94%2C36%2C90%2C8%2C31%2C11%2C54%2C2%2C14%2C43%2C1%2C4%2C17%2C56%2C6%2C21%2C39"
-    driver.get(MAIN_URL)
-    human_delay(5, 8)
 
+def accept_cookies(driver, timeout=15):
     try:
-        cookie_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept')]")))
+        cookie_btn = WebDriverWait(driver, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept')]")))
         cookie_btn.click()
         human_delay(2, 4)
+        return True
     except:
-        pass
+        return False
+
+
+def wait_for_match_list(driver, timeout=15):
+    return WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "div.match-list-root__content")))
+
+
+def open_match_list(driver, fast=False, month=None):
+    """Opens the listing at month ("2025-11", default: the current month)."""
+    driver.get(listing_url(month or current_month()))
+    if fast:
+        wait_for_match_list(driver)
+    else:
+        human_delay(5, 8)
+    accept_cookies(driver)
 
     try:
         actions = ActionChains(driver)
@@ -204,49 +333,379 @@ def scrape_premier_league_matches():
     except:
         pass
 
-    if not click_previous_month(driver):
-        print("No previous month found.")
-        driver.quit()
-        return
-    time.sleep(5)
+    try:
+        wait_for_match_list(driver)
+    except TimeoutException:
+        print("Match list did not load.")
+        return False
+    if not fast:
+        time.sleep(5)
+    return True
 
-    while True:
+
+def current_month_urls(driver, fast=False):
+    if not fast:
         human_delay(3, 5)
-        match_list_root = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.match-list-root__content")))
-        driver.execute_script("arguments[0].scrollTop = 0;", match_list_root)
+    match_list_root = wait_for_match_list(driver)
+    driver.execute_script("arguments[0].scrollTop = 0;", match_list_root)
+    if fast:
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "a[data-testid='matchCard']")))
+        except TimeoutException:
+            # Months without fixtures (June, July) list no cards
+            pass
+    else:
         human_delay(2, 4)
 
-        match_cards = driver.find_elements(By.CSS_SELECTOR, "a[data-testid='matchCard']")
-        print(f" Found {len(match_cards)} matches")
-        match_urls = [m.get_attribute("href") for m in match_cards][:1]
+    match_cards = driver.find_elements(By.CSS_SELECTOR, "a[data-testid='matchCard']")
+    print(f" Found {len(match_cards)} matches")
+    return [m.get_attribute("href") for m in match_cards]
+
+
+def current_month(today=None):
+    today = today or datetime.date.today()
+    return f"{today.year}-{today.month:02d}"
+
+
+def shift_month(month, delta):
+    """Listing month ("2025-11") delta months later (earlier when negative)."""
+    year, number = map(int, month.split("-"))
+    index = year * 12 + number - 1 + delta
+    return f"{index // 12}-{index % 12 + 1:02d}"
+
+
+def listing_url(month):
+    year, number = map(int, month.split("-"))
+    # A season runs August to May and is named after its first year
+    return LISTING_URL.format(season=year if number >= 7 else year - 1, month=number)
+
+
+def list_months(driver, fast=False, frontier=None, scraped=(), start=None):
+    """
+    Walks back month by month from start (default: the current month), so
+    months newer than any earlier run are listed first, yielding (month,
+    match URLs). With a frontier the listed URLs are recorded (IDs in
+    scraped as done) and the walk stops at the first month an earlier run
+    finished.
+    """
+    month = start or current_month()
+    if not open_match_list(driver, fast, month):
+        return
+    while True:
+        urls = current_month_urls(driver, fast)
+        if frontier is not None and frontier.add_month(month, urls, scraped):
+            print(f"{month} was already scraped; older months are too.")
+            return
+        yield month, urls
+        if not click_previous_month(driver, fast):
+            print("Finished listing all months.")
+            if frontier is not None:
+                frontier.mark_listed_to_end()
+            return
+        month = shift_month(month, -1)
+
+
+def collect_match_urls(driver, fast=False, frontier=None, scraped=()):
+    """Every match URL listed, walking back month by month."""
+    urls = []
+    for _, month_urls in list_months(driver, fast, frontier, scraped):
+        urls.extend(u for u in month_urls if u not in urls)
+    return urls
+
+
+def scrape_premier_league_matches(store_path=DEFAULT_STORE_PATH,
+                                  results_file="premier_league_results.json", snapshot_dir=None,
+                                  fast=False, timer=None):
+    store = MatchStore(store_path)
+    try:
+        store.seed(results_file)
+        _scrape_into(store, snapshot_dir, fast, timer or PhaseTimer())
+        # Existing consumers read the usual JSON layout. Not exported when
+        # the scrape raised; python -m utils.match_store export does it later
+        store.export(results_file)
+    finally:
+        store.close()
+
+
+def _scrape_into(store, snapshot_dir, fast, timer):
+    driver = make_driver(fast)
+
+    if not open_match_list(driver, fast):
+        driver.quit()
+        return
+
+    while True:
+        match_urls = current_month_urls(driver, fast)[:1]
+        # Matches already in the store never change after full time
+        match_urls = [u for u in match_urls if match_id_from_url(u) not in store]
         main_window = driver.current_window_handle
 
         for url in match_urls:
             driver.execute_script(f"window.open('{url}');")
-            human_delay(3, 6)
+            if not fast:
+                with timer.phase("delay"):
+                    human_delay(3, 6)
 
         for handle in driver.window_handles:
             if handle == main_window:
                 continue
             driver.switch_to.window(handle)
-            print(" Scraping:", driver.current_url)
+            url = driver.current_url
+            print(" Scraping:", url)
             try:
-                match_data = scrape_match(driver)
-                append_match_to_json(match_data)
+                match_data = scrape_match(driver, snapshot_dir, fast, timer)
+                with timer.phase("write"):
+                    save_match(store, url, match_data)
             except Exception as e:
                 print(" Error scraping match:", e)
             driver.close()
-            human_delay(2, 4)
+            with timer.phase("delay"):
+                human_delay(2, 4)
 
         driver.switch_to.window(main_window)
-        if not click_previous_month(driver):
+        if not click_previous_month(driver, fast):
             print("Finished scraping all months.")
             break
 
     driver.quit()
 
+# -------------------------------------------------------------------
+# PARALLEL SCRAPING
+# -------------------------------------------------------------------
+class RateLimiter:
+    """Spaces requests of all workers at least 60 / per_minute seconds apart."""
+
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.interval
+        time.sleep(start - now)
+
+
+def scrape_worker(worker_id, url_queue, results, limiter, driver_factory=make_driver,
+                  delay=(2, 5), retries=3, backoff=5.0, snapshot_dir=None, fast=False, timer=None):
+    """
+    Pulls match URLs until the queue is empty. Each page load waits for the
+    global rate limiter; WebDriverWait timeouts are retried with exponential
+    backoff. Results go to the writer as ("ok", url, match) or
+    ("failed", url, reason). A worker whose browser fails to start leaves
+    its URLs to the others.
+    """
+    timer = timer or PhaseTimer()
+    try:
+        driver = driver_factory()
+    except Exception as e:
+        print(f" [worker {worker_id}] browser failed to start: {type(e).__name__}: {e}")
+        return
+    first = True
+    try:
+        while True:
+            try:
+                url = url_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            for attempt in range(retries + 1):
+                try:
+                    with timer.phase("rate limit"):
+                        limiter.wait()
+                    with timer.phase("get"):
+                        driver.get(url)
+                    if first:
+                        accept_cookies(driver, timeout=5)
+                        first = False
+                    results.put(("ok", url, scrape_match(driver, snapshot_dir, fast, timer)))
+                    break
+                except TimeoutException:
+                    if attempt == retries:
+                        results.put(("failed", url, f"timeout after {retries + 1} attempts"))
+                        break
+                    wait = backoff * 2 ** attempt + random.uniform(0, 1)
+                    print(f" [worker {worker_id}] timeout on {url}, retry in {wait:.1f}s")
+                    time.sleep(wait)
+                except Exception as e:
+                    results.put(("failed", url, f"{type(e).__name__}: {e}"))
+                    break
+
+            # Per-worker politeness delay
+            with timer.phase("delay"):
+                human_delay(*delay)
+    finally:
+        driver.quit()
+
+
+def write_results(store, results, stats, frontier=None):
+    """Single writer: the only thread touching the match store and frontier."""
+    while True:
+        item = results.get()
+        if item is None:
+            return
+        status, url, payload = item
+        if status == "ok":
+            save_match(store, url, payload)
+            stats["scraped"] += 1
+            if frontier is not None:
+                frontier.mark_done(url)
+        else:
+            print(f" Error scraping {url}: {payload}")
+            stats["failed"] += 1
+            if frontier is not None:
+                frontier.mark_failed(url, payload)
+
+
+def scrape_parallel(urls, store, workers=4, rate_per_minute=30, delay=(2, 5), retries=3,
+                    backoff=5.0, driver_factory=None, snapshot_dir=None, fast=False, timer=None,
+                    frontier=None):
+    """
+    Scrapes match URLs with N browser workers sharing one queue and one
+    rate limit, funnelling results to a single store writer, which also
+    records each outcome in the frontier when one is given.
+    Returns {"scraped", "failed", "seconds", "per_minute"}.
+    """
+    driver_factory = driver_factory or (lambda: make_driver(fast))
+    timer = timer or PhaseTimer()
+    url_queue = queue.Queue()
+    for url in urls:
+        if match_id_from_url(url) not in store:
+            url_queue.put(url)
+
+    results = queue.Queue()
+    limiter = RateLimiter(rate_per_minute)
+    stats = {"scraped": 0, "failed": 0}
+
+    start = time.perf_counter()
+    writer = threading.Thread(target=write_results, args=(store, results, stats, frontier))
+    writer.start()
+    threads = [
+        threading.Thread(target=scrape_worker,
+                         args=(i, url_queue, results, limiter, driver_factory, delay, retries, backoff,
+                               snapshot_dir, fast, timer))
+        for i in range(max(1, min(workers, url_queue.qsize())))
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # Left over only when no worker could start a browser
+    while True:
+        try:
+            url = url_queue.get_nowait()
+        except queue.Empty:
+            break
+        results.put(("failed", url, "no browser worker started"))
+    results.put(None)
+    writer.join()
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["per_minute"] = 60.0 * stats["scraped"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+# -------------------------------------------------------------------
+# INCREMENTAL CRAWL
+# -------------------------------------------------------------------
+def scrape_incremental(store, frontier, urls=None, retry_only=False, workers=1, rate_per_minute=30,
+                       snapshot_dir=None, fast=False, timer=None):
+    """
+    Lists months until the first one an earlier run finished, then scrapes
+    the new matches plus every match still pending or failed in the frontier.
+    urls: scrape these instead of listing the site
+    retry_only: skip listing and retry only previously failed matches
+    """
+    if retry_only:
+        todo = frontier.failed_urls()
+    elif urls is not None:
+        todo = frontier.todo(urls)
+    else:
+        lister = make_driver(fast)
+        try:
+            collect_match_urls(lister, fast, frontier, store)
+        finally:
+            lister.quit()
+        todo = frontier.todo()
+
+    # Matches scraped before the frontier existed only need recording
+    for url in todo:
+        if match_id_from_url(url) in store:
+            frontier.mark_done(url)
+    todo = [u for u in todo if match_id_from_url(u) not in store]
+    print(f" {len(todo)} matches to scrape")
+
+    try:
+        return scrape_parallel(todo, store, workers=workers, rate_per_minute=rate_per_minute,
+                               snapshot_dir=snapshot_dir, fast=fast, timer=timer, frontier=frontier)
+    finally:
+        frontier.settle_months()
+
 # -------------------------------------------------------------------
 # RUN SCRIPT
 # -------------------------------------------------------------------
+def parse_args():
+    parser = argparse.ArgumentParser(description="Premier League match scraper")
+    parser.add_argument("--workers", type=int, default=1, help="concurrent browser sessions")
+    parser.add_argument("--rate", type=float, default=30,
+                        help="global limit on match page loads per minute (0 = no limit)")
+    parser.add_argument("--urls", help="file with one match URL per line instead of listing the site")
+    parser.add_argument("--store", default=DEFAULT_STORE_PATH, help="append-only match store")
+    parser.add_argument("--output", default="premier_league_results.json",
+                        help="results file exported when scraping ends")
+    parser.add_argument("--fast", action="store_true",
+                        help="headless Chrome without images/media/ad scripts, no page reload per "
+                             "match, and element waits instead of fixed sleeps while loading")
+    parser.add_argument("--snapshots",
+                        help="directory to save each match page's rendered HTML in, for "
+                             "re-extraction with python -m utils.match_page")
+    parser.add_argument("--frontier", default=DEFAULT_FRONTIER_PATH,
+                        help="crawl frontier recording listed months and scraped/failed matches")
+    parser.add_argument("--no-frontier", action="store_true",
+                        help="original crawl of every month, without a frontier")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="only retry the matches that failed in earlier runs")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    scrape_premier_league_matches()
+    args = parse_args()
+    timer = PhaseTimer()
+    if args.snapshots:
+        os.makedirs(args.snapshots, exist_ok=True)
+    urls = None
+    if args.urls:
+        with open(args.urls, "r", encoding="utf-8") as f:
+            urls = [line.strip() for line in f if line.strip()]
+
+    if args.no_frontier and args.workers <= 1 and not args.urls:
+        scrape_premier_league_matches(args.store, args.output, args.snapshots, args.fast, timer)
+    else:
+        store = MatchStore(args.store)
+        frontier = None if args.no_frontier else CrawlFrontier(args.frontier)
+        try:
+            store.seed(args.output)
+            if frontier is not None:
+                stats = scrape_incremental(store, frontier, urls, args.retry_failed, args.workers,
+                                           args.rate, args.snapshots, args.fast, timer)
+            else:
+                if urls is None:
+                    lister = make_driver(args.fast)
+                    try:
+                        urls = collect_match_urls(lister, args.fast)
+                    finally:
+                        lister.quit()
+                stats = scrape_parallel(urls, store, workers=args.workers, rate_per_minute=args.rate,
+                                        snapshot_dir=args.snapshots, fast=args.fast, timer=timer)
+            print(f" Scraped {stats['scraped']} matches ({stats['failed']} failed) "
+                  f"in {stats['seconds']:.0f}s: {stats['per_minute']:.1f} matches/min")
+            if frontier is not None:
+                print(f" Frontier: {frontier.stats()}")
+            store.export(args.output)
+        finally:
+            store.close()
+            if frontier is not None:
+                frontier.close()
+    timer.report()
@@ -7,15 +7,44 @@
 
 
 import json
+import os
+from collections import Counter
 from epl_evaluation import run_full_evaluation
+from nlp.gazetteer import Gazetteer
+from nlp.name_index import NameIndex, report_mentions
+from utils.file_helpers import load_records, iter_json_records
 
-# Load processed dataset
-with open("output/test_processed.json", "r", encoding="utf-8") as f:
-    entries = json.load(f)
+SUMMARY_FIELDS = ("hybrid_summary", "raw_summary", "template_summary")
 
-# Run evaluation
-report = run_full_evaluation(entries, verbose=True)
 
-# Optionally save report
-with open("output/evaluation_report.json", "w", encoding="utf-8") as f:
-    json.dump(report, f, indent=4)
+def main():
+    # Load processed dataset: the JSONL written by main.py --stream (readable
+    # while the pipeline is still appending to it) or the JSON file
+    path = "output/test_processed.jsonl"
+    if not os.path.exists(path):
+        path = "output/test_processed.json"
+    entries = load_records(path)
+
+    # Summary fields scored side by side, when the processed data has them
+    fields = [f for f in SUMMARY_FIELDS if any(f in e for e in entries)]
+
+    # Season-wide teams, players and recurring report mentions (venues,
+    # nicknames), so hallucination checks accept any known name
+    name_index = None
+    if os.path.exists("premier_league_results.json"):
+        season = list(iter_json_records("premier_league_results.json"))
+        mentions = Counter()
+        for entry in season:
+            mentions.update(report_mentions(entry.get("report")))
+        name_index = NameIndex.from_gazetteer(Gazetteer.from_entries(season), mentions)
+
+    # Run evaluation
+    report = run_full_evaluation(entries, verbose=True, summary_fields=fields, name_index=name_index)
+
+    # Optionally save report
+    with open("output/evaluation_report.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,28 +6,44 @@
 # event extraction, and saving processed results.
 
 
+import argparse
+import itertools
 import json
-from sklearn.model_selection import train_test_split
+import multiprocessing
+import os
+from collections import Counter, deque
+from functools import partial
 
 # --- NLP modules ---
-from nlp.summarization import hybrid_summary, summarize_text
-from nlp.entities import extract_entities
+from nlp.summarization import hybrid_summary, summarize_text, summarize_entries, DEFAULT_BATCH_SIZE
+from nlp.summarization import configure_cache
+from nlp.cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_ENTRIES
+from nlp.resources import resources
+from nlp.backends import BACKENDS, DEFAULT_BACKEND
+from nlp.document import ParsedReport
+from nlp.entities import extract_entities, use_gazetteer
+from nlp.gazetteer import Gazetteer
+from nlp.name_index import NameIndex, use_name_index, check_summaries, report_mentions
 from nlp.events import extract_events
 
 # --- Analysis modules ---
-from analysis.injuries import detect_injuries, attach_players_to_injuries
+from analysis.injuries import detect_injuries, attach_players_to_injuries, load_injury_lexicon
 from analysis.narrative import classify_match
 from analysis.players import detect_key_players
+from analysis.record import MatchRecord
 
 # --- Templates ---
 from templates.match_template import build_template_summary
 
 # --- Utilities ---
 from utils.logging_helpers import log_done
-from utils.file_helpers import save_json
+from utils.file_helpers import save_json, iter_json_records, JsonlWriter
+from utils.manifest import ProcessingManifest, match_digest, match_fingerprint, file_digest
+from utils.manifest import DEFAULT_MANIFEST_PATH
+from utils.metrics import metrics, summarize, print_summary, DEFAULT_PROFILE_PATH
 
 
-def process_entry(entry):
+def process_entry(entry, summaries=None, report=None):
     """
     Process a single match entry:
     - Extract entities
@@ -36,31 +52,60 @@ def process_entry(entry):
     - Detect key players
     - Extract events
     - Build hybrid + raw summaries
+    summaries: optional precomputed (hybrid, raw) pair from summarize_entries
+    report: optional ParsedReport of the entry, parsed once and shared by all stages
+    entry: MatchRecord or scraped match dict
     """
-    raw_text = entry.get("report", "")
-    entities = extract_entities(raw_text)
+    entry = MatchRecord.of(entry)
+    with metrics.record("match", entry.match):
+        result = _process_record(entry, summaries, report)
+    log_done(result["match"], result["match_type"], injuries=bool(result["injuries"]))
+    return result
+
+
+def _process_record(entry, summaries, report):
+    """Stages of process_entry, each timed when metrics are enabled."""
+    stage = metrics.stage
+    raw_text = entry.report
+    if report is None:
+        report = ParsedReport(raw_text)
+    if metrics.enabled:
+        metrics.count("sentences", len(report.sentence_spans))
+        metrics.count("paragraphs", len(report.paragraphs))
+
+    with stage("ner"):
+        entities = extract_entities(report)
 
     # Injuries
-    injury_sents = detect_injuries(raw_text)
-    injuries = attach_players_to_injuries(injury_sents, entities)
+    with stage("injuries"):
+        injury_sents = detect_injuries(report)
+        injuries = attach_players_to_injuries(injury_sents, entities)
 
     # Key players
-    key_players = detect_key_players(entry)
+    with stage("key_players"):
+        key_players = detect_key_players(entry)
 
     # Hybrid summary
-    summary_hybrid = hybrid_summary(entry)
-    summary_raw = summarize_text(raw_text)
+    if summaries is None:
+        with stage("hybrid_summary"):
+            summary_hybrid = hybrid_summary(entry)
+        with stage("raw_summary"):
+            summary_raw = summarize_text(report)
+    else:
+        summary_hybrid, summary_raw = summaries
 
     # Events
-    events = extract_events(raw_text)
+    with stage("events"):
+        events = extract_events(report, players=[e[0] for e in entities if e[1] == "PERSON"])
 
     # Match narrative
-    match_type = classify_match(entry)
+    with stage("narrative"):
+        match_type = classify_match(entry)
 
-    result = {
-        "match": f"{entry['home_team']} vs {entry['away_team']}",
-        "home_team": entry["home_team"],
-        "away_team": entry["away_team"],
+    return {
+        "match": entry.match,
+        "home_team": entry.home_team,
+        "away_team": entry.away_team,
         "match_type": match_type,
         "key_players": key_players,
         "injuries": injuries,
@@ -70,36 +115,369 @@ def process_entry(entry):
         "raw_text": raw_text,  # Needed for evaluation
     }
 
-    log_done(result["match"], match_type, injuries=bool(injuries))
+
+def add_hallucinations(result):
+    """
+    Adds the name mentions of a processed match's summaries that neither
+    the season index (use_name_index) nor its report supports. Run on the
+    merged results in the main process: the season index changes as
+    matches are added, so this stays out of the per-match (cached) result.
+    """
+    result["hallucinations"] = check_summaries(
+        {"hybrid_summary": result["hybrid_summary"], "raw_summary": result["raw_summary"]},
+        source=result["raw_text"],
+        names=result["key_players"] + [result["home_team"], result["away_team"]],
+    )
     return result
 
 
-def main(json_file="premier_league_results.json", test_size=0.1, random_state=42):
+def _process_window(window, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Processes one window of entries, batching their BART calls together.
+    """
+    window = [MatchRecord.of(e) for e in window]
+    reports = [ParsedReport(e.report) for e in window]
+    if batch_size <= 1:
+        return [process_entry(e, report=r) for e, r in zip(window, reports)]
+
+    with metrics.record("window", f"{len(window)} matches"), metrics.stage("summarize_batch"):
+        summaries = summarize_entries(window, batch_size=batch_size, reports=reports)
+    return [process_entry(e, s, r) for e, s, r in zip(window, summaries, reports)]
+
+
+def process_entries(entries, batch_size=DEFAULT_BATCH_SIZE, pool=None):
+    """
+    Processes many match entries, batching the BART calls of every
+    batch_size matches together. batch_size=1 keeps the per-call path.
+    When a worker pool is given, windows are spread across its processes;
+    results keep the input order and match the serial path.
+    """
+    return list(iter_processed(entries, batch_size=batch_size, pool=pool))
+
+
+def iter_processed(entries, batch_size=DEFAULT_BATCH_SIZE, pool=None, max_pending=None):
+    """
+    Generator form of process_entries: takes entries from any iterable and
+    yields each result, in input order, as soon as its window is done.
+    max_pending: with a pool, how many windows may be in flight at once
+    (None = no limit); bounding it keeps memory flat on long inputs.
+    """
+    entries = iter(entries)
+    size = max(1, batch_size)
+    windows = iter(lambda: list(itertools.islice(entries, size)), [])
+    work = partial(_process_window, batch_size=batch_size)
+
+    if pool is None:
+        for window in windows:
+            yield from work(window)
+        return
+
+    pending = deque()
+    for window in windows:
+        pending.append(pool.apply_async(work, (window,)))
+        if max_pending and len(pending) >= max_pending:
+            yield from pending.popleft().get()
+    while pending:
+        yield from pending.popleft().get()
+
+
+def iter_incremental(records, manifest, settings=None, batch_size=DEFAULT_BATCH_SIZE, pool=None,
+                     max_pending=None):
+    """
+    Like iter_processed, but matches whose fingerprint is already in the
+    manifest are served from it; only new or changed matches are processed,
+    and each fresh result is stored as soon as it is done. Results keep the
+    input order.
+    """
+    # (fingerprint, match digest, needs processing) per input record, in order
+    slots = deque()
+    queued = set()
+
+    def new_records():
+        for record in records:
+            digest = match_digest(record)
+            fingerprint = match_fingerprint(record, settings, digest)
+            new = fingerprint not in manifest and fingerprint not in queued
+            slots.append((fingerprint, digest, new))
+            if new:
+                queued.add(fingerprint)
+                yield record
+
+    def stored():
+        while slots and not slots[0][2]:
+            yield manifest.get(slots.popleft()[0])
+
+    for result in iter_processed(new_records(), batch_size=batch_size, pool=pool,
+                                 max_pending=max_pending):
+        yield from stored()
+        fingerprint, digest, _ = slots.popleft()
+        manifest.add(fingerprint, result, digest)
+        yield result
+    yield from stored()
+
+
+def _init_worker(threads, cache_path, cache_size, injury_lexicon=None, gazetteer=None,
+                 metrics_settings=None, backend=DEFAULT_BACKEND, model_name=None):
+    """
+    Pool initializer: loads the BART pipeline (the parent's model, with the
+    given backend) and NLTK resources once per worker process, splits the
+    CPU cores between workers and opens the shared summary cache.
+    metrics_settings (path, memory) makes the worker append its metrics
+    records to the run's metrics file.
+    """
+    if model_name and model_name != resources.model_name:
+        resources.use_model(model_name)
+    resources.use_backend(backend, threads)
+    resources.nltk("punkt", "tagger", "ne_chunker", "words")
+    resources.summarizer()
+
+    configure_cache(cache_path, cache_size)
+    if injury_lexicon:
+        load_injury_lexicon(injury_lexicon)
+    if gazetteer is not None:
+        use_gazetteer(gazetteer)
+    if metrics_settings:
+        path, memory = metrics_settings
+        metrics.configure(path, memory, truncate=False)
+
+
+def start_pool(workers, cache_path=None, cache_size=DEFAULT_MAX_ENTRIES, injury_lexicon=None,
+               gazetteer=None, metrics_settings=None, backend=DEFAULT_BACKEND):
+    """
+    Starts a pool of worker processes, each holding its own model copy.
+    """
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    ctx = multiprocessing.get_context("spawn")
+    return ctx.Pool(workers, initializer=_init_worker,
+                    initargs=(threads, cache_path, cache_size, injury_lexicon, gazetteer,
+                              metrics_settings, backend, resources.model_name))
+
+
+def main(json_file="premier_league_results.json", test_size=0.1, random_state=42,
+         batch_size=DEFAULT_BATCH_SIZE, workers=1,
+         cache_path=DEFAULT_CACHE_PATH, cache_size=DEFAULT_MAX_ENTRIES, injury_lexicon=None,
+         fast_ner=False, extra_names=None, stream=False, flush_every=10,
+         manifest_path=DEFAULT_MANIFEST_PATH, compact_manifest=False, metrics_path=None,
+         metrics_memory=False, profile=None, profile_path=DEFAULT_PROFILE_PATH,
+         backend=DEFAULT_BACKEND, threads=None):
     """
     Main orchestrator:
-    - Loads raw data
+    - Loads raw data into MatchRecords
     - Splits into train/test
     - Processes each entry
     - Saves processed JSON files
+    cache_path=None disables the persistent summary cache.
+    injury_lexicon: optional JSON file of extra injury phrases
+    fast_ner: match a season gazetteer first and only chunk unmatched sentences
+    extra_names: optional JSON file of {label: [names]} added to the gazetteer
+    and to the name index used to flag hallucinated names
+    stream: read json_file (JSON or JSONL) lazily and append each result to
+    train/test_processed.jsonl as soon as it is done, flushing every
+    flush_every results, instead of holding everything in memory
+    manifest_path: JSONL of processed results keyed by match fingerprint
+    (the match's own inputs and the run settings); only new or changed
+    matches are processed and an interrupted run resumes from it. None
+    reprocesses everything. Results superseded under newer settings are
+    dropped after each run; compact_manifest also drops matches not in
+    json_file. Fast NER results are reused as first computed, with that
+    run's season gazetteer.
+    metrics_path: JSONL file of per-match stage timings and counters,
+    summarized as percentiles at the end; metrics_memory adds tracemalloc
+    peaks per stage. profile: (start, stop) slice of processed matches to
+    capture with cProfile into profile_path (matches processed in this
+    process, so use workers=1).
+    backend: summarizer backend (transformers, int8, onnx; see nlp.backends)
+    threads: intra-op threads for the summarizer in this process (None =
+    library default); pool workers split the CPU cores between them
     """
-    with open(json_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # Imported here so tools importing this module skip sklearn's startup cost
+    from sklearn.model_selection import train_test_split
 
-    train_data, test_data = train_test_split(
-        data, test_size=test_size, random_state=random_state, shuffle=True
-    )
+    resources.use_backend(backend, threads)
+    cache = configure_cache(cache_path, cache_size)
+    if metrics_path or profile:
+        metrics.configure(metrics_path or os.devnull, metrics_memory, profile, profile_path)
+    if profile and workers > 1:
+        print("Profiling only covers matches processed in the main process; use --workers 1")
+    if injury_lexicon:
+        load_injury_lexicon(injury_lexicon)
+
+    # Season names: the fast NER gazetteer and the hallucination name index,
+    # which also knows the capitalized mentions recurring across reports
+    gazetteer = Gazetteer()
+    mentions = Counter()
 
-    print(f"Training entries: {len(train_data)}")
-    print(f"Testing entries: {len(test_data)}\n")
+    if stream:
+        # First pass only counts matches (and collects season names) so the
+        # split can be drawn on indices; it selects the same matches as the
+        # in-memory split, which only depends on the count and random_state.
+        count = 0
+        for entry in iter_json_records(json_file):
+            count += 1
+            gazetteer.add_entry(entry)
+            mentions.update(report_mentions(entry.get("report")))
+        _, test_indices = train_test_split(
+            range(count), test_size=test_size, random_state=random_state, shuffle=True
+        )
+        test_indices = set(test_indices)
+        train_count, test_count = count - len(test_indices), len(test_indices)
+    else:
+        with open(json_file, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        for entry in raw:
+            gazetteer.add_entry(entry)
+            mentions.update(report_mentions(entry.get("report")))
+        data = [MatchRecord.from_dict(e) for e in raw]
+        del raw
 
-    processed_train = [process_entry(e) for e in train_data]
-    processed_test = [process_entry(e) for e in test_data]
+        train_data, test_data = train_test_split(
+            data, test_size=test_size, random_state=random_state, shuffle=True
+        )
+        train_count, test_count = len(train_data), len(test_data)
 
-    save_json(processed_train, "train_processed.json")
-    save_json(processed_test, "test_processed.json")
+    if extra_names:
+        with open(extra_names, "r", encoding="utf-8") as f:
+            gazetteer.add_extra(json.load(f))
+    name_index = NameIndex.from_gazetteer(gazetteer, mentions)
+    use_name_index(name_index)
+    print(f"Season names: {len(gazetteer)}")
+    if fast_ner:
+        use_gazetteer(gazetteer)
+    else:
+        gazetteer = None
+
+    print(f"Training entries: {train_count}")
+    print(f"Testing entries: {test_count}\n")
+
+    manifest = ProcessingManifest(manifest_path) if manifest_path else None
+    settings = {
+        "model": resources.model_tag,
+        "fast_ner": bool(fast_ner),
+        "extra_names": file_digest(extra_names),
+        "injury_lexicon": file_digest(injury_lexicon),
+    }
+
+    def run(records, max_pending=None):
+        if manifest is None:
+            results = iter_processed(records, batch_size=batch_size, pool=pool,
+                                     max_pending=max_pending)
+        else:
+            results = iter_incremental(records, manifest, settings, batch_size=batch_size,
+                                       pool=pool, max_pending=max_pending)
+        return map(add_hallucinations, results)
+
+    pool = None
+    if workers > 1:
+        pool = start_pool(workers, cache_path, cache_size, injury_lexicon, gazetteer,
+                          metrics.worker_settings() if metrics_path else None, backend)
+    try:
+        if stream:
+            records = (MatchRecord.from_dict(e) for e in iter_json_records(json_file))
+            with JsonlWriter("train_processed.jsonl", flush_every) as train_out, \
+                    JsonlWriter("test_processed.jsonl", flush_every) as test_out:
+                for i, result in enumerate(run(records, max_pending=2 * workers)):
+                    (test_out if i in test_indices else train_out).write(result)
+        else:
+            results = list(run(train_data + test_data))
+            processed_train, processed_test = results[:train_count], results[train_count:]
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    if not stream:
+        save_json(processed_train, "train_processed.json")
+        save_json(processed_test, "test_processed.json")
+
+    if manifest is not None:
+        print(f"Manifest: {manifest.stats()}")
+        if compact_manifest:
+            manifest.compact()
+        else:
+            manifest.drop_superseded()
+        manifest.close()
+
+    if cache is not None and pool is None:
+        print(f"Summary cache: {cache.stats()}")
+
+    if metrics.enabled:
+        metrics.close()
+        if metrics_path:
+            print(f"\nStage metrics ({metrics_path}):")
+            print_summary(summarize(metrics_path))
 
     print("\n🏁 All matches summarized successfully.")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="EPL summarization pipeline")
+    parser.add_argument("--input", default="premier_league_results.json",
+                        help="scraped match results JSON file")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="summarizer batch size (1 = one BART call per input)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes (1 = run in this process)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH,
+                        help="SQLite file caching summarizer outputs between runs")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_ENTRIES,
+                        help="maximum cached summaries before LRU eviction")
+    parser.add_argument("--no-cache", action="store_true", help="disable the summary cache")
+    parser.add_argument("--injury-lexicon",
+                        help='JSON file of extra injury phrases: {"triggers": [...], "medical": [...], '
+                             '"substitution": [...]}')
+    parser.add_argument("--fast-ner", action="store_true",
+                        help="gazetteer-first NER seeded from the teams and players in --input")
+    parser.add_argument("--extra-names",
+                        help='JSON file of extra gazetteer names, e.g. {"PERSON": ["Arne Slot"]}')
+    parser.add_argument("--stream", action="store_true",
+                        help="read --input (JSON or JSONL) lazily and append results to "
+                             "train/test_processed.jsonl as they finish")
+    parser.add_argument("--flush-every", type=int, default=10,
+                        help="with --stream, flush the JSONL outputs every N results")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST_PATH,
+                        help="JSONL of results keyed by match fingerprint; reruns only "
+                             "process new or changed matches and resume interrupted runs")
+    parser.add_argument("--no-manifest", action="store_true",
+                        help="reprocess every match")
+    parser.add_argument("--compact-manifest", action="store_true",
+                        help="after the run, keep only this run's results in the manifest "
+                             "(drops matches not in --input)")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, choices=sorted(BACKENDS),
+                        help="summarizer backend: transformers (fp32), int8 (dynamic "
+                             "quantization) or onnx (ONNX Runtime, needs optimum)")
+    parser.add_argument("--threads", type=int,
+                        help="intra-op threads for the summarizer with --workers 1")
+    parser.add_argument("--metrics",
+                        help="JSONL file of per-match stage timings and counters, "
+                             "summarized as percentiles at the end of the run")
+    parser.add_argument("--metrics-memory", action="store_true",
+                        help="with --metrics, also record tracemalloc peak memory per stage")
+    parser.add_argument("--profile", type=profile_slice, metavar="START:STOP",
+                        help="cProfile the matches START..STOP-1 of this run (use --workers 1)")
+    parser.add_argument("--profile-output", default=DEFAULT_PROFILE_PATH,
+                        help="pstats file written by --profile")
+    return parser.parse_args()
+
+
+def profile_slice(value):
+    start, _, stop = value.partition(":")
+    try:
+        start, stop = int(start or 0), int(stop)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected START:STOP, e.g. 0:20")
+    if not 0 <= start < stop:
+        raise argparse.ArgumentTypeError("expected 0 <= START < STOP")
+    return start, stop
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(args.input, batch_size=args.batch_size, workers=args.workers,
+         cache_path=None if args.no_cache else args.cache, cache_size=args.cache_size,
+         injury_lexicon=args.injury_lexicon, fast_ner=args.fast_ner, extra_names=args.extra_names,
+         stream=args.stream, flush_every=args.flush_every,
+         manifest_path=None if args.no_manifest else args.manifest,
+         compact_manifest=args.compact_manifest,
+         metrics_path=args.metrics, metrics_memory=args.metrics_memory,
+         profile=args.profile, profile_path=args.profile_output,
+         backend=args.backend, threads=args.threads)
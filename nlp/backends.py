@@ -0,0 +1,139 @@
+# CSCI4152/6509 Fall 2025
+# Program: Summarizer Backends
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Interchangeable ways of running the BART summarizer on CPU:
+# the plain transformers pipeline (fp32), PyTorch dynamic int8 quantization
+# of its Linear layers, and an ONNX Runtime encoder-decoder export. Every
+# backend returns a transformers summarization pipeline, so hybrid_summary,
+# summarize_text and BatchSummarizer work unchanged on top of any of them.
+
+import importlib
+import os
+import re
+
+DEFAULT_BACKEND = "transformers"
+DEFAULT_ONNX_DIR = "onnx_models"
+
+
+class TransformersBackend:
+    """
+    fp32 PyTorch model in a transformers pipeline. threads sets the
+    intra-op thread count of this process (None keeps torch's default).
+    """
+
+    name = "transformers"
+
+    def __init__(self, threads=None):
+        self.threads = threads
+
+    def tag(self, model_name):
+        """Model name used in cache keys; differs per backend, since outputs may."""
+        return model_name if self.name == DEFAULT_BACKEND else f"{model_name}+{self.name}"
+
+    def load(self, model_name):
+        tokenizer = self._tokenizer(model_name)
+        model = self._load_model(model_name)
+        return self._pipeline(model, tokenizer, model_name)
+
+    def _load_model(self, model_name):
+        from transformers import AutoModelForSeq2SeqLM
+
+        self._set_torch_threads()
+        try:
+            model = AutoModelForSeq2SeqLM.from_pretrained(model_name, local_files_only=True)
+        except OSError as e:
+            raise _missing_model(model_name) from e
+        return model.eval()
+
+    def _tokenizer(self, model_name):
+        from transformers import AutoTokenizer
+
+        try:
+            return AutoTokenizer.from_pretrained(model_name, local_files_only=True)
+        except OSError as e:
+            raise _missing_model(model_name) from e
+
+    def _pipeline(self, model, tokenizer, model_name):
+        from transformers import pipeline
+
+        pipe = pipeline("summarization", model=model, tokenizer=tokenizer)
+        # Read by model_name_of, so cached summaries never mix backends
+        pipe.model_tag = self.tag(model_name)
+        return pipe
+
+    def _set_torch_threads(self):
+        if self.threads:
+            import torch
+            torch.set_num_threads(self.threads)
+
+
+class Int8Backend(TransformersBackend):
+    """
+    The transformers model with its Linear layers converted to int8 by
+    torch dynamic quantization; activations are quantized on the fly.
+    """
+
+    name = "int8"
+
+    def _load_model(self, model_name):
+        import torch
+
+        model = super()._load_model(model_name)
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class OnnxBackend(TransformersBackend):
+    """
+    ONNX Runtime encoder-decoder (with past key values) through optimum.
+    The model is exported once into export_dir/<model name> and reused;
+    threads sets the session's intra-op thread count.
+    Needs: pip install optimum[onnxruntime]
+    """
+
+    name = "onnx"
+
+    def __init__(self, threads=None, export_dir=DEFAULT_ONNX_DIR):
+        super().__init__(threads)
+        self.export_dir = export_dir
+
+    def _load_model(self, model_name):
+        try:
+            onnxruntime = importlib.import_module("onnxruntime")
+            ort_models = importlib.import_module("optimum.onnxruntime")
+        except ImportError as e:
+            raise ImportError("The onnx backend needs optimum and onnxruntime: "
+                              "pip install optimum[onnxruntime]") from e
+
+        options = onnxruntime.SessionOptions()
+        if self.threads:
+            options.intra_op_num_threads = self.threads
+
+        path = os.path.join(self.export_dir, re.sub(r"[^\w.-]+", "--", model_name))
+        if os.path.exists(os.path.join(path, "config.json")):
+            return ort_models.ORTModelForSeq2SeqLM.from_pretrained(path, session_options=options)
+
+        try:
+            model = ort_models.ORTModelForSeq2SeqLM.from_pretrained(
+                model_name, export=True, local_files_only=True, session_options=options)
+        except OSError as e:
+            raise _missing_model(model_name) from e
+        model.save_pretrained(path)
+        return model
+
+
+BACKENDS = {backend.name: backend for backend in (TransformersBackend, Int8Backend, OnnxBackend)}
+
+
+def get_backend(name=DEFAULT_BACKEND, threads=None):
+    try:
+        return BACKENDS[name](threads)
+    except KeyError:
+        raise ValueError(f"Unknown summarizer backend '{name}' "
+                         f"(choose from {', '.join(BACKENDS)})") from None
+
+
+def _missing_model(model_name):
+    return LookupError(
+        f"Model '{model_name}' is not available locally. "
+        f"Run: python -m nlp.resources --download --model {model_name}"
+    )
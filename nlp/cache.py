@@ -0,0 +1,182 @@
+# CSCI4152/6509 Fall 2025
+# Program: Summary Cache
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Persistent SQLite cache for summarizer outputs, keyed by a hash
+# of the input text, model name and generation parameters, with LRU eviction.
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+DEFAULT_CACHE_PATH = "summary_cache.sqlite"
+DEFAULT_MAX_ENTRIES = 200000
+
+# Eviction trims the cache this far below max_entries (as a share of it),
+# so the rows are only counted again after that many more inserts
+EVICT_SLACK = 0.05
+
+
+def cache_key(text, model, params):
+    """
+    Content address of one summarizer call: sha256 over the model name,
+    the generation parameters and the input text.
+    """
+    payload = json.dumps([model, sorted(params.items()), text], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """
+    Single-file SQLite cache of summaries. Entries are evicted least
+    recently used first once the cache holds more than max_entries, down
+    to EVICT_SLACK below it. The row count is read once and then tracked
+    as an upper bound (replaced keys count as new), so rows are only
+    counted when the bound passes max_entries; rows added by other
+    processes are picked up at that recount.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._rows = None
+
+    @property
+    def conn(self):
+        # Opened lazily so the cache object can be handed to worker processes
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                " key TEXT PRIMARY KEY,"
+                " model TEXT NOT NULL,"
+                " summary TEXT NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON summaries(last_used)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_model ON summaries(model)")
+        return self._conn
+
+    def get_many(self, keys):
+        """
+        Looks up many keys at once. Returns {key: summary} for the hits.
+        """
+        found = {}
+        unique = list(dict.fromkeys(keys))
+
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT key, summary FROM summaries WHERE key IN ({marks})", chunk
+            ).fetchall()
+            found.update(rows)
+
+        if found:
+            now = time.time()
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE summaries SET last_used = ? WHERE key = ?",
+                    [(now, k) for k in found]
+                )
+
+        self.hits += sum(1 for k in keys if k in found)
+        self.misses += sum(1 for k in keys if k not in found)
+        return found
+
+    def put_many(self, items, model):
+        """
+        Stores (key, summary) pairs for one model, then evicts the least
+        recently used entries beyond max_entries.
+        """
+        if not items:
+            return
+
+        if self._rows is None:
+            self._rows = len(self)
+
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO summaries (key, model, summary, last_used) VALUES (?, ?, ?, ?)",
+                [(k, model, s, now) for k, s in items]
+            )
+            self._rows += len(items)
+            if self._rows > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        rows = len(self)
+        if rows <= self.max_entries:
+            self._rows = rows
+            return
+        keep = self.max_entries - int(self.max_entries * EVICT_SLACK)
+        self.conn.execute(
+            "DELETE FROM summaries WHERE key IN ("
+            " SELECT key FROM summaries ORDER BY last_used LIMIT ?)",
+            (rows - keep,)
+        )
+        self._rows = keep
+
+    def invalidate_model(self, model):
+        """
+        Removes every cached summary produced by one model.
+        Returns the number of entries removed.
+        """
+        with self.conn:
+            cur = self.conn.execute("DELETE FROM summaries WHERE model = ?", (model,))
+        self._rows = None
+        return cur.rowcount
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM summaries")
+        self._rows = 0
+
+    def stats(self):
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or invalidate the summary cache")
+    parser.add_argument("--path", default=DEFAULT_CACHE_PATH)
+    parser.add_argument("--invalidate-model", metavar="MODEL",
+                        help="remove every entry produced by MODEL")
+    parser.add_argument("--clear", action="store_true", help="remove every entry")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"No cache at {args.path}")
+        return
+
+    cache = SummaryCache(args.path)
+    if args.invalidate_model:
+        removed = cache.invalidate_model(args.invalidate_model)
+        print(f"Removed {removed} entries for {args.invalidate_model}")
+    if args.clear:
+        cache.clear()
+        print("Cache cleared")
+    print(cache.stats())
+
+
+if __name__ == "__main__":
+    main()
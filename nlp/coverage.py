@@ -0,0 +1,93 @@
+# CSCI4152/6509 Fall 2025
+# Program: Event Coverage
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Indexes a summary's normalized token n-grams once and checks
+# the facts of each structured event (players, minute) and each injured
+# player against it with set lookups.
+
+import re
+from functools import lru_cache
+
+from nlp.events import find_minute
+from nlp.name_index import name_mentions, normalize_token
+
+WORD_PATTERN = re.compile(r"\w+(?:['’]\w+)*")
+ORDINAL_SUFFIX = re.compile(r"^(\d+)(?:st|nd|rd|th)$")
+MINUTE_DIGITS = re.compile(r"\d+")
+
+# Longest player name (in tokens) looked up as a whole
+MAX_NGRAM = 4
+
+INJURY_TYPE = "injury"
+
+
+@lru_cache(maxsize=65536)
+def _normalize_word(word):
+    word = normalize_token(word)
+    m = ORDINAL_SUFFIX.match(word)
+    return m.group(1) if m else word
+
+
+def summary_tokens(text):
+    """Normalized tokens; "64th" and "64'" both become "64"."""
+    return [_normalize_word(word) for word in WORD_PATTERN.findall(text or "")]
+
+
+@lru_cache(maxsize=65536)
+def _player_keys(name):
+    # (full name, surname) n-grams of a player name
+    tokens = tuple(summary_tokens(name))
+    return (tokens[-MAX_NGRAM:], tokens[-1:]) if tokens else ()
+
+
+class SummaryIndex:
+    """Set of every token n-gram (n <= MAX_NGRAM) of one summary."""
+
+    def __init__(self, text):
+        tokens = summary_tokens(text)
+        self.ngrams = {tuple(tokens[i:i + n]) for n in range(1, MAX_NGRAM + 1)
+                       for i in range(len(tokens) - n + 1)}
+
+    def mentions_player(self, name):
+        """Full name or surname (last token) appears in the summary."""
+        return any(key in self.ngrams for key in _player_keys(name))
+
+    def mentions_minute(self, minute):
+        # "90'+3'" counts as a mention of the 90th minute
+        digits = MINUTE_DIGITS.match(minute or "")
+        return bool(digits) and (digits.group(0),) in self.ngrams
+
+
+def event_facts(event):
+    """
+    (type, players, minute) of a structured event, or of a legacy event
+    sentence string, whose players are its capitalized name mentions.
+    """
+    if isinstance(event, dict):
+        sentence = event.get("sentence", "")
+        players = event.get("players") or name_mentions(sentence)
+        return event.get("type", "event"), players, event.get("minute") or find_minute(sentence)
+    return "event", name_mentions(event), find_minute(event)
+
+
+def injury_players(injuries):
+    return [p for injury in injuries or [] for p in injury.get("players", []) if p != "Unknown"]
+
+
+def entry_coverage(summary, events, injuries=()):
+    """
+    {event type: (covered, total)} for one summary; injured players count
+    under the "injury" type.
+    """
+    index = SummaryIndex(summary)
+    counts = {}
+    for event in events or []:
+        event_type, players, minute = event_facts(event)
+        hit = any(index.mentions_player(p) for p in players) or index.mentions_minute(minute)
+        covered, total = counts.get(event_type, (0, 0))
+        counts[event_type] = (covered + hit, total + 1)
+
+    players = injury_players(injuries)
+    if players:
+        counts[INJURY_TYPE] = (sum(index.mentions_player(p) for p in players), len(players))
+    return counts
@@ -0,0 +1,85 @@
+# CSCI4152/6509 Fall 2025
+# Program: Parsed Match Report
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Tokenizes a match report once (paragraphs, sentences with
+# character offsets, word tokens, POS tags) so every NLP and analysis stage
+# can share the same parse instead of re-tokenizing the raw text.
+
+from nlp.resources import resources
+
+
+class ParsedReport:
+    """
+    One match report, parsed lazily and at most once per layer:
+    - paragraphs: non-empty lines of the report
+    - sentence_spans / sentences: Punkt sentences with (start, end) offsets
+    - tokens: word tokens per sentence
+    - pos_tags: (word, tag) pairs per sentence
+    """
+
+    def __init__(self, text):
+        self.text = text or ""
+        self._paragraphs = None
+        self._spans = None
+        self._tokens = None
+        self._pos_tags = None
+
+    @property
+    def paragraphs(self):
+        if self._paragraphs is None:
+            self._paragraphs = [p for p in self.text.split("\n") if p.strip()]
+        return self._paragraphs
+
+    @property
+    def sentence_spans(self):
+        if self._spans is None:
+            if self.text:
+                tokenizer = resources.sentence_tokenizer()
+                self._spans = list(tokenizer.span_tokenize(self.text))
+            else:
+                self._spans = []
+        return self._spans
+
+    @property
+    def sentences(self):
+        # Same strings as nltk.sent_tokenize(text)
+        return [self.text[start:end] for start, end in self.sentence_spans]
+
+    @property
+    def tokens(self):
+        if self._tokens is None:
+            nltk = resources.nltk("punkt")
+            self._tokens = [nltk.word_tokenize(sent) for sent in self.sentences]
+        return self._tokens
+
+    @property
+    def pos_tags(self):
+        if self._pos_tags is None:
+            # Same tags as nltk.pos_tag per sentence, with one shared tagger
+            self._pos_tags = resources.tagger().tag_sents(self.tokens)
+        return self._pos_tags
+
+    def tagged_sentence(self, i):
+        """
+        POS tags of sentence i, tagging only that sentence when the whole
+        report has not been tagged yet.
+        """
+        if self._pos_tags is not None:
+            return self._pos_tags[i]
+        if self._tokens is not None:
+            tokens = self._tokens[i]
+        else:
+            tokens = resources.nltk("punkt").word_tokenize(self.sentences[i])
+        return resources.tagger().tag(tokens)
+
+    def __len__(self):
+        return len(self.text)
+
+
+def as_report(text):
+    """
+    Accepts either raw report text or an existing ParsedReport.
+    """
+    if isinstance(text, ParsedReport):
+        return text
+    return ParsedReport(text)
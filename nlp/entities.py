@@ -4,33 +4,101 @@
 # Description: Extracts named entities (players, teams, etc.) from match reports
 # using NLTK, returning structured lists for further analysis.
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-import nltk
+from nlp.document import as_report
+from nlp.resources import resources
 
-# Ensure NLTK resources are downloaded
-nltk.download("punkt")
-nltk.download("averaged_perceptron_tagger")
-nltk.download("maxent_ne_chunker")
-nltk.download("words")
+
+class EntityExtractor:
+    """
+    NER engine that holds the POS tagger and NE chunker for the life of the
+    process and tags/chunks every sentence of a document in bulk.
+    extract_many() can fan documents out over a thread or process pool.
+    With a gazetteer (fast mode), known names are matched directly and the
+    chunker only runs on sentences where the gazetteer finds nothing.
+    """
+
+    def __init__(self, workers=1, executor="thread", gazetteer=None):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor: {executor}")
+        self.workers = workers
+        self.executor = executor
+        self.gazetteer = gazetteer
+
+    def extract(self, text):
+        """
+        Returns the (entity, type) tuples of one report (text or ParsedReport).
+        """
+        if not text:
+            return []
+
+        report = as_report(text)
+        if self.gazetteer is not None:
+            return self._extract_fast(report)
+
+        chunker = resources.ne_chunker()
+        entities = []
+
+        for chunks in chunker.parse_sents(report.pos_tags):
+            entities.extend(_chunk_entities(chunks))
+        return entities
+
+    def _extract_fast(self, report):
+        known = self.gazetteer.find_by_sentence(report)
+        chunker = None
+        entities = []
+
+        for i in range(len(report.sentence_spans)):
+            if i in known:
+                entities.extend(known[i])
+                continue
+            chunker = chunker or resources.ne_chunker()
+            entities.extend(_chunk_entities(chunker.parse(report.tagged_sentence(i))))
+        return entities
+
+    def extract_many(self, texts):
+        """
+        Returns one entity list per report, in input order.
+        """
+        if self.workers <= 1 or len(texts) <= 1:
+            return [self.extract(t) for t in texts]
+
+        if self.executor == "thread":
+            with ThreadPoolExecutor(self.workers) as pool:
+                return list(pool.map(self.extract, texts))
+
+        # Worker processes parse from raw text; parses are not sent back
+        raw = [as_report(t).text for t in texts]
+        with ProcessPoolExecutor(self.workers) as pool:
+            return list(pool.map(self.extract, raw, chunksize=max(1, len(raw) // (4 * self.workers))))
+
+
+def _chunk_entities(chunks):
+    entities = []
+    for chunk in chunks:
+        if hasattr(chunk, "label"):
+            entity_name = " ".join(c[0] for c in chunk)
+            entities.append((entity_name, chunk.label()))
+    return entities
+
+
+_default_extractor = EntityExtractor()
+
+
+def use_gazetteer(gazetteer):
+    """
+    Switches extract_entities to the fast gazetteer-first mode for this
+    process (None switches back to the full chunker).
+    """
+    global _default_extractor
+    _default_extractor = EntityExtractor(gazetteer=gazetteer)
 
 
 def extract_entities(text):
     """
     Uses NLTK to extract named entities from text.
+    text: raw report text or a ParsedReport
     Returns a list of (entity, type) tuples.
     """
-    if not text:
-        return []
-
-    sentences = nltk.sent_tokenize(text)
-    entities = []
-
-    for sent in sentences:
-        words = nltk.word_tokenize(sent)
-        pos_tags = nltk.pos_tag(words)
-        chunks = nltk.ne_chunk(pos_tags, binary=False)
-        for chunk in chunks:
-            if hasattr(chunk, "label"):
-                entity_name = " ".join(c[0] for c in chunk)
-                entities.append((entity_name, chunk.label()))
-    return entities
+    return _default_extractor.extract(text)
@@ -5,20 +5,122 @@
 # match text, returning structured event information.
 
 import re
+from bisect import bisect_right
 
+from nlp.document import as_report
+from utils.aho_corasick import AhoCorasick
 
-def extract_events(text):
+# Keyword alternatives for each event type, matched on word boundaries
+EVENT_KEYWORDS = {
+    "goal": [r"goals?", r"own goal", r"scored", r"scores", r"scoring", r"netted",
+             r"equali[sz]er", r"opener", r"brace", r"hat-trick"],
+    "card": [r"yellow card", r"red card", r"second yellow", r"booked", r"booking",
+             r"sent off", r"sending off", r"dismissed", r"cautioned"],
+    "substitution": [r"substitute[sd]?", r"substitution", r"replaced by", r"came on",
+                     r"came off", r"off the bench", r"introduced"],
+    "penalty": [r"penalty", r"penalties", r"spot[- ]kick", r"from the spot"],
+    "save": [r"saves?", r"saved", r"parried", r"palmed", r"tipped (?:over|wide|round)", r"denied"],
+    "var": [r"VAR", r"video assistant referee", r"on-field review", r"pitchside monitor",
+            r"overturned"],
+}
+
+# One alternation with a named group per event type, so a single finditer
+# pass over the report finds every event keyword
+EVENT_PATTERN = re.compile(
+    "|".join(
+        rf"(?P<{event_type}>\b(?:{'|'.join(words)})\b)"
+        for event_type, words in EVENT_KEYWORDS.items()
+    ),
+    flags=re.I
+)
+
+MINUTE_PATTERN = re.compile(
+    r"\b(\d{1,3})'?\s*(?:\+\s*(\d{1,2}))?'"
+    r"|\b(\d{1,3})(?:st|nd|rd|th) minute"
+    r"|\b(first|second|third|fourth|fifth|sixth|seventh|eighth|ninth|tenth) minute",
+    flags=re.I
+)
+
+ORDINAL_MINUTES = {
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
+    "sixth": 6, "seventh": 7, "eighth": 8, "ninth": 9, "tenth": 10,
+}
+
+
+def find_minute(sentence):
+    """
+    Returns the first match minute mentioned in a sentence, formatted like
+    the scraped scorer minutes ("64'", "90'+3'"), or None.
+    """
+    m = MINUTE_PATTERN.search(sentence)
+    if not m:
+        return None
+
+    if m.group(1):
+        added = f"+{m.group(2)}'" if m.group(2) else ""
+        return f"{int(m.group(1))}'{added}"
+    if m.group(3):
+        return f"{int(m.group(3))}'"
+    return f"{ORDINAL_MINUTES[m.group(4).lower()]}'"
+
+
+def extract_events(text, players=None):
     """
-    Extracts simple goal-related events from match text.
-    Returns a list of strings.
+    Extracts goals, cards, substitutions, penalties, saves and VAR decisions
+    from match text in one pass over the report.
+    text: raw report text or a ParsedReport
+    players: optional player names to look for in each event sentence
+    Returns a list of dicts with type, minute, sentence offset, sentence
+    text and mentioned players, in report order.
     """
     if not text:
         return []
 
+    report = as_report(text)
+    spans = report.sentence_spans
+    starts = [start for start, _ in spans]
+
+    # (sentence index, type) pairs in order of first appearance
+    found = {}
+    for m in EVENT_PATTERN.finditer(report.text):
+        i = bisect_right(starts, m.start()) - 1
+        if i >= 0 and m.end() <= spans[i][1]:
+            found.setdefault((i, m.lastgroup), None)
+
+    mentioned = _players_by_sentence(report, players, starts) if players else {}
+
     events = []
-    goal_pattern = r"(\d+'\s*)?([^\.]*goal[^\.]*)"
+    minutes = {}
+    for i, event_type in found:
+        start, end = spans[i]
+        sentence = report.text[start:end]
+        if i not in minutes:
+            minutes[i] = find_minute(sentence)
 
-    for m in re.finditer(goal_pattern, text, flags=re.I):
-        events.append(m.group(0))
+        events.append({
+            "type": event_type,
+            "minute": minutes[i],
+            "offset": start,
+            "sentence": sentence,
+            "players": mentioned.get(i, []),
+        })
 
     return events
+
+
+def _players_by_sentence(report, players, starts):
+    """
+    Maps sentence index -> distinct player names in order of appearance.
+    """
+    names = AhoCorasick((p, p) for p in dict.fromkeys(players))
+    spans = report.sentence_spans
+    by_sentence = {}
+
+    for start, end, name in names.iter_matches(report.text):
+        i = bisect_right(starts, start) - 1
+        if i >= 0 and end <= spans[i][1]:
+            mentioned = by_sentence.setdefault(i, [])
+            if name not in mentioned:
+                mentioned.append(name)
+
+    return by_sentence
@@ -0,0 +1,116 @@
+# CSCI4152/6509 Fall 2025
+# Program: Season Gazetteer
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Builds a season-wide gazetteer of teams and people from the
+# structured fields of the scraped results, and matches it against reports
+# in one linear pass for the fast NER mode.
+
+from bisect import bisect_right
+
+from utils.aho_corasick import AhoCorasick
+from utils.text_helpers import clean_player_name
+
+TEAM_LABEL = "ORGANIZATION"
+PERSON_LABEL = "PERSON"
+
+
+def _card_name(event):
+    # Card events look like "Player 45'"; keep the name words only
+    words = [w for w in clean_player_name(event).split() if not any(ch.isdigit() for ch in w)]
+    return " ".join(words)
+
+
+class Gazetteer:
+    """
+    Known names of a season mapped to NE labels, compiled into one
+    automaton. Matches must start and end on word boundaries; overlapping
+    matches resolve leftmost-longest.
+    """
+
+    def __init__(self, names=None):
+        self.names = {}
+        self._automaton = None
+        for name, label in (names or {}).items():
+            self.add(name, label)
+
+    def add(self, name, label):
+        name = " ".join(name.split()) if name else ""
+        if name and name not in self.names:
+            self.names[name] = label
+            self._automaton = None
+
+    @classmethod
+    def from_entries(cls, entries, extra=None):
+        """
+        Builds the gazetteer from scraped match entries: teams, scorers and
+        booked players. extra: optional {label: [names]} for people the
+        results file does not hold (managers, referees).
+        """
+        gazetteer = cls()
+        for entry in entries:
+            gazetteer.add_entry(entry)
+        gazetteer.add_extra(extra)
+        return gazetteer
+
+    def add_entry(self, entry):
+        """Adds the teams, scorers and booked players of one match entry."""
+        self.add(entry.get("home_team"), TEAM_LABEL)
+        self.add(entry.get("away_team"), TEAM_LABEL)
+        for goal in entry.get("scorers", []):
+            self.add(clean_player_name(goal.get("player")), PERSON_LABEL)
+        for card in entry.get("cards", []):
+            self.add(_card_name(card.get("event")), PERSON_LABEL)
+
+    def add_extra(self, extra):
+        """Adds {label: [names]}."""
+        for label, names in (extra or {}).items():
+            for name in names:
+                self.add(name, label)
+
+    @property
+    def automaton(self):
+        if self._automaton is None:
+            self._automaton = AhoCorasick((name, name) for name in self.names).build()
+        return self._automaton
+
+    def find(self, text):
+        """
+        Returns (start, end, name, label) for every gazetteer name in text,
+        in text order, without overlaps.
+        """
+        hits = []
+        for start, end, name in self.automaton.iter_matches(text):
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end < len(text) and text[end].isalnum():
+                continue
+            hits.append((start, end, name))
+
+        matches = []
+        last_end = 0
+        for start, end, name in sorted(hits, key=lambda h: (h[0], h[0] - h[1])):
+            if start >= last_end:
+                matches.append((start, end, name, self.names[name]))
+                last_end = end
+        return matches
+
+    def find_by_sentence(self, report):
+        """
+        Matches the whole report once and groups the hits by sentence index.
+        """
+        spans = report.sentence_spans
+        starts = [start for start, _ in spans]
+        by_sentence = {}
+
+        for start, end, name, label in self.find(report.text):
+            i = bisect_right(starts, start) - 1
+            if i >= 0 and end <= spans[i][1]:
+                by_sentence.setdefault(i, []).append((name, label))
+        return by_sentence
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getstate__(self):
+        # The automaton is rebuilt lazily after unpickling in pool workers
+        return {"names": self.names, "_automaton": None}
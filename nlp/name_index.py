@@ -0,0 +1,241 @@
+# CSCI4152/6509 Fall 2025
+# Program: Season Name Index
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Hash index of the season's known names and their token-level
+# aliases (surnames, partial names), used to flag capitalized name mentions
+# in a summary that neither the index nor the match report supports.
+
+import re
+import unicodedata
+
+from nlp.gazetteer import PERSON_LABEL
+
+# Word tokens; apostrophes and hyphens stay inside names (O'Brien, Ward-Prowse)
+TOKEN_PATTERN = re.compile(r"[^\W\d_](?:[\w'’-]*\w)?")
+POSSESSIVE = re.compile(r"['’]s?$")
+SENTENCE_END = ".!?:;\"“"
+APOSTROPHES = "'’"
+
+# Capitalized mentions (venues, nicknames, full team names) in at least this
+# many season reports are known names, though the results hold no field for them
+MIN_REPORTS = 2
+
+# Lowercase particles that may sit inside a name (Virgil van Dijk)
+PARTICLES = {"van", "von", "de", "der", "den", "da", "di", "do", "dos", "das", "du", "la", "le",
+             "del", "della", "ten", "ter", "el", "al", "bin", "ben"}
+
+# Capitalized words of match reports that are not people or teams
+COMMON_WORDS = {
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    "january", "february", "march", "april", "may", "june", "july", "august", "september",
+    "october", "november", "december", "premier", "league", "champions", "europa", "conference",
+    "cup", "fa", "carabao", "var", "xg", "ht", "ft", "pl", "uefa", "fifa", "england",
+    "the", "a", "an", "and", "but", "then", "after", "before", "when", "while", "with", "in",
+    "on", "at", "for", "by", "his", "her", "their", "they", "he", "she", "it", "this", "that",
+}
+
+
+def normalize_token(token):
+    """Casefolded token without accents or a possessive ("Gyökeres's" -> "gyokeres")."""
+    token = POSSESSIVE.sub("", token)
+    token = unicodedata.normalize("NFKD", token)
+    return "".join(ch for ch in token if not unicodedata.combining(ch)).casefold()
+
+
+def name_tokens(name):
+    return tuple(normalize_token(t) for t in TOKEN_PATTERN.findall(name or ""))
+
+
+def _runs(text):
+    """
+    Candidate name mentions in one pass: runs of capitalized tokens
+    separated only by spaces, with name particles allowed inside. A
+    possessive apostrophe continues a run ("St James' Park").
+    Yields [(start, end, token)], sentence_initial.
+    """
+    run, sentence_initial, last_end = [], False, 0
+    for m in TOKEN_PATTERN.finditer(text):
+        word = m.group(0)
+        gap = text[last_end:m.start()]
+        if run and gap[:1] in APOSTROPHES and text[last_end - 1] in "sS":
+            gap = gap[1:]
+        joined = run and (not gap or gap.isspace()) and "\n" not in gap
+        if word[0].isupper() or (joined and word in PARTICLES):
+            if not joined and run:
+                yield _strip_particles(run), sentence_initial
+                run = []
+            if not run:
+                before = gap.strip()
+                sentence_initial = (not last_end or "\n" in gap
+                                    or (before != "" and before[-1] in SENTENCE_END))
+            run.append((m.start(), m.end(), normalize_token(word)))
+        elif run:
+            yield _strip_particles(run), sentence_initial
+            run = []
+        last_end = m.end()
+    if run:
+        yield _strip_particles(run), sentence_initial
+
+
+def _strip_particles(run):
+    while run and run[-1][2] in PARTICLES:
+        run = run[:-1]
+    return run
+
+
+def report_mentions(text):
+    """Normalized token tuples of the capitalized mentions in a report, for NameIndex.add_mentions."""
+    return {tuple(t for _, _, t in run) for run, _ in _runs(text or "") if run}
+
+
+def name_mentions(text):
+    """Capitalized name mentions of a text, e.g. the players of an event sentence."""
+    mentions = []
+    for run, _ in _runs(text or ""):
+        if run and not all(t in COMMON_WORDS for _, _, t in run):
+            mentions.append(text[run[0][0]:run[-1][1]])
+    return mentions
+
+
+class NameIndex:
+    """
+    Known names as normalized token tuples. Every contiguous part of a
+    name is an alias ("Kevin De Bruyne" -> "de bruyne", "bruyne", "kevin"),
+    so surname-only and partial mentions match. full_names keeps the complete
+    person names, used to accept an unseen given name in front of a person
+    known only by surname.
+    """
+
+    def __init__(self, names=()):
+        self.aliases = set()
+        self.full_names = set()
+        self.longest = 1
+        for name in names:
+            if isinstance(name, tuple):
+                self.add(*name)
+            else:
+                self.add(name)
+
+    def add(self, name, label=PERSON_LABEL):
+        tokens = name_tokens(name)
+        if not tokens:
+            return
+        if label == PERSON_LABEL:
+            self.full_names.add(tokens)
+        self._add_aliases(tokens)
+
+    def _add_aliases(self, tokens):
+        for i in range(len(tokens)):
+            for j in range(i + 1, len(tokens) + 1):
+                self.aliases.add(tokens[i:j])
+        self.longest = max(self.longest, len(tokens))
+
+    def add_mentions(self, counts, min_reports=MIN_REPORTS):
+        """
+        Adds the mentions of a {token tuple: reports} Counter (summed
+        report_mentions of the season) found in at least min_reports.
+        """
+        for tokens, reports in counts.items():
+            if reports >= min_reports and not all(t in COMMON_WORDS for t in tokens):
+                self._add_aliases(tokens)
+
+    @classmethod
+    def from_gazetteer(cls, gazetteer, mentions=None):
+        index = cls(gazetteer.names.items())
+        index.add_mentions(mentions or {})
+        return index
+
+    def __contains__(self, name):
+        return name_tokens(name) in self.aliases
+
+    def source_index(self, text):
+        """Capitalized mentions of a source text (the match report) as aliases."""
+        local = NameIndex()
+        for run, _ in _runs(text or ""):
+            tokens = tuple(t for _, _, t in run)
+            local.full_names.add(tokens)
+            local._add_aliases(tokens)
+        return local
+
+    def find_unsupported(self, summary, source=None, names=()):
+        """
+        Name mentions in summary supported neither by the index, the source
+        text (or its source_index, when checking several summaries of one
+        match) nor the extra names. Returns [(start, end, text)] spans.
+        """
+        indexes = [self]
+        if isinstance(source, NameIndex):
+            indexes.append(source)
+        elif source:
+            indexes.append(self.source_index(source))
+        if names:
+            indexes.append(NameIndex(names))
+        longest = max(ix.longest for ix in indexes)
+
+        spans = []
+        for run, sentence_initial in _runs(summary or ""):
+            tokens = [t for _, _, t in run]
+            covered = [False] * len(tokens)
+            i = 0
+            while i < len(tokens):
+                for j in range(min(len(tokens), i + longest), i, -1):
+                    alias = tuple(tokens[i:j])
+                    if any(alias in ix.aliases for ix in indexes):
+                        covered[i:j] = [True] * (j - i)
+                        # A given name we never saw, in front of a surname-only person
+                        gap = _uncovered_before(covered, i)
+                        if 0 < gap <= 2 and any(alias in ix.full_names and len(alias) == 1
+                                                for ix in indexes):
+                            covered[i - gap:i] = [True] * gap
+                        i = j
+                        break
+                else:
+                    if tokens[i] in COMMON_WORDS:
+                        covered[i] = True
+                    i += 1
+
+            k = 0
+            while k < len(tokens):
+                if covered[k]:
+                    k += 1
+                    continue
+                end = k
+                while end < len(tokens) and not covered[end]:
+                    end += 1
+                first, last = k, end
+                while first < last and tokens[first] in PARTICLES:
+                    first += 1
+                while last > first and tokens[last - 1] in PARTICLES:
+                    last -= 1
+                # A lone capitalized word may just start the sentence
+                if first < last and not (len(tokens) == 1 and sentence_initial):
+                    start_char, end_char = run[first][0], run[last - 1][1]
+                    spans.append((start_char, end_char, summary[start_char:end_char]))
+                k = end
+        return spans
+
+
+def _uncovered_before(covered, i):
+    gap = 0
+    while i - gap - 1 >= 0 and not covered[i - gap - 1]:
+        gap += 1
+    return gap
+
+
+_default_index = NameIndex()
+
+
+def use_name_index(index):
+    """Sets the season-wide index used by check_summaries in this process."""
+    global _default_index
+    _default_index = index if index is not None else NameIndex()
+
+
+def check_summaries(summaries, source=None, names=()):
+    """
+    {field: unsupported spans} for several summaries of one match, checked
+    against the index set by use_name_index; the source is indexed once.
+    """
+    local = _default_index.source_index(source) if source else None
+    return {field: _default_index.find_unsupported(text, local, names)
+            for field, text in summaries.items()}
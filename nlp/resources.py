@@ -0,0 +1,223 @@
+# CSCI4152/6509 Fall 2025
+# Program: Resource Manager
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Loads heavy NLP resources (NLTK data, BART pipeline) lazily on
+# first use from local files only, so importing the pipeline modules is cheap
+# and never touches the network. Downloads happen only through --download.
+
+import argparse
+import importlib
+
+from nlp.backends import DEFAULT_BACKEND, get_backend
+
+DEFAULT_MODEL = "facebook/bart-large-cnn"
+
+# Local data paths for each NLTK resource, newest format first
+NLTK_RESOURCES = {
+    "punkt": ("tokenizers/punkt_tab/english/", "tokenizers/punkt"),
+    "tagger": ("taggers/averaged_perceptron_tagger_eng/", "taggers/averaged_perceptron_tagger"),
+    "ne_chunker": ("chunkers/maxent_ne_chunker_tab/english_ace_multiclass/",
+                   "chunkers/maxent_ne_chunker"),
+    "words": ("corpora/words",),
+}
+
+# Downloader package names, only used by download()
+NLTK_PACKAGES = {
+    "punkt": ("punkt_tab", "punkt"),
+    "tagger": ("averaged_perceptron_tagger_eng", "averaged_perceptron_tagger"),
+    "ne_chunker": ("maxent_ne_chunker_tab", "maxent_ne_chunker"),
+    "words": ("words",),
+}
+
+
+class ResourceManager:
+    """
+    Owns the process-wide NLP resources. Nothing is imported or loaded until
+    a resource is first requested, and every lookup is local-only: missing
+    NLTK data or model files raise LookupError instead of downloading.
+    """
+
+    def __init__(self, model_name=DEFAULT_MODEL, backend=DEFAULT_BACKEND):
+        self.model_name = model_name
+        self.backend = get_backend(backend)
+        self._summarizer = None
+        self._sentence_tokenizer = None
+        self._tagger = None
+        self._ne_chunker = None
+        self._nltk_ready = set()
+
+    # ---------------- NLTK ----------------
+
+    def nltk(self, *names):
+        """
+        Returns the nltk module after checking that the named resources
+        (keys of NLTK_RESOURCES) are installed locally.
+        """
+        nltk = importlib.import_module("nltk")
+
+        for name in names:
+            if name in self._nltk_ready:
+                continue
+            if self._find_nltk(nltk, name) is None:
+                raise LookupError(
+                    f"NLTK resource '{name}' is not installed locally "
+                    f"(looked for {', '.join(NLTK_RESOURCES[name])}). "
+                    f"Run: python -m nlp.resources --download"
+                )
+            self._nltk_ready.add(name)
+
+        return nltk
+
+    def sentence_tokenizer(self):
+        """
+        Returns the Punkt tokenizer behind nltk.sent_tokenize, loaded once.
+        """
+        if self._sentence_tokenizer is None:
+            nltk = self.nltk("punkt")
+            loader = getattr(nltk.tokenize, "_get_punkt_tokenizer", None)
+            if loader is not None:
+                self._sentence_tokenizer = loader("english")
+            else:
+                self._sentence_tokenizer = nltk.data.load("tokenizers/punkt/english.pickle")
+        return self._sentence_tokenizer
+
+    def tagger(self):
+        """
+        Returns the perceptron POS tagger used by nltk.pos_tag, loaded once
+        instead of on every pos_tag call.
+        """
+        if self._tagger is None:
+            self.nltk("tagger")
+            from nltk.tag.perceptron import PerceptronTagger
+            self._tagger = PerceptronTagger()
+        return self._tagger
+
+    def ne_chunker(self):
+        """
+        Returns the multiclass NE chunker used by nltk.ne_chunk, loaded once
+        instead of on every ne_chunk call.
+        """
+        if self._ne_chunker is None:
+            nltk = self.nltk("ne_chunker", "words")
+            loader = getattr(nltk.chunk, "ne_chunker", None)
+            if loader is not None:
+                self._ne_chunker = loader()
+            else:
+                self._ne_chunker = nltk.data.load(nltk.chunk._MULTICLASS_NE_CHUNKER)
+        return self._ne_chunker
+
+    def _find_nltk(self, nltk, name):
+        for path in NLTK_RESOURCES[name]:
+            try:
+                return nltk.data.find(path)
+            except LookupError:
+                continue
+        return None
+
+    # ---------------- Summarizer ----------------
+
+    def summarizer(self):
+        """
+        Returns the summarization pipeline, building it with the current
+        backend from locally cached model files on first use.
+        """
+        if self._summarizer is None:
+            self._summarizer = self.backend.load(self.model_name)
+        return self._summarizer
+
+    @property
+    def model_tag(self):
+        """Model name plus backend, as used in summary cache keys and manifests."""
+        return self.backend.tag(self.model_name)
+
+    def use_model(self, model_name):
+        """
+        Switches to another locally installed model; it loads on next use.
+        """
+        self.model_name = model_name
+        self._summarizer = None
+
+    def use_backend(self, name, threads=None):
+        """
+        Switches the summarizer backend (see nlp.backends) and its intra-op
+        thread count; the model reloads on next use. Asking for the current
+        backend and threads keeps the loaded (or set_summarizer) pipeline.
+        """
+        if name == self.backend.name and threads == self.backend.threads:
+            return
+        self.backend = get_backend(name, threads)
+        self._summarizer = None
+
+    def set_summarizer(self, pipe, model_name=None):
+        """
+        Installs an already built summarizer (e.g. a stub for benchmarks).
+        """
+        self._summarizer = pipe
+        self.backend = get_backend(DEFAULT_BACKEND)
+        model = getattr(pipe, "model", None)
+        self.model_name = (model_name or getattr(pipe, "model_tag", None)
+                           or getattr(model, "name_or_path", None) or type(pipe).__name__)
+
+    # ---------------- Status / provisioning ----------------
+
+    def status(self):
+        """
+        Reports which resources are installed, without loading any model.
+        """
+        report = {}
+        try:
+            nltk = importlib.import_module("nltk")
+            for name in NLTK_RESOURCES:
+                report[f"nltk:{name}"] = self._find_nltk(nltk, name) is not None
+        except ImportError:
+            for name in NLTK_RESOURCES:
+                report[f"nltk:{name}"] = False
+
+        try:
+            from transformers.utils import cached_file
+            report[f"model:{self.model_name}"] = cached_file(
+                self.model_name, "config.json", local_files_only=True,
+                _raise_exceptions_for_missing_entries=False
+            ) is not None
+        except (ImportError, OSError):
+            report[f"model:{self.model_name}"] = False
+
+        return report
+
+    def download(self):
+        """
+        Explicitly fetches every NLTK package and the model files.
+        This is the only code path that uses the network.
+        """
+        import nltk
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        for packages in NLTK_PACKAGES.values():
+            for package in packages:
+                nltk.download(package, quiet=True)
+
+        AutoTokenizer.from_pretrained(self.model_name)
+        AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+
+
+# Process-wide instance used by the nlp and analysis modules
+resources = ResourceManager()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check or install local NLP resources")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--download", action="store_true",
+                        help="download NLTK data and model files (uses the network)")
+    args = parser.parse_args()
+
+    manager = ResourceManager(args.model)
+    if args.download:
+        manager.download()
+
+    for name, ok in manager.status().items():
+        print(f"{'ok     ' if ok else 'MISSING'} {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# CSCI4152/6509 Fall 2025
+# Program: Multi-candidate ROUGE Engine
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: ROUGE-N / ROUGE-L scoring with rouge_score's tokenizer and
+# score formulas, where each reference is tokenized and stemmed once and its
+# n-gram counts and LCS match masks are reused for every candidate summary.
+
+# rouge_score and nltk are imported where first used: together they take
+# over a second to load, which every importer of epl_evaluation would pay
+
+DEFAULT_ROUGE_TYPES = ("rouge1", "rouge2", "rougeL")
+
+
+class CachedTokenizer:
+    """
+    rouge_score's DefaultTokenizer with the Porter stems memoized per word,
+    so repeated words across references and candidates are stemmed once.
+    """
+
+    def __init__(self, use_stemmer=True):
+        from rouge_score import tokenize
+
+        self._patterns = tokenize
+        self._stemmer = None
+        if use_stemmer:
+            from nltk.stem import porter
+            self._stemmer = porter.PorterStemmer()
+        self._stems = {}
+
+    def tokenize(self, text):
+        # Same steps as rouge_score.tokenize.tokenize
+        patterns = self._patterns
+        text = patterns.NON_ALPHANUM_RE.sub(" ", text.lower())
+        tokens = patterns.SPACES_RE.split(text)
+        if self._stemmer:
+            tokens = [self._stem(x) if len(x) > 3 else x for x in tokens]
+        return [x for x in tokens if patterns.VALID_TOKEN_RE.match(x)]
+
+    def _stem(self, word):
+        stem = self._stems.get(word)
+        if stem is None:
+            stem = self._stems[word] = self._stemmer.stem(word)
+        return stem
+
+
+class Reference:
+    """
+    A tokenized reference with its n-gram counts and, for ROUGE-L, one
+    bitmask per token marking the positions where it occurs.
+    """
+
+    __slots__ = ("tokens", "_ngrams", "_masks")
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self._ngrams = {}
+        self._masks = None
+
+    def ngrams(self, n):
+        from rouge_score import rouge_scorer
+
+        counts = self._ngrams.get(n)
+        if counts is None:
+            counts = self._ngrams[n] = rouge_scorer._create_ngrams(self.tokens, n)
+        return counts
+
+    def lcs_length(self, candidate):
+        """
+        LCS length of the reference and a candidate token list, equal to
+        rouge_score's DP table, with the bit-parallel algorithm of
+        Crochemore et al.: one big-int update per candidate token.
+        """
+        if self._masks is None:
+            self._masks = {}
+            for i, token in enumerate(self.tokens):
+                self._masks[token] = self._masks.get(token, 0) | (1 << i)
+
+        n = len(self.tokens)
+        full = (1 << n) - 1
+        v = full
+        for token in candidate:
+            u = v & self._masks.get(token, 0)
+            v = ((v + u) | (v - u)) & full
+        return n - bin(v).count("1")
+
+
+class RougeEngine:
+    """
+    Scores any number of candidates against a reference; scores are the
+    same floats rouge_score.RougeScorer returns for the same types.
+    """
+
+    def __init__(self, rouge_types=DEFAULT_ROUGE_TYPES, use_stemmer=True):
+        for rouge_type in rouge_types:
+            if rouge_type != "rougeL" and not _ngram_size(rouge_type):
+                raise ValueError(f"Unsupported rouge type: {rouge_type}")
+        self.rouge_types = tuple(rouge_types)
+        self.tokenizer = CachedTokenizer(use_stemmer)
+
+    def reference(self, text):
+        return Reference(self.tokenizer.tokenize(text))
+
+    def score(self, reference, prediction):
+        """
+        {rouge type: Score} of a prediction string against a reference
+        (a string or a Reference from self.reference).
+        """
+        if not isinstance(reference, Reference):
+            reference = self.reference(reference)
+        from rouge_score import rouge_scorer
+
+        tokens = self.tokenizer.tokenize(prediction)
+        result = {}
+        for rouge_type in self.rouge_types:
+            if rouge_type == "rougeL":
+                result[rouge_type] = _score_lcs(reference, tokens)
+            else:
+                n = _ngram_size(rouge_type)
+                result[rouge_type] = rouge_scorer._score_ngrams(
+                    reference.ngrams(n), rouge_scorer._create_ngrams(tokens, n))
+        return result
+
+    def score_many(self, reference, predictions):
+        """Scores of several predictions against one reference, tokenized once."""
+        if not isinstance(reference, Reference):
+            reference = self.reference(reference)
+        return [self.score(reference, p) for p in predictions]
+
+
+def _ngram_size(rouge_type):
+    suffix = rouge_type[5:]
+    if rouge_type.startswith("rouge") and len(suffix) == 1 and suffix.isdigit() and suffix != "0":
+        return int(suffix)
+    return None
+
+
+def _score_lcs(reference, prediction_tokens):
+    # rouge_scorer._score_lcs with the DP table replaced by Reference.lcs_length
+    from rouge_score import scoring
+
+    if not reference.tokens or not prediction_tokens:
+        return scoring.Score(precision=0, recall=0, fmeasure=0)
+    lcs_length = reference.lcs_length(prediction_tokens)
+    precision = lcs_length / len(prediction_tokens)
+    recall = lcs_length / len(reference.tokens)
+    return scoring.Score(precision=precision, recall=recall,
+                         fmeasure=scoring.fmeasure(precision, recall))
@@ -5,53 +5,207 @@
 # for EPL match reports. Provides paragraph-wise summarization and template refinement.
 
 
-from transformers import pipeline
+from nlp.document import as_report
+from nlp.cache import SummaryCache, cache_key, DEFAULT_CACHE_PATH, DEFAULT_MAX_ENTRIES
+from nlp.resources import resources
+from utils.metrics import metrics
 
-# Load summarization model
-summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
+# Number of inputs sent to the model in one generate call
+DEFAULT_BATCH_SIZE = 8
 
+# Persistent summary cache shared by every BatchSummarizer (see configure_cache)
+summary_cache = None
 
-def hybrid_summary(entry):
+
+def configure_cache(path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES):
     """
-    Builds a hybrid summary using template + abstractive refinement.
+    Enables the on-disk summary cache for this process. path=None disables it.
+    """
+    global summary_cache
+    summary_cache = SummaryCache(path, max_entries) if path else None
+    return summary_cache
+
+
+def model_name_of(pipe):
+    """
+    Name used in cache keys for the model behind a summarizer pipeline.
+    """
+    tag = getattr(pipe, "model_tag", None)
+    if tag:
+        return tag
+    model = getattr(pipe, "model", None)
+    return getattr(model, "name_or_path", None) or type(pipe).__name__
+
+
+class BatchSummarizer:
+    """
+    Collects summarizer requests from many matches and runs them in batches.
+    Requests are (text, max_length, min_length) tuples. They are bucketed by
+    their generation lengths, sorted by input length inside each bucket so
+    padding stays small, and every result is returned in request order.
+    Requests already in the summary cache skip the model entirely, and the
+    model itself is only loaded once a request misses the cache.
+    """
+
+    def __init__(self, pipe=None, batch_size=DEFAULT_BATCH_SIZE, cache=None):
+        self._pipe = pipe
+        self.batch_size = max(1, int(batch_size))
+        self.cache = cache if cache is not None else summary_cache
+        self.model_name = model_name_of(pipe) if pipe is not None else resources.model_tag
+        self.calls = 0
+
+    @property
+    def pipe(self):
+        if self._pipe is None:
+            self._pipe = resources.summarizer()
+        return self._pipe
+
+    def run(self, requests):
+        """
+        Summarizes a list of (text, max_length, min_length) requests.
+        Returns the summaries in the same order as the requests.
+        """
+        results = [None] * len(requests)
+        keys = None
+
+        if self.cache is not None:
+            keys = [
+                cache_key(text, self.model_name,
+                          {"max_length": max_len, "min_length": min_len, "do_sample": False})
+                for text, max_len, min_len in requests
+            ]
+            found = self.cache.get_many(keys)
+            for i, key in enumerate(keys):
+                results[i] = found.get(key)
+
+        buckets = {}
+        for i, (text, max_len, min_len) in enumerate(requests):
+            if results[i] is None:
+                buckets.setdefault((max_len, min_len), []).append(i)
+
+        fresh = []
+        for (max_len, min_len), indices in buckets.items():
+            indices.sort(key=lambda i: len(requests[i][0]))
+            for start in range(0, len(indices), self.batch_size):
+                chunk = indices[start:start + self.batch_size]
+                texts = [requests[i][0] for i in chunk]
+                for i, summary in zip(chunk, self._generate(texts, max_len, min_len)):
+                    if summary is None:
+                        # Failed calls fall back to the input and are not cached
+                        results[i] = requests[i][0]
+                        continue
+                    results[i] = summary
+                    if keys is not None:
+                        fresh.append((keys[i], summary))
+
+        if fresh:
+            self.cache.put_many(fresh, self.model_name)
+
+        return results
+
+    def run_steps(self, step_generators):
+        """
+        Drives many summarization step generators (see summarize_text_steps)
+        in lockstep, so each round of requests from every match is batched
+        together. Returns the final summary of each generator in order.
+        """
+        results = [None] * len(step_generators)
+        pending = {}
+
+        for i, steps in enumerate(step_generators):
+            self._advance(i, steps, None, pending, results)
+
+        while pending:
+            rounds = list(pending.items())
+            outputs = self.run([req for _, reqs in rounds for req in reqs])
+            pending = {}
+
+            pos = 0
+            for i, reqs in rounds:
+                answer = outputs[pos:pos + len(reqs)]
+                pos += len(reqs)
+                self._advance(i, step_generators[i], answer, pending, results)
+
+        return results
+
+    def _advance(self, i, steps, answer, pending, results):
+        try:
+            reqs = steps.send(answer)
+            while not reqs:
+                reqs = steps.send([])
+        except StopIteration as stop:
+            results[i] = stop.value
+            return
+        pending[i] = reqs
+
+    def _generate(self, texts, max_len, min_len):
+        """
+        One generate call for a bucket of texts. Falls back to per-item calls
+        when the batch fails; an item that still fails comes back as None.
+        """
+        self.calls += 1
+        metrics.count("bart_calls")
+        try:
+            if len(texts) == 1:
+                output = self.pipe(texts[0], max_length=max_len, min_length=min_len, do_sample=False)
+                summaries = [output[0]["summary_text"]]
+            else:
+                outputs = self.pipe(
+                    texts,
+                    max_length=max_len,
+                    min_length=min_len,
+                    do_sample=False,
+                    batch_size=len(texts)
+                )
+                summaries = [o["summary_text"] for o in outputs]
+        except Exception:
+            if len(texts) == 1:
+                return [None]
+            return [self._generate([t], max_len, min_len)[0] for t in texts]
+        if metrics.enabled:
+            metrics.count("tokens_generated", self._token_count(summaries))
+        return summaries
+
+    def _token_count(self, summaries):
+        # Model tokens when the pipeline exposes its tokenizer, else words
+        tokenizer = getattr(self.pipe, "tokenizer", None)
+        if tokenizer is not None:
+            return sum(len(tokenizer.encode(s, add_special_tokens=False)) for s in summaries)
+        return sum(len(s.split()) for s in summaries)
+
+
+def hybrid_summary_steps(entry):
+    """
+    Step generator for hybrid_summary: yields the template refinement request.
     """
     from templates.match_template import build_template_summary
 
     template = build_template_summary(entry)
 
-    try:
-        refined = summarizer(
-            template,
-            max_length=60,
-            min_length=25,
-            do_sample=False
-        )[0]["summary_text"]
-        return refined
-    except Exception:
-        return template
+    refined = yield [(template, 60, 25)]
+    return refined[0]
 
 
-def summarize_text(text):
+def summarize_text_steps(text):
     """
-    Summarizes text paragraph-wise first, then combines into final summary.
+    Step generator for summarize_text: yields the paragraph requests, then
+    the final pass over the combined paragraph summaries.
+    text: raw report text or a ParsedReport
     """
-    if not text or len(text.strip()) < 50:
-        return text or ""
+    report = as_report(text)
+    if len(report.text.strip()) < 50:
+        return report.text
 
-    paragraphs = [p for p in text.split("\n") if p.strip()]
-    paragraph_summaries = []
+    requests = []
 
-    for p in paragraphs:
+    for p in report.paragraphs:
         input_len = len(p.split())
         max_len = min(60, input_len)
         min_len = max(5, int(max_len * 0.5))
         min_len = min(min_len, max_len)
+        requests.append((p, max_len, min_len))
 
-        try:
-            summary = summarizer(p, max_length=max_len, min_length=min_len, do_sample=False)[0]['summary_text']
-        except Exception:
-            summary = p
-        paragraph_summaries.append(summary)
+    paragraph_summaries = yield requests
 
     combined_summary = " ".join(paragraph_summaries)
 
@@ -59,14 +213,41 @@ def summarize_text(text):
     final_min_len = max(10, int(final_max_len * 0.5))
     final_min_len = min(final_min_len, final_max_len)
 
-    try:
-        final_summary = summarizer(
-            combined_summary,
-            max_length=final_max_len,
-            min_length=final_min_len,
-            do_sample=False
-        )[0]['summary_text']
-    except Exception:
-        final_summary = combined_summary
-
-    return final_summary
+    final_summary = yield [(combined_summary, final_max_len, final_min_len)]
+    return final_summary[0]
+
+
+def hybrid_summary(entry):
+    """
+    Builds a hybrid summary using template + abstractive refinement.
+    """
+    return BatchSummarizer(batch_size=1).run_steps([hybrid_summary_steps(entry)])[0]
+
+
+def summarize_text(text):
+    """
+    Summarizes text paragraph-wise first, then combines into final summary.
+    """
+    return BatchSummarizer(batch_size=1).run_steps([summarize_text_steps(text)])[0]
+
+
+def summarize_entries(entries, batch_size=DEFAULT_BATCH_SIZE, engine=None, reports=None):
+    """
+    Builds (hybrid_summary, raw_summary) pairs for many entries (MatchRecords
+    or scraped dicts) at once, batching the summarizer calls across all of them.
+    reports: optional ParsedReport per entry, reused instead of re-parsing
+    """
+    from analysis.record import MatchRecord
+
+    engine = engine or BatchSummarizer(batch_size=batch_size)
+    entries = [MatchRecord.of(entry) for entry in entries]
+    if reports is None:
+        reports = [entry.report for entry in entries]
+
+    steps = []
+    for entry, report in zip(entries, reports):
+        steps.append(hybrid_summary_steps(entry))
+        steps.append(summarize_text_steps(report))
+
+    summaries = engine.run_steps(steps)
+    return list(zip(summaries[0::2], summaries[1::2]))
@@ -0,0 +1,404 @@
+# CSCI4152/6509 Fall 2025
+# Program: EPL Summarization Service
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Long-running local HTTP service that keeps the BART pipeline,
+# NLTK models and lexicons warm and returns the process_entry result for
+# match JSON posted to it. Concurrent requests are coalesced into
+# micro-batches (up to max_batch matches, waiting at most max_wait for more)
+# so their summarizer calls share generate batches; a bounded queue rejects
+# requests with 503 once it is full.
+
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from main import _process_window, add_hallucinations, start_pool
+from nlp.summarization import configure_cache, DEFAULT_BATCH_SIZE
+from nlp.cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_ENTRIES
+from nlp.resources import resources
+from nlp.backends import BACKENDS, DEFAULT_BACKEND
+from nlp.entities import use_gazetteer
+from nlp.gazetteer import Gazetteer
+from nlp.name_index import NameIndex, report_mentions, use_name_index
+from analysis.injuries import load_injury_lexicon
+from analysis.record import MatchRecord
+from utils.file_helpers import iter_json_records
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_WAIT_MS = 20
+DEFAULT_MAX_QUEUE = 64
+MAX_BODY_BYTES = 8 << 20
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class Overloaded(Exception):
+    """Raised by MicroBatcher.submit when the queue has no room for a request's matches."""
+
+
+class TooLarge(Exception):
+    """Raised by MicroBatcher.submit for a request with more matches than the queue holds."""
+
+
+class MicroBatcher:
+    """
+    Coalesces single-match requests into batches for run_batch (a blocking
+    function of a list of MatchRecords, run in executor). A batch closes
+    when it holds max_batch matches or max_wait seconds after its first
+    match arrived; at most concurrency batches run at once, and while they
+    do, new requests queue up and form the next batch. A request's matches
+    are queued all or none: submit raises Overloaded when they do not fit
+    in the max_queue free slots, and TooLarge when they never could.
+    A failing batch is retried one match at a time, so only the matches
+    that fail get an error.
+    """
+
+    def __init__(self, run_batch, executor, max_batch=DEFAULT_BATCH_SIZE,
+                 max_wait=DEFAULT_MAX_WAIT_MS / 1000, max_queue=DEFAULT_MAX_QUEUE, concurrency=1):
+        self.run_batch = run_batch
+        self.executor = executor
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.concurrency = max(1, concurrency)
+        self.queue = None
+        self.requests = 0
+        self.rejected = 0
+        self.batches = 0
+        self.batched = 0
+        self.busy_time = 0.0
+        self._tasks = set()
+        self._loop_task = None
+
+    def start(self):
+        self.queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def submit(self, records):
+        """
+        Results of process_entry for a list of MatchRecords, once their
+        batches are done; a match that failed gets its exception instead.
+        """
+        if len(records) > self.max_queue:
+            self.rejected += 1
+            raise TooLarge(f"{len(records)} matches, at most {self.max_queue} per request")
+        if self.queue.qsize() + len(records) > self.max_queue:
+            self.rejected += 1
+            raise Overloaded(f"{self.queue.qsize()} matches already queued")
+        self.requests += 1
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in records]
+        for record, future in zip(records, futures):
+            self.queue.put_nowait((record, future))
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    async def _run(self):
+        while True:
+            # Take a batch slot first, so requests pile up while all are busy
+            await self._slots.acquire()
+            batch = [await self.queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                if self.queue.empty():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self.queue.get_nowait())
+            task = asyncio.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch):
+        records = [record for record, _ in batch]
+        start = time.perf_counter()
+        try:
+            results = await self._run_batch(records)
+            if isinstance(results, Exception) and len(records) > 1:
+                # One bad match must not fail the others: run each on its own
+                results = [await self._run_batch([record]) for record in records]
+                results = [r if isinstance(r, Exception) else r[0] for r in results]
+            elif isinstance(results, Exception):
+                results = [results]
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            self.batches += 1
+            self.batched += len(batch)
+            self.busy_time += time.perf_counter() - start
+            self._slots.release()
+
+    async def _run_batch(self, records):
+        """run_batch(records) in the executor, or the exception it raised."""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, self.run_batch,
+                                                                    records)
+        except Exception as e:
+            return e
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "queued": self.queue.qsize() if self.queue else 0,
+            "in_flight": len(self._tasks),
+            "batches": self.batches,
+            "mean_batch": round(self.batched / self.batches, 2) if self.batches else 0.0,
+            "busy_s": round(self.busy_time, 3),
+        }
+
+
+class SummarizationService:
+    """
+    HTTP/1.1 front end (keep-alive, JSON bodies) over a MicroBatcher:
+    - POST /summarize: one match dict, or a list of them, in the
+      premier_league_results.json schema; returns the result(s)
+    - GET /health, GET /stats
+    """
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+        self.server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.batcher.start()
+        self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        await self.batcher.stop()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ValueError as e:
+            _write_response(writer, 413 if "too large" in str(e) else 400, {"error": str(e)}, False)
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        if path == "/health":
+            return 200, {"status": "ok", "model": resources.model_tag}
+        if path == "/stats":
+            return 200, self.batcher.stats()
+        if path != "/summarize":
+            return 404, {"error": f"no route {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+
+        try:
+            data = json.loads(body)
+            many = isinstance(data, list)
+            records = [MatchRecord.from_dict(e) for e in (data if many else [data])]
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return 400, {"error": f"invalid match JSON: {e!r}"}
+
+        try:
+            results = await self.batcher.submit(records)
+        except TooLarge as e:
+            return 413, {"error": str(e)}
+        except Overloaded as e:
+            return 503, {"error": f"overloaded: {e}"}
+
+        failed = sum(isinstance(r, Exception) for r in results)
+        if not many:
+            return (500, {"error": repr(results[0])}) if failed else (200, results[0])
+        if failed:
+            # The matches that succeeded are still returned, next to the errors
+            return 500, {"error": f"{failed} of {len(results)} matches failed",
+                         "results": [{"error": repr(r)} if isinstance(r, Exception) else r
+                                     for r in results]}
+        return 200, results
+
+
+async def _read_request(reader):
+    """(method, path, headers, body) of the next request, or None at EOF."""
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise ValueError("malformed request line")
+    method, path, _ = parts
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0))
+    if length > MAX_BODY_BYTES:
+        raise ValueError(f"body too large ({length} bytes)")
+    body = await reader.readexactly(length) if length else b""
+    return method, path.split("?", 1)[0], headers, body
+
+
+def _write_response(writer, status, payload, keep_alive=True):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    if status == 503:
+        head.append("Retry-After: 1")
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+
+def _warm_up(cache_path, cache_size):
+    # Runs on the executor thread that serves every in-process batch, so the
+    # SQLite cache connection is opened (and used) by that thread only
+    configure_cache(cache_path, cache_size)
+    resources.nltk("punkt", "tagger", "ne_chunker", "words")
+    resources.tagger()
+    resources.ne_chunker()
+    resources.summarizer()
+
+
+def build_batcher(max_batch=DEFAULT_BATCH_SIZE, max_wait_ms=DEFAULT_MAX_WAIT_MS,
+                  max_queue=DEFAULT_MAX_QUEUE, workers=1, cache_path=DEFAULT_CACHE_PATH,
+                  cache_size=DEFAULT_MAX_ENTRIES, injury_lexicon=None, season=None,
+                  extra_names=None, fast_ner=False, backend=DEFAULT_BACKEND, threads=None):
+    """
+    Loads the season names and lexicons and warms the models. workers=1
+    runs batches on one thread of this process; more workers start the
+    main.py process pool and run that many batches concurrently.
+    backend/threads pick the summarizer backend and its intra-op threads
+    (per worker process when workers > 1, split from the CPU cores).
+    Returns (batcher, pool or None).
+    """
+    if injury_lexicon:
+        load_injury_lexicon(injury_lexicon)
+
+    gazetteer = Gazetteer()
+    mentions = Counter()
+    if season:
+        for entry in iter_json_records(season):
+            gazetteer.add_entry(entry)
+            mentions.update(report_mentions(entry.get("report")))
+    if extra_names:
+        with open(extra_names, "r", encoding="utf-8") as f:
+            gazetteer.add_extra(json.load(f))
+    name_index = NameIndex.from_gazetteer(gazetteer, mentions)
+    use_name_index(name_index)
+    if fast_ner:
+        use_gazetteer(gazetteer)
+    print(f"Season names: {len(gazetteer)}")
+
+    executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="batch")
+    if workers > 1:
+        pool = start_pool(workers, cache_path, cache_size, injury_lexicon,
+                          gazetteer if fast_ner else None, backend=backend)
+
+        def run_batch(records):
+            return [add_hallucinations(r) for r in pool.apply(_process_window, (records, max_batch))]
+    else:
+        pool = None
+        resources.use_backend(backend, threads)
+        executor.submit(_warm_up, cache_path, cache_size).result()
+
+        def run_batch(records):
+            return [add_hallucinations(r) for r in _process_window(records, max_batch)]
+
+    batcher = MicroBatcher(run_batch, executor, max_batch=max_batch, max_wait=max_wait_ms / 1000,
+                           max_queue=max_queue, concurrency=workers)
+    return batcher, pool
+
+
+async def serve(batcher, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    service = SummarizationService(batcher)
+    host, port = await service.start(host, port)
+    print(f"Serving on http://{host}:{port} (POST /summarize, GET /health, GET /stats)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.stop()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Local EPL summarization service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="matches coalesced into one micro-batch")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT_MS,
+                        help="how long a batch waits for more matches after its first")
+    parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE,
+                        help="queued matches before requests are rejected with 503; "
+                             "a list with more matches than this gets 413")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes; each runs one batch at a time")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH,
+                        help="SQLite file caching summarizer outputs")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_ENTRIES)
+    parser.add_argument("--no-cache", action="store_true", help="disable the summary cache")
+    parser.add_argument("--injury-lexicon", help="JSON file of extra injury phrases")
+    parser.add_argument("--season", help="scraped results (JSON or JSONL) seeding the season "
+                                         "name index and the --fast-ner gazetteer")
+    parser.add_argument("--extra-names", help="JSON file of extra gazetteer names")
+    parser.add_argument("--fast-ner", action="store_true", help="gazetteer-first NER")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, choices=sorted(BACKENDS),
+                        help="summarizer backend (transformers, int8, onnx)")
+    parser.add_argument("--threads", type=int, help="intra-op threads with --workers 1")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    batcher, pool = build_batcher(
+        max_batch=args.max_batch, max_wait_ms=args.max_wait_ms, max_queue=args.max_queue,
+        workers=args.workers, cache_path=None if args.no_cache else args.cache,
+        cache_size=args.cache_size, injury_lexicon=args.injury_lexicon, season=args.season,
+        extra_names=args.extra_names, fast_ner=args.fast_ner, backend=args.backend,
+        threads=args.threads,
+    )
+    try:
+        asyncio.run(serve(batcher, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        batcher.executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,7 @@
 # using scorelines, key stats, and player performance data.
 
 
-from analysis.stats import get_stat
-from analysis.players import detect_key_players
-
+from analysis.record import MatchRecord
 
 
 def build_template_summary(entry):
@@ -16,20 +14,21 @@ def build_template_summary(entry):
     - Final score
     - xG and shots stats
     - Key player performances
+    entry: MatchRecord or scraped match dict
     """
-    home = entry["home_team"]
-    away = entry["away_team"]
-    score = entry["final_score"]
+    record = MatchRecord.of(entry)
+    home = record.home_team
+    away = record.away_team
 
-    home_goals = score["home"]
-    away_goals = score["away"]
+    home_goals = record.home_goals
+    away_goals = record.away_goals
 
-    # Extract top stats
-    xg_home, xg_away = get_stat(entry.get("stats"), "XG")
-    shots_home, shots_away = get_stat(entry.get("stats"), "Shots On Target")
+    # Extract top stats (raw strings, as scraped)
+    xg_home, xg_away = record.stat("XG")
+    shots_home, shots_away = record.stat("Shots On Target")
 
-    # Detect key players
-    key_players = detect_key_players(entry)
+    # Key players are cached on the record
+    key_players = record.key_players
 
     # First sentence: result
     sentence_1 = f"{home} beat {away} {home_goals}-{away_goals}."
@@ -0,0 +1,26 @@
+# CSCI4152/6509 Fall 2025
+# Program: Test Fixtures
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Shared pytest fixtures: import paths for the repo and the
+# benchmark helpers, and a tiny randomly initialized BART saved once per
+# session so model tests run offline.
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+
+@pytest.fixture(scope="session")
+def tiny_model(tmp_path_factory):
+    """Path of a tiny random BART (1 layer, 32 wide) with the local BART tokenizer."""
+    from bench_backends import build_tiny_random
+
+    try:
+        return build_tiny_random(str(tmp_path_factory.mktemp("tiny-bart")))
+    except OSError as e:
+        pytest.skip(f"BART tokenizer not available locally: {e}")
@@ -0,0 +1,90 @@
+# CSCI4152/6509 Fall 2025
+# Program: Summarizer Backend Tests
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Checks the backend interface on a tiny random BART: one
+# string per input, batched and per-item calls agreeing, and the int8
+# backend running inside BatchSummarizer. onnx is skipped without
+# onnxruntime and optimum.
+
+import pytest
+
+from nlp.backends import BACKENDS, DEFAULT_BACKEND, OnnxBackend, get_backend
+from nlp.resources import ResourceManager
+from nlp.summarization import BatchSummarizer
+
+TEXTS = [
+    "Arsenal beat Chelsea 2-1 at the Emirates on Saturday. Bukayo Saka scored twice in the "
+    "first half before Cole Palmer pulled one back late on.",
+    "Liverpool and Everton drew 0-0 in a tense derby at Anfield.",
+    "Erling Haaland hit a hat-trick as Manchester City beat Fulham 5-1, moving top of the "
+    "table ahead of the international break after a dominant second half.",
+]
+
+
+@pytest.fixture(scope="module", params=sorted(BACKENDS))
+def backend_pipe(request, tiny_model, tmp_path_factory):
+    name = request.param
+    if name == "onnx":
+        pytest.importorskip("onnxruntime")
+        pytest.importorskip("optimum.onnxruntime")
+        backend = OnnxBackend(threads=1, export_dir=str(tmp_path_factory.mktemp("onnx")))
+    else:
+        backend = get_backend(name, threads=1)
+    return name, backend.load(tiny_model)
+
+
+def test_one_string_per_input(backend_pipe):
+    _, pipe = backend_pipe
+    outputs = pipe(TEXTS, max_length=20, min_length=5, do_sample=False, batch_size=len(TEXTS))
+    assert len(outputs) == len(TEXTS)
+    assert all(isinstance(o["summary_text"], str) for o in outputs)
+
+
+def test_batched_matches_per_item(backend_pipe):
+    _, pipe = backend_pipe
+    requests = [(text, 20, 5) for text in TEXTS]
+    batched = BatchSummarizer(pipe=pipe, batch_size=len(TEXTS)).run(requests)
+    per_item = BatchSummarizer(pipe=pipe, batch_size=1).run(requests)
+    assert batched == per_item
+    assert all(isinstance(s, str) for s in batched)
+
+
+def test_model_tag_names_backend(backend_pipe, tiny_model):
+    name, pipe = backend_pipe
+    engine = BatchSummarizer(pipe=pipe)
+    if name == DEFAULT_BACKEND:
+        assert engine.model_name == tiny_model
+    else:
+        assert engine.model_name == f"{tiny_model}+{name}"
+
+
+def test_int8_backend_in_batch_summarizer(tiny_model):
+    import torch
+
+    manager = ResourceManager(tiny_model, backend="int8")
+    pipe = manager.summarizer()
+    assert any(isinstance(m, torch.ao.nn.quantized.dynamic.Linear) for m in pipe.model.modules())
+
+    engine = BatchSummarizer(pipe=pipe, batch_size=2)
+    summaries = engine.run([(text, 20, 5) for text in TEXTS])
+    assert len(summaries) == len(TEXTS)
+    assert all(isinstance(s, str) for s in summaries)
+    assert engine.calls == 2
+    assert manager.model_tag == f"{tiny_model}+int8"
+
+
+def test_use_backend_keeps_pipeline_when_unchanged():
+    manager = ResourceManager("some/model")
+    stub = object()
+    manager.set_summarizer(stub, model_name="stub")
+    manager.use_backend(DEFAULT_BACKEND)
+    assert manager.summarizer() is stub
+
+    manager.use_backend("int8", threads=2)
+    assert manager.model_tag == "stub+int8"
+    assert manager._summarizer is None
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_backend("tensorrt")
@@ -0,0 +1,34 @@
+# CSCI4152/6509 Fall 2025
+# Program: Summary Cache Tests
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Checks LRU eviction of the SQLite summary cache with the
+# tracked row count, including rows written by a second cache handle.
+
+from nlp.cache import SummaryCache
+
+
+def test_eviction_keeps_cache_bounded(tmp_path):
+    cache = SummaryCache(str(tmp_path / "cache.sqlite"), max_entries=100)
+    for i in range(50):
+        cache.put_many([(f"k{i}-{j}", "summary") for j in range(7)], "model")
+        assert len(cache) <= 100
+    # Oldest entries go first
+    assert cache.get_many(["k0-0"]) == {}
+    assert cache.get_many(["k49-6"]) == {"k49-6": "summary"}
+
+
+def test_rows_from_another_handle_are_counted(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    first, second = SummaryCache(path, max_entries=50), SummaryCache(path, max_entries=50)
+    first.put_many([("a", "x")], "model")
+    second.put_many([(f"b{i}", "x") for i in range(60)], "model")
+    first.put_many([(f"c{i}", "x") for i in range(60)], "model")
+    assert len(first) <= 50
+
+
+def test_clear_resets_count(tmp_path):
+    cache = SummaryCache(str(tmp_path / "cache.sqlite"), max_entries=10)
+    cache.put_many([(f"k{i}", "x") for i in range(10)], "model")
+    cache.clear()
+    cache.put_many([(f"n{i}", "x") for i in range(10)], "model")
+    assert len(cache) == 10
@@ -0,0 +1,96 @@
+# CSCI4152/6509 Fall 2025
+# Program: Processing Manifest Test
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Runs main.main several times against one manifest (stub
+# summarizer) and checks that adding matches reuses every stored result,
+# that results superseded under new settings are dropped, and that results
+# outside the input are only dropped with compact_manifest.
+
+import json
+import os
+
+import pytest
+
+import main
+from bench_pipeline import StubSummarizer
+from conftest import ROOT
+from nlp.resources import resources
+
+
+@pytest.fixture
+def stub_model():
+    previous = resources._summarizer, resources.model_name
+    resources.set_summarizer(StubSummarizer(), model_name="stub")
+    yield
+    resources._summarizer, resources.model_name = previous
+
+
+@pytest.fixture
+def season():
+    with open(os.path.join(ROOT, "premier_league_results_sample.json"), "r", encoding="utf-8") as f:
+        return json.load(f)[:12]
+
+
+def _run(tmp_path, entries, **kwargs):
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(entries), encoding="utf-8")
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        main.main(str(path), cache_path=None, manifest_path=str(tmp_path / "manifest.jsonl"),
+                  **kwargs)
+    finally:
+        os.chdir(cwd)
+
+
+def _lines(tmp_path):
+    with open(tmp_path / "manifest.jsonl", "r", encoding="utf-8") as f:
+        return [json.loads(line)["fingerprint"] for line in f]
+
+
+def _stored(tmp_path):
+    return len(set(_lines(tmp_path)))
+
+
+def _output(tmp_path):
+    with open(tmp_path / "test_processed.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_new_matches_reuse_results(tmp_path, stub_model, season, capsys):
+    _run(tmp_path, season[:10])
+    _run(tmp_path, season[:10])
+    assert "'reused': 10, 'processed': 0" in capsys.readouterr().out
+
+    # New matches grow the season names, but results only depend on their own match
+    _run(tmp_path, season)
+    assert "'reused': 10, 'processed': 2" in capsys.readouterr().out
+    assert len(_lines(tmp_path)) == 12
+
+    # Hallucinations of reused results are checked against the grown season
+    fresh = tmp_path / "fresh"
+    fresh.mkdir()
+    _run(fresh, season)
+    assert _output(tmp_path) == _output(fresh)
+
+
+def test_superseded_results_are_dropped(tmp_path, stub_model, season, capsys):
+    _run(tmp_path, season)
+    resources.set_summarizer(StubSummarizer(), model_name="stub-2")
+    _run(tmp_path, season[:10])
+    assert "'reused': 0, 'processed': 10" in capsys.readouterr().out
+    # The other model's results of these 10 matches are gone, the 2 left out stay
+    assert len(_lines(tmp_path)) == 12
+
+    _run(tmp_path, season)
+    assert "'reused': 10, 'processed': 2" in capsys.readouterr().out
+    assert len(_lines(tmp_path)) == 12
+
+
+def test_compact_only_on_request(tmp_path, stub_model, season):
+    _run(tmp_path, season)
+    _run(tmp_path, season[:10])
+    assert _stored(tmp_path) > 10
+
+    _run(tmp_path, season[:10], compact_manifest=True)
+    assert _stored(tmp_path) == 10
@@ -0,0 +1,106 @@
+# CSCI4152/6509 Fall 2025
+# Program: Offline Match Page Parser Test
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Pins the CSS selector engine, the Selenium-like element text and
+# the exact match dict parse_match_page rebuilds from the saved fixture pages.
+
+import os
+
+import pytest
+
+from utils.match_page import parse_html, parse_snapshot, snapshot_ids
+
+PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "match_pages")
+
+SELECTOR_PAGE = """
+<div id="root" class="card card--wide" data-testid="matchCard">
+  <ul data-testid="homeTeamGoals">
+    <li class="event goal">A</li>
+    <li class="event"><span class="goal">B</span></li>
+  </ul>
+  <section><div><p class="goal">C</p></div></section>
+  <button aria-label="Previous Month">prev</button>
+  <span class="card--wide-icon">D</span>
+</div>
+"""
+
+
+def _texts(root, selector):
+    return [el.text for el in root.select(selector)]
+
+
+def test_selectors():
+    root = parse_html(SELECTOR_PAGE)
+    # Descendant at any depth, in document order
+    assert _texts(root, "[data-testid='homeTeamGoals'] li") == ["A", "B"]
+    assert _texts(root, "div .goal") == ["A", "B", "C"]
+    assert _texts(root, "section p") == ["C"]
+    # Class combinations need every class; no prefix matches
+    assert _texts(root, "li.event.goal") == ["A"]
+    assert _texts(root, ".event .goal") == ["B"]
+    assert [el.attrs["id"] for el in root.select("div.card.card--wide")] == ["root"]
+    assert _texts(root, "span.card--wide-icon") == ["D"]
+    assert root.select(".card--wid") == []
+    # Attribute values may hold spaces; bare [attr] tests presence
+    assert _texts(root, "button[aria-label='Previous Month']") == ["prev"]
+    assert _texts(root, "div#root[data-testid] button") == ["prev"]
+    assert root.select("button[aria-label=Previous]") == []
+
+    with pytest.raises(LookupError):
+        root.select_one("article p")
+    with pytest.raises(ValueError):
+        root.select("ul > li")
+
+
+def test_text_matches_rendered_whitespace():
+    root = parse_html("""
+        <div id="t">  Big   Chances
+            Created&nbsp;<b>now</b>
+          <p>First</p><span hidden>hidden</span><em style="display: none">gone</em>
+          <p>   </p><script>var x = 1;</script>
+          Line<br>break
+        </div>""")
+    assert root.select_one("#t").text == "Big Chances Created now\nFirst\nLine\nbreak"
+
+
+def test_parse_match_page_fixture():
+    assert snapshot_ids(PAGES) == ["2561937"]
+    assert parse_snapshot(PAGES, "2561937") == {
+        "home_team": "Arsenal",
+        "away_team": "Chelsea",
+        "final_score": {"home": "3", "away": "1"},
+        "half_time_score": {"home": "1", "away": "0"},
+        "scorers": [
+            {"team": "Arsenal", "player": "Bukayo Saka", "minute": "12'"},
+            {"team": "Arsenal", "player": "Gabriel Martinelli", "minute": "58'"},
+            {"team": "Arsenal", "player": "Bukayo Saka", "minute": "90'+2"},
+            {"team": "Chelsea", "player": "Cole Palmer", "minute": "77'"},
+        ],
+        "cards": [
+            {"team": "Arsenal", "event": "Declan Rice 34'"},
+            {"team": "Chelsea", "event": "Moisés Caicedo 41'"},
+            # Found but not displayed, so empty like Selenium's text
+            {"team": "Chelsea", "event": ""},
+            {"team": "Chelsea", "event": "Enzo Fernández\n66'"},
+        ],
+        "stats": {
+            "Top Stats": [
+                {"stat": "Possession", "home": "58%", "away": "42%"},
+                {"stat": "XG", "home": "2.41", "away": "0.87"},
+                {"stat": "Shots On Target", "home": "7", "away": ""},
+            ],
+            "Attack": [{"stat": "Big Chances Created", "home": "4", "away": "1"}],
+        },
+        "report": "Bukayo Saka scored twice as Arsenal beat Chelsea at the Emirates.\n"
+                  "Gabriel Martinelli added a second after the break, before Cole Palmer pulled one back.\n"
+                  "Saka celebrates his opener\n"
+                  "Chelsea midfielder Moisés Caicedo limped off late on.\n"
+                  "He will be assessed this week.",
+    }
+
+
+def test_missing_report_snapshot(tmp_path):
+    with open(os.path.join(PAGES, "2561937.html"), encoding="utf-8") as f:
+        (tmp_path / "1.html").write_text(f.read(), encoding="utf-8")
+    match = parse_snapshot(str(tmp_path), "1")
+    assert match["report"] is None and match["home_team"] == "Arsenal"
@@ -0,0 +1,71 @@
+# CSCI4152/6509 Fall 2025
+# Program: Match Store Test
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Checks that a new match store is seeded from the existing
+# results file, that a scraped match replaces an imported one only with the
+# same date (also after reopening), and that export never shrinks the
+# results file.
+
+import json
+
+from utils.match_store import MatchStore
+
+
+def _match(home, away, score="1 - 0", date=None):
+    match = {"home_team": home, "away_team": away, "final_score": score, "report": ""}
+    if date:
+        match["date"] = date
+    return match
+
+
+def _results(tmp_path, matches):
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(matches), encoding="utf-8")
+    return str(path)
+
+
+def test_seed_and_replace_imported(tmp_path):
+    results = _results(tmp_path, [_match("Arsenal", "Chelsea", date="2024-10-05"),
+                                  _match("Arsenal", "Chelsea", "2 - 2", date="2025-10-04"),
+                                  _match("Everton", "Fulham")])
+    store_path = str(tmp_path / "store.jsonl")
+    with MatchStore(store_path) as store:
+        assert store.seed(results) == 3
+        # A store that already holds matches is never seeded again
+        assert store.seed(results) == 0
+        store.append_scraped("2561937", _match("Arsenal", "Chelsea", "3 - 1", date="2025-10-04"))
+        assert len(store) == 3
+        assert store.export(results)
+
+    with MatchStore(store_path) as store:
+        assert "2561937" in store and "Arsenal vs Chelsea #2" not in store
+        assert "Arsenal vs Chelsea" in store
+        # Re-extracting the same URL ID replaces nothing else
+        store.append_scraped("2561937", _match("Arsenal", "Chelsea", "3 - 2", date="2025-10-04"))
+        assert len(store) == 3
+
+    with open(results, encoding="utf-8") as f:
+        scores = sorted(m["final_score"] for m in json.load(f))
+    assert scores == ["1 - 0", "1 - 0", "3 - 1"]
+
+
+def test_scraped_fixture_without_date_is_appended(tmp_path):
+    # A new season's scrape of a fixture must not delete last season's match
+    results = _results(tmp_path, [_match("Brighton", "Leeds"), _match("Brighton", "Leeds", "0 - 0")])
+    with MatchStore(str(tmp_path / "store.jsonl")) as store:
+        store.seed(results)
+        store.append_scraped("2561937", _match("Brighton", "Leeds", "2 - 1"))
+        store.append_scraped("2561940", _match("Brighton", "Leeds", "1 - 1", date="2025-11-01"))
+        assert len(store) == 4
+        assert "Brighton vs Leeds" in store and "Brighton vs Leeds #2" in store
+        assert sorted(m["final_score"] for m in store) == ["0 - 0", "1 - 0", "1 - 1", "2 - 1"]
+
+
+def test_export_refuses_to_shrink(tmp_path):
+    results = _results(tmp_path, [_match("Arsenal", "Chelsea"), _match("Everton", "Fulham")])
+    with MatchStore(str(tmp_path / "store.jsonl")) as store:
+        store.append_scraped("1", _match("Leeds", "Burnley"))
+        assert not store.export(results)
+        with open(results, encoding="utf-8") as f:
+            assert len(json.load(f)) == 2
+        assert store.export(results, force=True)
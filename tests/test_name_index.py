@@ -0,0 +1,55 @@
+# CSCI4152/6509 Fall 2025
+# Program: Season Name Index Test
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Checks the hallucination name check on venues with a
+# possessive apostrophe, on nicknames that recur in season reports, and on
+# a processed result checked after the run against the season index.
+
+from collections import Counter
+
+from nlp.gazetteer import Gazetteer
+from main import add_hallucinations
+from nlp.name_index import NameIndex, name_mentions, report_mentions, use_name_index
+
+SEASON = [
+    {"home_team": "Newcastle", "away_team": "Fulham", "scorers": [{"player": "Anthony Gordon"}],
+     "report": "The Magpies won at St James' Park as Gordon scored."},
+    {"home_team": "Everton", "away_team": "Newcastle", "scorers": [],
+     "report": "The Magpies were held at Hill Dickinson Stadium. St James' Park awaits."},
+]
+
+
+def _index():
+    mentions = Counter()
+    for entry in SEASON:
+        mentions.update(report_mentions(entry["report"]))
+    return NameIndex.from_gazetteer(Gazetteer.from_entries(SEASON), mentions)
+
+
+def _flagged(index, summary):
+    return [text for _, _, text in index.find_unsupported(summary)]
+
+
+def test_possessive_apostrophe_continues_a_name():
+    assert name_mentions("They lost at St James' Park on Saturday.") == ["St James' Park"]
+
+
+def test_recurring_report_mentions_are_known():
+    index = _index()
+    assert _flagged(index, "Newcastle beat the Magpies' rivals at St James' Park.") == []
+    # Mentioned in one report only, and not a season name
+    assert _flagged(index, "Gordon scored at Hill Dickinson Stadium.") == ["Hill Dickinson Stadium"]
+    assert _flagged(index, "Gordon and Bruno Guimaraes scored.") == ["Bruno Guimaraes"]
+
+
+def test_processed_result_is_checked_against_the_season():
+    result = {"home_team": "Newcastle", "away_team": "Fulham", "key_players": ["Alexander Isak"],
+              "hybrid_summary": "Newcastle won at St James' Park.",
+              "raw_summary": "Isak, Gordon and Joelinton scored for Newcastle.",
+              "raw_text": "Newcastle beat Fulham."}
+    use_name_index(_index())
+    try:
+        add_hallucinations(result)
+    finally:
+        use_name_index(None)
+    assert result["hallucinations"] == {"hybrid_summary": [], "raw_summary": [(17, 26, "Joelinton")]}
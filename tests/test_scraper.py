@@ -0,0 +1,147 @@
+# CSCI4152/6509 Fall 2025
+# Program: Scraper Worker Test
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Runs scrape_worker and write_results end to end on saved match
+# pages through a fake WebDriver, so the real waits, clicks, retries and store
+# writes are exercised without a browser; the stored match must equal the
+# offline parse of the same pages, also after retried timeouts.
+
+import os
+import queue
+import re
+
+import pytest
+
+pytest.importorskip("selenium")
+
+import epl_scraper
+from bench_scraper import snapshot_report
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from utils.crawl_frontier import match_id_from_url
+from utils.match_page import (
+    REPORT_BUTTON, SNAPSHOT_PAGE, SNAPSHOT_REPORT, parse_html, parse_snapshot,
+)
+from utils.match_store import MatchStore
+
+PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "match_pages")
+XPATH_BUTTON = re.compile(r"//button\[(?:normalize-space\(\)='(.*)'|contains\(text\(\), '(.*)'\))\]")
+
+
+class FakeElement:
+    def __init__(self, driver, element):
+        self.driver = driver
+        self.element = element
+
+    @property
+    def text(self):
+        return self.element.text
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        # The page snapshot is taken on the Stats tab, the report one with the report open
+        if self.element in self.driver.root.select(REPORT_BUTTON):
+            self.driver.load(SNAPSHOT_REPORT)
+        elif self.element.tag == "button" and self.element.text == "Stats":
+            self.driver.load(SNAPSHOT_PAGE)
+
+    def find_element(self, by, value):
+        return self.driver.find_element(by, value, self.element)
+
+    def find_elements(self, by, value):
+        return self.driver.find_elements(by, value, self.element)
+
+
+class FakeDriver:
+    """Renders <match_id>.html of the fixture pages for /match/<match_id> URLs."""
+
+    def __init__(self, fail_urls=(), timeouts=None):
+        self.fail_urls = set(fail_urls)
+        self.timeouts = dict(timeouts or {})
+        self.current_url = None
+        self.root = None
+        self.quit_called = False
+
+    def load(self, name):
+        with open(os.path.join(PAGES, name.format(match_id_from_url(self.current_url))),
+                  encoding="utf-8") as f:
+            self.page_source = f.read()
+        self.root = parse_html(self.page_source)
+
+    def get(self, url):
+        if url in self.fail_urls:
+            raise WebDriverException("net::ERR_CONNECTION_REFUSED")
+        if self.timeouts.get(url):
+            self.timeouts[url] -= 1
+            raise TimeoutException(url)
+        self.current_url = url
+        self.load(SNAPSHOT_PAGE)
+
+    def refresh(self):
+        self.load(SNAPSHOT_PAGE)
+
+    def find_elements(self, by, value, scope=None):
+        scope = scope or self.root
+        if by == By.XPATH:
+            m = XPATH_BUTTON.fullmatch(value)
+            label = m.group(1) or m.group(2)
+            found = [el for el in scope.select("button")
+                     if (el.text == label if m.group(1) else label in el.text)]
+        else:
+            # CSS selectors and tag names
+            found = scope.select(value)
+        return [FakeElement(self, el) for el in found]
+
+    def find_element(self, by, value, scope=None):
+        found = self.find_elements(by, value, scope)
+        if not found:
+            raise NoSuchElementException(value)
+        return found[0]
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_worker_and_writer_store_the_offline_parse(tmp_path, monkeypatch, fast):
+    monkeypatch.setattr(epl_scraper, "human_delay", lambda *args: None)
+    ok_url = "http://127.0.0.1/match/2561937/arsenal-chelsea"
+    down_url = "http://127.0.0.1/match/2561999/down"
+    url_queue = queue.Queue()
+    for url in (ok_url, down_url):
+        url_queue.put(url)
+    results = queue.Queue()
+    driver = FakeDriver(fail_urls=[down_url])
+
+    epl_scraper.scrape_worker(0, url_queue, results, epl_scraper.RateLimiter(0), lambda: driver,
+                              delay=(0, 0), retries=0, fast=fast)
+    assert driver.quit_called
+    results.put(None)
+
+    stats = {"scraped": 0, "failed": 0}
+    with MatchStore(str(tmp_path / "store.jsonl")) as store:
+        epl_scraper.write_results(store, results, stats)
+        assert stats == {"scraped": 1, "failed": 1}
+        assert list(store.offsets) == ["2561937"]
+        assert store.get("2561937") == parse_snapshot(PAGES, "2561937")
+
+
+def test_timeouts_are_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(epl_scraper, "human_delay", lambda *args: None)
+    url = "http://127.0.0.1/match/2561937/arsenal-chelsea"
+    url_queue = queue.Queue()
+    url_queue.put(url)
+    results = queue.Queue()
+    driver = FakeDriver(timeouts={url: 2})
+
+    epl_scraper.scrape_worker(0, url_queue, results, epl_scraper.RateLimiter(0), lambda: driver,
+                              delay=(0, 0), retries=2, backoff=0)
+    status, _, match = results.get_nowait()
+    assert status == "ok" and results.empty()
+    # The benchmark's report stand-in reads the same report from the snapshot
+    assert snapshot_report(PAGES)(driver) == match["report"]
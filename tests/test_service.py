@@ -0,0 +1,72 @@
+# CSCI4152/6509 Fall 2025
+# Program: Summarization Service Test
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Drives the service's /summarize route with a stub batch
+# function: list requests are queued all or none (413 when larger than the
+# queue, 503 without running anything when it is full), and a failing match
+# only fails its own request.
+
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import ROOT
+from service import MicroBatcher, SummarizationService
+
+with open(os.path.join(ROOT, "premier_league_results_sample.json"), "r", encoding="utf-8") as f:
+    SAMPLE = json.load(f)[:12]
+
+
+class StubBatch:
+    """Returns each match's home team; fails any batch holding a match with home team 'Bad'."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, records):
+        self.calls.append(len(records))
+        if any(r.home_team == "Bad" for r in records):
+            raise RuntimeError("bad match")
+        return [r.home_team for r in records]
+
+
+def _route(run_batch, bodies, max_queue=5, max_batch=4):
+    async def go():
+        with ThreadPoolExecutor(1) as executor:
+            batcher = MicroBatcher(run_batch, executor, max_batch=max_batch, max_wait=0.01,
+                                   max_queue=max_queue)
+            batcher.start()
+            service = SummarizationService(batcher)
+            try:
+                return await asyncio.gather(*(service._route("POST", "/summarize",
+                                                             json.dumps(b).encode())
+                                              for b in bodies))
+            finally:
+                await batcher.stop()
+    return asyncio.run(go())
+
+
+def test_list_larger_than_queue_is_rejected_before_running():
+    run_batch = StubBatch()
+    [(status, payload)] = _route(run_batch, [SAMPLE])
+    assert status == 413 and "at most 5" in payload["error"]
+    assert run_batch.calls == []
+
+
+def test_list_is_queued_all_or_none():
+    run_batch = StubBatch()
+    (first, _), (second, _) = _route(run_batch, [SAMPLE[:4], SAMPLE[4:8]])
+    assert (first, second) == (200, 503)
+    assert sum(run_batch.calls) == 4
+
+
+def test_failing_match_only_fails_its_request():
+    run_batch = StubBatch()
+    bad = dict(SAMPLE[0], home_team="Bad")
+    results = _route(run_batch, [SAMPLE[1], bad, [SAMPLE[2], bad]])
+    assert results[0] == (200, SAMPLE[1]["home_team"])
+    assert results[1][0] == 500
+    status, payload = results[2]
+    assert status == 500 and payload["results"][0] == SAMPLE[2]["home_team"]
+    assert "bad match" in payload["results"][1]["error"]
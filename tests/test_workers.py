@@ -0,0 +1,104 @@
+# CSCI4152/6509 Fall 2025
+# Program: Worker Pool Equivalence Test
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Runs main.main on part of the bundled sample with one
+# process and with a worker pool and checks the train/test output files are
+# byte-identical, including windows that straddle the train/test boundary:
+# with a stub summarizer, and with the real pool initializer loading a tiny
+# random BART, the summary cache, an injury lexicon, the gazetteer and
+# metrics in every worker.
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+import analysis.injuries
+import main
+import nlp.entities
+from bench_pipeline import StubSummarizer
+from conftest import ROOT
+from nlp.entities import use_gazetteer
+from nlp.resources import resources
+
+MATCHES = 30
+# 27 train + 3 test matches: the window of matches 24-27 spans both
+BATCH_SIZE = 4
+
+
+def _init_stub_worker(gazetteer):
+    resources.set_summarizer(StubSummarizer(), model_name="stub")
+    if gazetteer is not None:
+        use_gazetteer(gazetteer)
+
+
+def _stub_pool(workers, cache_path, cache_size, injury_lexicon, gazetteer, *_):
+    ctx = multiprocessing.get_context("spawn")
+    return ctx.Pool(workers, initializer=_init_stub_worker, initargs=(gazetteer,))
+
+
+@pytest.fixture
+def sample_input(tmp_path):
+    with open(os.path.join(ROOT, "premier_league_results_sample.json"), "r", encoding="utf-8") as f:
+        entries = json.load(f)[:MATCHES]
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(entries), encoding="utf-8")
+    return str(path)
+
+
+def _run(tmp_path, name, sample_input, workers, stream, **kwargs):
+    out = tmp_path / name
+    out.mkdir()
+    cwd = os.getcwd()
+    os.chdir(out)
+    kwargs.setdefault("cache_path", None)
+    try:
+        main.main(sample_input, batch_size=BATCH_SIZE, workers=workers, manifest_path=None,
+                  stream=stream, **kwargs)
+    finally:
+        os.chdir(cwd)
+    suffix = "jsonl" if stream else "json"
+    return [(out / f"{split}_processed.{suffix}").read_bytes() for split in ("train", "test")]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_pool_output_matches_serial(tmp_path, monkeypatch, sample_input, stream):
+    previous = resources._summarizer, resources.model_name
+    resources.set_summarizer(StubSummarizer(), model_name="stub")
+    monkeypatch.setattr(main, "start_pool", _stub_pool)
+    try:
+        serial = _run(tmp_path, "serial", sample_input, 1, stream)
+        pooled = _run(tmp_path, "pooled", sample_input, 2, stream)
+    finally:
+        resources._summarizer, resources.model_name = previous
+
+    assert serial[0] and serial[1]
+    assert pooled == serial
+
+
+def test_real_pool_matches_serial(tmp_path, monkeypatch, sample_input, tiny_model):
+    # main() installs these process-wide; restored after the test
+    monkeypatch.setattr(analysis.injuries, "_default_matcher", analysis.injuries._default_matcher)
+    monkeypatch.setattr(nlp.entities, "_default_extractor", nlp.entities._default_extractor)
+    previous = resources._summarizer, resources.model_name
+    resources.use_model(tiny_model)
+    lexicon = tmp_path / "lexicon.json"
+    lexicon.write_text(json.dumps({"triggers": ["limped off"]}), encoding="utf-8")
+
+    def run(name, workers):
+        return _run(tmp_path, name, sample_input, workers, False, fast_ner=True,
+                    injury_lexicon=str(lexicon), cache_path=str(tmp_path / f"{name}.sqlite"),
+                    metrics_path=str(tmp_path / f"{name}.metrics.jsonl"))
+
+    try:
+        serial = run("serial", 1)
+        pooled = run("pooled", 2)
+    finally:
+        resources._summarizer, resources.model_name = previous
+
+    assert pooled == serial
+    # Every worker appended its own per-match records
+    with open(tmp_path / "pooled.metrics.jsonl", encoding="utf-8") as f:
+        pids = {json.loads(line)["pid"] for line in f}
+    assert len(pids) == 2
@@ -0,0 +1,77 @@
+# CSCI4152/6509 Fall 2025
+# Program: Aho-Corasick Matcher
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Multi-pattern string matcher used for lexicon and name lookups.
+# Built once from many phrases, it finds every occurrence of all of them in a
+# single left-to-right pass over the text.
+
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over characters.
+    add(pattern, value) registers phrases, build() links the failure edges,
+    and iter_matches(text) yields (start, end, value) for every occurrence.
+    """
+
+    def __init__(self, patterns=()):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._built = False
+        for pattern, value in patterns:
+            self.add(pattern, value)
+
+    def add(self, pattern, value=None):
+        """Registers one pattern; value defaults to the pattern itself."""
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), pattern if value is None else value))
+        self._built = False
+
+    def build(self):
+        """Computes failure links breadth-first and merges their outputs."""
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+        self._built = True
+        return self
+
+    def iter_matches(self, text):
+        """
+        Yields (start, end, value) for every pattern occurrence, ordered by end.
+        """
+        if not self._built:
+            self.build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, value in out[state]:
+                yield i + 1 - length, i + 1, value
@@ -0,0 +1,208 @@
+# CSCI4152/6509 Fall 2025
+# Program: Crawl Frontier
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Persistent SQLite frontier of the scraper: every listed match
+# URL keyed by match ID with its status (pending, done, failed), attempt
+# count and last failure reason, plus which listing months are finished, so a
+# rerun only visits new months and new or previously failed matches.
+
+import argparse
+import os
+import re
+import sqlite3
+import threading
+import time
+
+DEFAULT_FRONTIER_PATH = "crawl_frontier.sqlite"
+
+PENDING, DONE, FAILED = "pending", "done", "failed"
+
+
+def match_id_from_url(url):
+    # Match pages look like .../match/2561937/...; fall back to the full URL
+    m = re.search(r"/match/(\d+)", url or "")
+    return m.group(1) if m else url
+
+
+class CrawlFrontier:
+    """
+    matches: one row per match ID with its URL, listing month, status,
+    attempts and last failure reason.
+    months: listing months ("2025-11") and whether every match listed in
+    them was done at the end of a run.
+    A month is settled when an earlier run finished it and once walked the
+    listing to its last month; the walk back stops there, as older months
+    were finished before it.
+    """
+
+    def __init__(self, path=DEFAULT_FRONTIER_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def conn(self):
+        # The store writer thread records results, so the connection is shared
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS matches ("
+                " match_id TEXT PRIMARY KEY,"
+                " url TEXT NOT NULL,"
+                " month TEXT,"
+                " status TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " reason TEXT,"
+                " updated REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON matches(status)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS months ("
+                " month TEXT PRIMARY KEY,"
+                " complete INTEGER NOT NULL DEFAULT 0,"
+                " listed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+        return self._conn
+
+    def add_month(self, month, urls, scraped=()):
+        """
+        Records the match URLs listed for a month; IDs in scraped (e.g. the
+        match store) are recorded as done. Returns True when the month is
+        settled and the walk back can stop.
+        """
+        now = time.time()
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT complete FROM months WHERE month = ?", (month,)).fetchone()
+            added = 0
+            for url in urls:
+                match_id = match_id_from_url(url)
+                status = DONE if match_id in scraped else PENDING
+                cur = self.conn.execute(
+                    "INSERT OR IGNORE INTO matches (match_id, url, month, status, updated)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (match_id, url, month, status, now)
+                )
+                added += cur.rowcount
+                if status == DONE:
+                    self.conn.execute(
+                        "UPDATE matches SET status = ?, updated = ? WHERE match_id = ? AND status != ?",
+                        (DONE, now, match_id, DONE)
+                    )
+            self.conn.execute(
+                "INSERT INTO months (month, complete, listed) VALUES (?, 0, ?)"
+                " ON CONFLICT(month) DO UPDATE SET listed = excluded.listed",
+                (month, now)
+            )
+            if added:
+                self.conn.execute("UPDATE months SET complete = 0 WHERE month = ?", (month,))
+        return bool(row and row[0]) and not added and self.listed_to_end
+
+    def is_done(self, url):
+        row = self.conn.execute(
+            "SELECT status FROM matches WHERE match_id = ?", (match_id_from_url(url),)
+        ).fetchone()
+        return bool(row) and row[0] == DONE
+
+    def todo(self, urls=None):
+        """
+        URLs still to scrape: those of urls not done yet, or with no urls
+        every pending or failed match in the frontier, oldest first.
+        """
+        if urls is not None:
+            return [u for u in dict.fromkeys(urls) if not self.is_done(u)]
+        rows = self.conn.execute(
+            "SELECT url FROM matches WHERE status != ? ORDER BY updated", (DONE,)
+        ).fetchall()
+        return [url for (url,) in rows]
+
+    def failed_urls(self):
+        rows = self.conn.execute(
+            "SELECT url FROM matches WHERE status = ? ORDER BY updated", (FAILED,)
+        ).fetchall()
+        return [url for (url,) in rows]
+
+    def mark_done(self, url):
+        self._set(url, DONE, None)
+
+    def mark_failed(self, url, reason):
+        self._set(url, FAILED, reason)
+
+    def _set(self, url, status, reason):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO matches (match_id, url, status, attempts, reason, updated)"
+                " VALUES (?, ?, ?, 1, ?, ?)"
+                " ON CONFLICT(match_id) DO UPDATE SET status = excluded.status,"
+                " attempts = attempts + 1, reason = excluded.reason, updated = excluded.updated",
+                (match_id_from_url(url), url, status, reason, time.time())
+            )
+
+    def settle_months(self):
+        """Marks months complete when every match listed in them is done."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE months SET complete = NOT EXISTS ("
+                " SELECT 1 FROM matches WHERE matches.month = months.month AND status != ?)",
+                (DONE,)
+            )
+
+    @property
+    def listed_to_end(self):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'listed_to_end'").fetchone()
+        return bool(row and row[0] == "1")
+
+    def mark_listed_to_end(self):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('listed_to_end', '1')")
+
+    def failures(self):
+        """(url, attempts, reason) of every failed match, oldest first."""
+        return self.conn.execute(
+            "SELECT url, attempts, reason FROM matches WHERE status = ? ORDER BY updated", (FAILED,)
+        ).fetchall()
+
+    def stats(self):
+        counts = dict(self.conn.execute("SELECT status, COUNT(*) FROM matches GROUP BY status"))
+        months, complete = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(complete), 0) FROM months"
+        ).fetchone()
+        return {"matches": sum(counts.values()), "done": counts.get(DONE, 0),
+                "pending": counts.get(PENDING, 0), "failed": counts.get(FAILED, 0),
+                "months": months, "complete_months": complete}
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the scraper's crawl frontier")
+    parser.add_argument("--path", default=DEFAULT_FRONTIER_PATH)
+    parser.add_argument("--failures", action="store_true",
+                        help="list failed match URLs with their attempts and last reason")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"No frontier at {args.path}")
+        return
+
+    with CrawlFrontier(args.path) as frontier:
+        if args.failures:
+            for url, attempts, reason in frontier.failures():
+                print(f"{url}\t{attempts}\t{reason}")
+        print(frontier.stats())
+
+
+if __name__ == "__main__":
+    main()
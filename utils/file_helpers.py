@@ -1,10 +1,12 @@
 # CSCI4152/6509 Fall 2025
 # Program: File Helpers
 # Author: Terry Quach, B00919525, hn886911@dal.ca
-# Description: Provides helper functions for reading/writing JSON files
-# and other file operations in the EPL summarization pipeline.
+# Description: Provides helper functions for reading/writing JSON and JSONL
+# files (including streaming reads and incremental writes) and other file
+# operations in the EPL summarization pipeline.
 
 
+import itertools
 import json
 import os
 
@@ -29,3 +31,88 @@ def append_to_json(entry, filename):
     data = load_json(filename)
     data.append(entry)
     save_json(data, filename)
+
+
+def iter_json_records(filename, chunk_size=1 << 16):
+    """
+    Yields the records of a JSON array file or a JSONL file one at a time,
+    without loading the whole file. A JSONL line cut off by a writer that
+    is still running (no trailing newline) is skipped.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        head = f.read(1)
+        while head and head.isspace():
+            head = f.read(1)
+
+        if head != "[":
+            for line in itertools.chain([head + f.readline()], f):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    if line.endswith("\n"):
+                        raise
+                    return
+            return
+
+        decoder = json.JSONDecoder()
+        buf, pos, eof = "", 0, False
+        while True:
+            while pos < len(buf) and (buf[pos].isspace() or buf[pos] == ","):
+                pos += 1
+            if pos < len(buf) and buf[pos] == "]":
+                return
+            try:
+                record, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # Record spans the buffer end: drop what was consumed and read on
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            yield record
+
+
+def load_records(filename):
+    """Load every record of a JSON array or JSONL file into a list."""
+    if not os.path.exists(filename):
+        return []
+    return list(iter_json_records(filename))
+
+
+class JsonlWriter:
+    """
+    Appends one JSON record per line, flushing to disk every flush_every
+    records so readers and crash recovery see finished results early.
+    """
+
+    def __init__(self, filename, flush_every=1, append=False):
+        self.filename = filename
+        self.flush_every = max(1, flush_every)
+        self.count = 0
+        self._file = open(filename, "a" if append else "w", encoding="utf-8")
+
+    def write(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.flush()
+
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            print(f"💾 Saved {self.count} records to {self.filename}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
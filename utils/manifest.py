@@ -0,0 +1,190 @@
+# CSCI4152/6509 Fall 2025
+# Program: Processing Manifest
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Fingerprints scraped matches and stores the processed result of
+# each fingerprint in an append-only JSONL file, so reruns only process new
+# or changed matches and an interrupted run resumes where it stopped.
+
+import hashlib
+import json
+import os
+
+# Bump when a change to the pipeline should reprocess every match
+PIPELINE_VERSION = 3
+
+DEFAULT_MANIFEST_PATH = "processed_manifest.jsonl"
+
+
+def file_digest(path):
+    """sha256 of a settings file's contents, or None when no file is given."""
+    if not path:
+        return None
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _sha256(payload):
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def match_digest(record):
+    """
+    Hash of a MatchRecord's own inputs: teams, score, scorers, stats and
+    report. Nothing outside the match goes in, so adding matches to the
+    input never changes the digest of the others.
+    """
+    report_hash = hashlib.sha256((record.report or "").encode("utf-8")).hexdigest()
+    return _sha256([
+        record.home_team, record.away_team, record.home_goals, record.away_goals,
+        [[g.team, g.player, list(g.minutes)] for g in record.scorers],
+        sorted([name, row[0], row[1]] for name, row in record.stats.items()),
+        report_hash,
+    ])
+
+
+def match_fingerprint(record, settings=None, digest=None):
+    """
+    Stable fingerprint of a MatchRecord: its match_digest (pass digest when
+    already computed) plus the pipeline version and the run settings that
+    change results (model name, NER mode, ...).
+    """
+    return _sha256([
+        PIPELINE_VERSION,
+        sorted((settings or {}).items()),
+        digest or match_digest(record),
+    ])
+
+
+class ProcessingManifest:
+    """
+    Append-only JSONL of {"fingerprint", "match", "result"} lines, where
+    match is the match_digest. Only the byte offset of each fingerprint's
+    latest line is kept in memory; results are read back on demand. A line
+    cut off by a crash is dropped on open. A line is superseded by a later
+    one for the same match under other settings (new model, lexicon, ...).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offsets = {}
+        self.lines = 0
+        # Latest fingerprint per match digest, and fingerprints replaced since
+        self.matches = {}
+        self.superseded = set()
+        self.touched = set()
+        self.reused = 0
+        self.added = 0
+        self._file = None
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        good = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                    fingerprint = entry["fingerprint"]
+                except (ValueError, KeyError):
+                    break
+                self.offsets[fingerprint] = good
+                self._track(fingerprint, entry.get("match"))
+                self.lines += 1
+                good += len(line)
+        if good != os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(good)
+
+    @property
+    def file(self):
+        if self._file is None:
+            self._file = open(self.path, "a+b")
+        return self._file
+
+    def __contains__(self, fingerprint):
+        return fingerprint in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def get(self, fingerprint):
+        """Stored result of a fingerprint, or None."""
+        offset = self.offsets.get(fingerprint)
+        if offset is None:
+            return None
+        self.file.seek(offset)
+        entry = json.loads(self.file.readline())
+        # Reused under these settings, so this is the match's current line again
+        self._track(fingerprint, entry.get("match"))
+        self.touched.add(fingerprint)
+        self.reused += 1
+        return entry["result"]
+
+    def _track(self, fingerprint, digest):
+        if digest is None:
+            return
+        previous = self.matches.get(digest)
+        if previous is not None and previous != fingerprint:
+            self.superseded.add(previous)
+        self.superseded.discard(fingerprint)
+        self.matches[digest] = fingerprint
+
+    def add(self, fingerprint, result, digest=None):
+        """Stores a result; digest (match_digest) lets later runs drop it once superseded."""
+        line = json.dumps({"fingerprint": fingerprint, "match": digest, "result": result},
+                          ensure_ascii=False)
+        self.file.seek(0, os.SEEK_END)
+        self.offsets[fingerprint] = self.file.tell()
+        self.file.write(line.encode("utf-8") + b"\n")
+        # Flushed per match so a crash loses at most the match in progress
+        self.file.flush()
+        self._track(fingerprint, digest)
+        self.touched.add(fingerprint)
+        self.lines += 1
+        self.added += 1
+
+    def compact(self, keep=None):
+        """
+        Rewrites the file with only the latest line of each fingerprint in
+        keep (default: those used by this run), dropping matches that left
+        the input and superseded lines. No-op when nothing would be dropped.
+        """
+        keep = self.touched if keep is None else set(keep)
+        if self.lines == len(self.offsets) and keep >= self.offsets.keys():
+            return
+        tmp_path = self.path + ".tmp"
+        offsets = {}
+        with open(tmp_path, "wb") as out:
+            for fingerprint in keep:
+                offset = self.offsets.get(fingerprint)
+                if offset is None or fingerprint in offsets:
+                    continue
+                self.file.seek(offset)
+                offsets[fingerprint] = out.tell()
+                out.write(self.file.readline())
+        self.close()
+        os.replace(tmp_path, self.path)
+        self.offsets = offsets
+        self.lines = len(offsets)
+        self.matches = {d: f for d, f in self.matches.items() if f in offsets}
+        self.superseded &= offsets.keys()
+
+    def drop_superseded(self):
+        """
+        Compacts away superseded and repeated lines, keeping every current
+        result, also those of matches not in this run's input. Called after
+        every run so the file does not grow with each settings change.
+        """
+        self.compact(self.offsets.keys() - self.superseded)
+
+    def stats(self):
+        return {"stored": len(self.offsets), "reused": self.reused, "processed": self.added}
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,339 @@
+# CSCI4152/6509 Fall 2025
+# Program: Offline Match Page Parser
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: CSS selectors of the premierleague.com match page, shared with
+# epl_scraper.py, and a pure-Python (html.parser) extractor that rebuilds the
+# scraped match dict from saved HTML snapshots without a browser.
+
+import argparse
+import os
+import re
+from html.parser import HTMLParser
+
+# --- Selectors shared by the live scraper and the offline parser ---
+SCOREBOARD = "[data-testid='scoreboardContainer']"
+SCOREBOARD_TEAM = "[data-testid='scoreboardHeaderTeam']"
+TEAM_NAME = ".scoreboard-header__team-name"
+SCORE_HOME = ".match-status__score--home"
+SCORE_AWAY = ".match-status__score--away"
+HALF_TIME = "[data-testid='matchStatusHalfTime']"
+GOALS = {"home": "[data-testid='homeTeamGoals'] li", "away": "[data-testid='awayTeamGoals'] li"}
+SCORER = "[data-testid='scoreboardEventScorer']"
+SCORER_MINUTE = "[data-testid='scoreboardEventScorer'] span"
+YELLOW_CARDS = {"home": "[data-testid='homeTeamYellowCards'] li",
+                "away": "[data-testid='awayTeamYellowCards'] li"}
+STATS_CONTAINER = "div[data-testid='matchStatsContainer']"
+STATS_TITLE = ".match-stats__title"
+STATS_ROW = ".match-stats__table-row"
+STAT_NAME = ".match-stats__stat-name"
+STAT_PERCENTAGE = {"home": ".match-stats__stat-percentage--home",
+                   "away": ".match-stats__stat-percentage--away"}
+STAT_CELL = {"home": ".match-stats__table-cell--home", "away": ".match-stats__table-cell--away"}
+REPORT_BUTTON = "button[data-testid='matchReportInternal']"
+REPORT_CONTENT = "article[data-testid='matchReportInternalFull'] .temp-article__content"
+
+# Snapshot files written by the scraper for each match ID
+SNAPSHOT_PAGE = "{}.html"
+SNAPSHOT_REPORT = "{}.report.html"
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+             "source", "track", "wbr"}
+HIDDEN_TAGS = {"head", "script", "style", "noscript", "template"}
+BLOCK_TAGS = {"address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset",
+              "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+              "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+              "tbody", "td", "tfoot", "th", "thead", "tr", "ul"}
+
+
+class Element:
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag, attrs, parent=None):
+        self.tag = tag
+        self.attrs = attrs
+        self.children = []
+        self.parent = parent
+
+    def iter(self):
+        """Descendant elements in document order."""
+        stack = [c for c in reversed(self.children) if isinstance(c, Element)]
+        while stack:
+            el = stack.pop()
+            yield el
+            stack.extend(c for c in reversed(el.children) if isinstance(c, Element))
+
+    def select(self, selector):
+        """Descendants matching a CSS selector, like Selenium find_elements."""
+        compounds = [_parse_compound(part) for part in _split_selector(selector)]
+        return [el for el in self.iter() if _matches(el, compounds)]
+
+    def select_one(self, selector):
+        """First match of a CSS selector; raises LookupError like find_element."""
+        compounds = [_parse_compound(part) for part in _split_selector(selector)]
+        for el in self.iter():
+            if _matches(el, compounds):
+                return el
+        raise LookupError(f"no element matches {selector!r}")
+
+    @property
+    def text(self):
+        """Rendered text approximating Selenium's element.text."""
+        parts = []
+        _collect_text(self, parts)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document", {})
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        parent = self.stack[-1]
+        el = Element(tag, {k: (v if v is not None else "") for k, v in attrs}, parent)
+        parent.children.append(el)
+        if tag not in VOID_TAGS:
+            self.stack.append(el)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(html):
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# --- Minimal CSS selector engine: tag, .class, [attr], [attr='v'], descendant ---
+_COMPOUND = re.compile(r"([a-zA-Z][\w-]*)|\.([\w-]+)|#([\w-]+)|\[([\w-]+)(?:=(['\"]?)(.*?)\5)?\]")
+
+
+def _split_selector(selector):
+    # Split on whitespace outside [...] (attribute values may hold spaces)
+    parts, depth, current = [], 0, ""
+    for ch in selector.strip():
+        depth += ch == "["
+        depth -= ch == "]"
+        if ch.isspace() and not depth:
+            if current:
+                parts.append(current)
+            current = ""
+        else:
+            current += ch
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _parse_compound(part):
+    tag, checks, pos = None, [], 0
+    while pos < len(part):
+        m = _COMPOUND.match(part, pos)
+        if not m:
+            raise ValueError(f"unsupported selector: {part!r}")
+        if m.group(1):
+            tag = m.group(1).lower()
+        elif m.group(2):
+            checks.append(("class", m.group(2)))
+        elif m.group(3):
+            checks.append(("id", m.group(3)))
+        else:
+            checks.append(("attr", m.group(4), m.group(6)))
+        pos = m.end()
+    return tag, checks
+
+
+def _matches_compound(el, compound):
+    tag, checks = compound
+    if tag and el.tag != tag:
+        return False
+    for check in checks:
+        if check[0] == "class":
+            if check[1] not in el.attrs.get("class", "").split():
+                return False
+        elif check[0] == "id":
+            if el.attrs.get("id") != check[1]:
+                return False
+        elif check[1] not in el.attrs or (check[2] is not None and el.attrs[check[1]] != check[2]):
+            return False
+    return True
+
+
+def _matches(el, compounds):
+    if not _matches_compound(el, compounds[-1]):
+        return False
+    # Remaining compounds must match ancestors, right to left
+    i, node = len(compounds) - 2, el.parent
+    while i >= 0 and node is not None:
+        if node.tag != "#document" and _matches_compound(node, compounds[i]):
+            i -= 1
+        node = node.parent
+    return i < 0
+
+
+_SOURCE_WHITESPACE = str.maketrans("\n\r\t\f\xa0", "     ")
+
+
+def _collect_text(el, parts):
+    if el.tag in HIDDEN_TAGS or "hidden" in el.attrs or \
+            "display:none" in el.attrs.get("style", "").replace(" ", ""):
+        return
+    block = el.tag in BLOCK_TAGS
+    if block:
+        parts.append("\n")
+    for child in el.children:
+        if isinstance(child, Element):
+            if child.tag == "br":
+                parts.append("\n")
+            else:
+                _collect_text(child, parts)
+        else:
+            # Line breaks in the HTML source are plain whitespace when rendered
+            parts.append(child.translate(_SOURCE_WHITESPACE))
+    if block:
+        parts.append("\n")
+
+
+# --- Match extraction, mirroring epl_scraper.scrape_match ---
+def parse_stats(root):
+    stats_data = {}
+    for container in root.select(STATS_CONTAINER):
+        try:
+            title = container.select_one(STATS_TITLE).text.strip()
+        except LookupError:
+            continue
+
+        stats_data[title] = []
+        for row in container.select(STATS_ROW):
+            try:
+                stat_name = row.select_one(STAT_NAME).text.strip()
+            except LookupError:
+                continue
+            try:
+                home_val = row.select_one(STAT_PERCENTAGE["home"]).text.strip()
+                away_val = row.select_one(STAT_PERCENTAGE["away"]).text.strip()
+            except LookupError:
+                home_val = _text_or_none(row, STAT_CELL["home"])
+                away_val = _text_or_none(row, STAT_CELL["away"])
+            stats_data[title].append({"stat": stat_name, "home": home_val, "away": away_val})
+    return stats_data
+
+
+def parse_report(root):
+    try:
+        full_report = root.select_one(REPORT_CONTENT)
+    except LookupError:
+        return None
+    paragraphs = full_report.select("p")
+    return "\n".join([p.text.strip() for p in paragraphs if p.text.strip()])
+
+
+def parse_match_page(html, report_html=None):
+    """
+    Builds the scraped match dict from a page snapshot (scoreboard and Stats
+    tab) and the snapshot taken with the match report open.
+    """
+    root = parse_html(html)
+    root.select_one(SCOREBOARD)
+
+    match_report = parse_report(parse_html(report_html)) if report_html else None
+
+    teams = root.select(SCOREBOARD_TEAM)
+    home_team = teams[0].select_one(TEAM_NAME).text.strip()
+    away_team = teams[1].select_one(TEAM_NAME).text.strip()
+
+    home_score = root.select_one(SCORE_HOME).text.strip()
+    away_score = root.select_one(SCORE_AWAY).text.strip()
+
+    try:
+        ht_text = root.select_one(HALF_TIME).text
+        ht_numbers = ht_text.replace("HT", "").strip().split("-")
+        ht_home, ht_away = ht_numbers[0].strip(), ht_numbers[1].strip()
+    except (LookupError, IndexError):
+        ht_home, ht_away = None, None
+
+    scorers = []
+    for side, team_name in (("home", home_team), ("away", away_team)):
+        for g in root.select(GOALS[side]):
+            scorer = g.select_one(SCORER).text.strip()
+            minute = g.select_one(SCORER_MINUTE).text.strip()
+            scorers.append({"team": team_name, "player": scorer.replace(minute, "").strip(), "minute": minute})
+
+    cards = []
+    for side, team_name in (("home", home_team), ("away", away_team)):
+        for c in root.select(YELLOW_CARDS[side]):
+            cards.append({"team": team_name, "event": c.text.strip()})
+
+    return {"home_team": home_team, "away_team": away_team,
+            "final_score": {"home": home_score, "away": away_score},
+            "half_time_score": {"home": ht_home, "away": ht_away},
+            "scorers": scorers, "cards": cards, "stats": parse_stats(root),
+            "report": match_report}
+
+
+def _text_or_none(root, selector):
+    try:
+        return root.select_one(selector).text.strip()
+    except LookupError:
+        return None
+
+
+def parse_snapshot(snapshot_dir, match_id):
+    with open(os.path.join(snapshot_dir, SNAPSHOT_PAGE.format(match_id)), encoding="utf-8") as f:
+        html = f.read()
+    report_path = os.path.join(snapshot_dir, SNAPSHOT_REPORT.format(match_id))
+    report_html = None
+    if os.path.exists(report_path):
+        with open(report_path, encoding="utf-8") as f:
+            report_html = f.read()
+    return parse_match_page(html, report_html)
+
+
+def snapshot_ids(snapshot_dir):
+    suffix = SNAPSHOT_PAGE.format("")
+    report_suffix = SNAPSHOT_REPORT.format("")
+    return sorted(f[:-len(suffix)] for f in os.listdir(snapshot_dir)
+                  if f.endswith(suffix) and not f.endswith(report_suffix))
+
+
+def main():
+    from utils.match_store import MatchStore, DEFAULT_STORE_PATH
+
+    parser = argparse.ArgumentParser(description="Re-extract matches from saved HTML snapshots")
+    parser.add_argument("snapshots", help="directory of <match_id>.html / <match_id>.report.html")
+    parser.add_argument("--store", default=DEFAULT_STORE_PATH,
+                        help="match store to update (matches keep their position)")
+    parser.add_argument("--output", default="premier_league_results.json",
+                        help="results file exported afterwards")
+    args = parser.parse_args()
+
+    failed = 0
+    with MatchStore(args.store) as store:
+        store.seed(args.output)
+        for match_id in snapshot_ids(args.snapshots):
+            try:
+                store.append_scraped(match_id, parse_snapshot(args.snapshots, match_id))
+            except (LookupError, IndexError, OSError) as e:
+                failed += 1
+                print(f" Error parsing {match_id}: {e}")
+        store.export(args.output)
+    print(f"Re-extracted {len(store)} matches ({failed} failed)")
+
+
+if __name__ == "__main__":
+    main()
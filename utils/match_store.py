@@ -0,0 +1,293 @@
+# CSCI4152/6509 Fall 2025
+# Program: Append-only Match Store
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Append-only JSONL log of scraped matches with batched fsync and
+# a sidecar index from match ID to byte offset. Scraping appends one line per
+# match instead of rewriting the whole results file; export writes the usual
+# premier_league_results.json layout for the rest of the pipeline.
+
+import argparse
+import json
+import os
+import re
+from collections import Counter
+
+from utils.file_helpers import iter_json_records
+
+DEFAULT_STORE_PATH = "premier_league_results.jsonl"
+DEFAULT_SYNC_EVERY = 10
+
+# IDs given by match_key to matches imported from a results file
+IMPORTED_ID = re.compile(r"^(.+ vs .+?)(?: #\d+)?$")
+
+
+class MatchStore:
+    """
+    Log lines are {"id": match_id, "match": {...}}; re-appending an ID
+    supersedes the earlier line, and a line with "replaces" also drops
+    that other ID (an imported match of the same date scraped again under
+    its URL ID).
+    The sidecar index (path + ".idx") holds "offset<TAB>match_id[<TAB>
+    replaced_id]" lines and is rebuilt from the log when it is missing or
+    out of step with it. A line cut off by a crash is dropped on open.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, sync_every=DEFAULT_SYNC_EVERY):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.sync_every = max(1, sync_every)
+        self.offsets = {}
+        self._imported = None
+        self._unsynced = 0
+        self._log = None
+        self._index = None
+        self._open()
+
+    def _open(self):
+        size = self._recover_log()
+        if not self._read_index(size):
+            self._rebuild_index()
+        self._log = open(self.path, "a+b")
+        self._index = open(self.index_path, "a", encoding="utf-8")
+
+    def _recover_log(self):
+        """Truncates a torn last line; returns the size of the valid log."""
+        if not os.path.exists(self.path):
+            open(self.path, "wb").close()
+            return 0
+        good = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                good += len(line)
+        if good != os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(good)
+        return good
+
+    def _read_index(self, size):
+        """
+        Loads the sidecar index; returns False when it is missing, torn or
+        does not cover exactly the valid log.
+        """
+        if not os.path.exists(self.index_path):
+            return size == 0
+        last = None
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    return False
+                offset, match_id, *replaced = line.rstrip("\n").split("\t")
+                last = int(offset)
+                if last >= size:
+                    return False
+                self.offsets[match_id] = last
+                for old_id in replaced:
+                    self.offsets.pop(old_id, None)
+        if last is None:
+            return size == 0
+        with open(self.path, "rb") as log:
+            log.seek(last)
+            return last + len(log.readline()) == size
+
+    def _rebuild_index(self):
+        self.offsets = {}
+        offset = 0
+        with open(self.path, "rb") as log, open(self.index_path, "w", encoding="utf-8") as f:
+            for line in log:
+                entry = json.loads(line)
+                match_id, old_id = entry["id"], entry.get("replaces")
+                self.offsets[match_id] = offset
+                if old_id is None:
+                    f.write(f"{offset}\t{match_id}\n")
+                else:
+                    self.offsets.pop(old_id, None)
+                    f.write(f"{offset}\t{match_id}\t{old_id}\n")
+                offset += len(line)
+
+    def __contains__(self, match_id):
+        return match_id in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def get(self, match_id):
+        """Latest stored match for an ID, or None."""
+        offset = self.offsets.get(match_id)
+        if offset is None:
+            return None
+        self._log.seek(offset)
+        return json.loads(self._log.readline())["match"]
+
+    def append(self, match_id, match, replaces=None):
+        entry = {"id": match_id, "match": match}
+        if replaces is not None:
+            entry["replaces"] = replaces
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        self._log.seek(0, os.SEEK_END)
+        offset = self._log.tell()
+        self._log.write(line.encode("utf-8"))
+        self._log.flush()
+        self._index.write(f"{offset}\t{match_id}\n" if replaces is None
+                          else f"{offset}\t{match_id}\t{replaces}\n")
+        self._index.flush()
+        self.offsets[match_id] = offset
+        if replaces is not None:
+            self.offsets.pop(replaces, None)
+
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def append_scraped(self, match_id, match):
+        """
+        Appends a match scraped under its URL ID. An imported match is
+        replaced only when it is certainly the same one: the same fixture
+        on the same date. Fixtures repeat every season and the results
+        file has no dates, so without one the match is appended.
+        """
+        replaces = None
+        if match_id not in self.offsets and match.get("date"):
+            replaces = self._take_imported(match_key(match), match["date"])
+        self.append(match_id, match, replaces)
+
+    def _take_imported(self, fixture, date):
+        if self._imported is None:
+            self._imported = {}
+            for match_id in self.offsets:
+                m = IMPORTED_ID.match(match_id)
+                if m:
+                    self._imported.setdefault(m.group(1), []).append(match_id)
+        ids = self._imported.get(fixture, [])
+        for i, match_id in enumerate(ids):
+            if self.get(match_id).get("date") == date:
+                return ids.pop(i)
+        return None
+
+    def seed(self, filename):
+        """
+        Imports a results file into an empty store (IDs from match_key), so
+        a new store starts from the matches already scraped instead of
+        replacing them on export. Returns the number of matches imported.
+        """
+        if self.offsets or not os.path.exists(filename):
+            return 0
+        seen = Counter()
+        for match in iter_json_records(filename):
+            key = match_key(match)
+            seen[key] += 1
+            self.append(match_key(match, seen[key]), match)
+        self.sync()
+        if self.offsets:
+            print(f"📥 Seeded {self.path} with {len(self)} matches from {filename}")
+        return len(self)
+
+    def sync(self):
+        """fsyncs the log and index; called every sync_every appends."""
+        os.fsync(self._log.fileno())
+        os.fsync(self._index.fileno())
+        self._unsynced = 0
+
+    def __iter__(self):
+        """Latest version of every match, in order of first scrape."""
+        for match_id in self.offsets:
+            yield self.get(match_id)
+
+    def export(self, filename, force=False):
+        """
+        Writes every match to filename: a JSON array in the usual
+        premier_league_results.json layout, or JSONL for a .jsonl name.
+        Refuses (returns False) to replace a file holding more matches
+        than the store, unless force is set.
+        """
+        if not force and os.path.exists(filename):
+            existing = sum(1 for _ in iter_json_records(filename))
+            if existing > len(self):
+                print(f"⚠️ Not exporting: {filename} has {existing} matches, "
+                      f"{self.path} only {len(self)}")
+                return False
+        tmp_path = filename + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            if filename.endswith(".jsonl"):
+                for match in self:
+                    f.write(json.dumps(match, ensure_ascii=False) + "\n")
+            else:
+                json.dump(list(self), f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, filename)
+        print(f"💾 Exported {len(self)} matches to {filename}")
+        return True
+
+    def compact(self):
+        """Rewrites the log and index without superseded lines."""
+        tmp_path = self.path + ".tmp"
+        offsets = {}
+        with open(tmp_path, "wb") as out:
+            for match_id, offset in self.offsets.items():
+                self._log.seek(offset)
+                offsets[match_id] = out.tell()
+                out.write(self._log.readline())
+            out.flush()
+            os.fsync(out.fileno())
+        with open(self.index_path + ".tmp", "w", encoding="utf-8") as f:
+            for match_id, offset in offsets.items():
+                f.write(f"{offset}\t{match_id}\n")
+
+        self.close()
+        os.replace(tmp_path, self.path)
+        os.replace(self.index_path + ".tmp", self.index_path)
+        self.offsets = offsets
+        self._imported = None
+        self._log = open(self.path, "a+b")
+        self._index = open(self.index_path, "a", encoding="utf-8")
+
+    def close(self):
+        if self._log is not None:
+            self.sync()
+            self._log.close()
+            self._index.close()
+            self._log = self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def match_key(match, occurrence=1):
+    """
+    Fallback match ID when the match URL is not known. A results file can
+    hold the same fixture more than once (several seasons), so repeats are
+    numbered in file order.
+    """
+    key = f"{match['home_team']} vs {match['away_team']}"
+    return key if occurrence == 1 else f"{key} #{occurrence}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Append-only match store maintenance")
+    parser.add_argument("command", choices=["export", "compact", "import", "stats"])
+    parser.add_argument("--store", default=DEFAULT_STORE_PATH, help="match store JSONL log")
+    parser.add_argument("--file", default="premier_league_results.json",
+                        help="export target, or JSON results file to import")
+    parser.add_argument("--force", action="store_true",
+                        help="export even if --file holds more matches than the store")
+    args = parser.parse_args()
+
+    with MatchStore(args.store) as store:
+        if args.command == "export":
+            store.export(args.file, args.force)
+        elif args.command == "compact":
+            store.compact()
+        elif args.command == "import":
+            seen = Counter()
+            for match in iter_json_records(args.file):
+                key = match_key(match)
+                seen[key] += 1
+                store.append(match_key(match, seen[key]), match)
+        print(f"{args.store}: {len(store)} matches")
+
+
+if __name__ == "__main__":
+    main()
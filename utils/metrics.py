@@ -0,0 +1,197 @@
+# CSCI4152/6509 Fall 2025
+# Program: Pipeline Metrics
+# Author: Terry Quach, B00919525, hn886911@dal.ca
+# Description: Opt-in instrumentation of the processing loop: per-stage wall
+# and CPU timers, counters (sentences, BART calls, generated tokens, ...),
+# optional tracemalloc peak memory per stage and cProfile capture of a slice
+# of matches. Records go to a JSONL file, one line per match, and are
+# summarized as percentiles at the end of a run. When disabled every hook is
+# a single attribute check.
+
+import cProfile
+import io
+import json
+import math
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+DEFAULT_PROFILE_PATH = "pipeline.prof"
+
+_NULL = nullcontext()
+
+
+class Metrics:
+    """
+    Process-wide collector. record(kind, name) opens a record (a match, or a
+    window of batched summarizer calls); stage(name) and count(name) add to
+    the open record, which is written as one JSONL line when it closes.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.memory = False
+        self.profile_slice = None
+        self.profile_path = None
+        self._file = None
+        self._current = None
+        self._matches = 0
+        self._profiler = None
+
+    def configure(self, path, memory=False, profile_slice=None, profile_path=DEFAULT_PROFILE_PATH,
+                  truncate=True):
+        """
+        Enables metrics written to path (JSONL). memory adds tracemalloc
+        peaks per stage; profile_slice (start, stop) captures those matches
+        (0-based, in processing order) with cProfile into profile_path.
+        truncate=False appends, as pool workers do.
+        """
+        self.close()
+        self.enabled = path is not None
+        self.path = path
+        self.memory = memory
+        self.profile_slice = profile_slice
+        self.profile_path = profile_path
+        self._matches = 0
+        if not self.enabled:
+            return
+        self._file = open(path, "w" if truncate else "a", encoding="utf-8")
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def worker_settings(self):
+        """(path, memory) for pool workers, which append to the same file; None when disabled."""
+        return (self.path, self.memory) if self.enabled else None
+
+    def record(self, kind, name):
+        if not self.enabled:
+            return _NULL
+        return self._record(kind, name)
+
+    @contextmanager
+    def _record(self, kind, name):
+        outer = self._current
+        self._current = {"kind": kind, "name": name, "pid": os.getpid(), "stages": {}, "counters": {}}
+        profiling = kind == "match" and self._in_profile_slice()
+        if profiling:
+            self._profiler = self._profiler or cProfile.Profile()
+            self._profiler.enable()
+        try:
+            yield self._current
+        finally:
+            if profiling:
+                self._profiler.disable()
+            if kind == "match":
+                self._matches += 1
+            self._file.write(json.dumps(self._current, ensure_ascii=False) + "\n")
+            self._file.flush()
+            self._current = outer
+
+    def _in_profile_slice(self):
+        if not self.profile_slice:
+            return False
+        start, stop = self.profile_slice
+        return start <= self._matches < stop
+
+    def stage(self, name):
+        if not self.enabled or self._current is None:
+            return _NULL
+        return self._stage(name)
+
+    @contextmanager
+    def _stage(self, name):
+        stages = self._current["stages"]
+        if self.memory:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            timing = stages.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+            timing["wall"] += time.perf_counter() - wall
+            timing["cpu"] += time.process_time() - cpu
+            if self.memory:
+                peak_kb = (tracemalloc.get_traced_memory()[1] - base) / 1024
+                timing["peak_kb"] = max(timing.get("peak_kb", 0.0), round(peak_kb, 1))
+
+    def count(self, name, n=1):
+        if self.enabled and self._current is not None:
+            counters = self._current["counters"]
+            counters[name] = counters.get(name, 0) + n
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._profiler is not None:
+            self._profiler.dump_stats(self.profile_path)
+            print(f"Profile of matches {self.profile_slice[0]}-{self.profile_slice[1] - 1} "
+                  f"saved to {self.profile_path}")
+            out = io.StringIO()
+            pstats.Stats(self._profiler, stream=out).sort_stats("cumulative").print_stats(15)
+            print(out.getvalue())
+            self._profiler = None
+        self.enabled = False
+
+
+metrics = Metrics()
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(path):
+    """
+    Per-stage wall/CPU percentiles (ms) and counter totals over a metrics
+    JSONL file: {"records", "stages": {name: {...}}, "counters": {name: total}}.
+    """
+    walls, cpus, peaks, counters = {}, {}, {}, {}
+    records = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            record = json.loads(line)
+            records += 1
+            for name, timing in record["stages"].items():
+                walls.setdefault(name, []).append(timing["wall"] * 1000)
+                cpus.setdefault(name, []).append(timing["cpu"] * 1000)
+                if "peak_kb" in timing:
+                    peaks[name] = max(peaks.get(name, 0.0), timing["peak_kb"])
+            for name, n in record["counters"].items():
+                counters[name] = counters.get(name, 0) + n
+
+    stages = {}
+    for name, values in walls.items():
+        values.sort()
+        stages[name] = {
+            "count": len(values),
+            "total_s": round(sum(values) / 1000, 3),
+            "p50_ms": round(percentile(values, 50), 3),
+            "p95_ms": round(percentile(values, 95), 3),
+            "p99_ms": round(percentile(values, 99), 3),
+            "cpu_mean_ms": round(sum(cpus[name]) / len(cpus[name]), 3),
+        }
+        if name in peaks:
+            stages[name]["peak_kb"] = peaks[name]
+    return {"records": records, "stages": stages, "counters": counters}
+
+
+def print_summary(summary):
+    print(f"\n{'stage':16} {'count':>6} {'total s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'cpu ms':>9} {'peak KB':>9}")
+    for name, s in sorted(summary["stages"].items(), key=lambda kv: -kv[1]["total_s"]):
+        peak = f"{s['peak_kb']:9.1f}" if "peak_kb" in s else f"{'-':>9}"
+        print(f"{name:16} {s['count']:6d} {s['total_s']:9.2f} {s['p50_ms']:9.1f} {s['p95_ms']:9.1f} "
+              f"{s['p99_ms']:9.1f} {s['cpu_mean_ms']:9.1f} {peak}")
+    for name, total in sorted(summary["counters"].items()):
+        print(f" {name}: {total}")
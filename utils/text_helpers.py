@@ -29,3 +29,13 @@ def clean_whitespace(text):
     if not text:
         return ""
     return " ".join(text.split())
+
+
+def clean_player_name(val):
+    """
+    Strip the extra minutes the scraper glues onto scorer names,
+    e.g. "Gómez  , 70'" -> "Gómez". Returns "" when no name is left.
+    """
+    if not val:
+        return ""
+    return " ".join(val.split(",")[0].split())